@@ -0,0 +1,32 @@
+"""
+Vendor Asset Fetcher
+====================
+Downloads the pinned Chart.js build into src/dashboard/static/vendor so the
+dashboard serves it locally (long-cached, works offline) instead of from the CDN.
+"""
+
+import sys
+from pathlib import Path
+
+import requests
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.dashboard.assets import CHART_JS_CDN_URL, CHART_JS_FILENAME, VENDOR_DIR
+
+def main():
+    """Download the pinned Chart.js bundle if it is not already vendored"""
+    target = VENDOR_DIR / CHART_JS_FILENAME
+    if target.exists():
+        print(f"Already vendored: {target}")
+        return
+
+    VENDOR_DIR.mkdir(parents=True, exist_ok=True)
+    response = requests.get(CHART_JS_CDN_URL, timeout=30)
+    response.raise_for_status()
+    target.write_bytes(response.content)
+    print(f"Vendored {CHART_JS_CDN_URL} -> {target}")
+
+if __name__ == '__main__':
+    main()
@@ -7,12 +7,34 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 import threading
 
 class OrchestrationDB:
     """Database manager for orchestration analytics"""
 
+    # Rows pulled per fetchmany() call when streaming large result sets
+    FETCH_CHUNK_SIZE = 250
+
+    # Compiled statements kept per connection by sqlite3's statement cache
+    STATEMENT_CACHE_SIZE = 256
+
+    # Column order of the rows produced by iter_recent_activity_keyed()
+    ACTIVITY_COLUMNS = ('timestamp', 'event_type', 'session_id', 'description',
+                        'cost', 'model_or_agent', 'status', 'project_name')
+    # Column order of the trimmed rows produced by iter_activity_list_keyed()
+    ACTIVITY_LIST_COLUMNS = ('timestamp', 'event_type', 'session_short', 'description_short',
+                             'description_truncated', 'cost', 'model_or_agent', 'status', 'project_name')
+    # Every value of the low-cardinality activity columns, so they can be sent
+    # as indexes into these tuples instead of repeating the strings per row
+    ACTIVITY_ENUMS = {
+        'event_type': ('session', 'handoff', 'subagent'),
+        'status': ('success', 'failed'),
+    }
+    # Characters of the session id and description shown in the activity list
+    SESSION_SHORT_LENGTH = 8
+    DESCRIPTION_SHORT_LENGTH = 50
+
     def __init__(self, db_path: str = "data/orchestration.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -33,11 +55,19 @@ class OrchestrationDB:
             self._local.conn = sqlite3.connect(
                 str(self.db_path),
                 timeout=30.0,
-                check_same_thread=False
+                check_same_thread=False,
+                # Room for every inline query's compiled statement, so repeated
+                # dashboard queries skip re-parsing the SQL
+                cached_statements=self.STATEMENT_CACHE_SIZE
             )
             self._local.conn.row_factory = sqlite3.Row
             self._local.conn.execute("PRAGMA journal_mode=WAL")
             self._local.conn.execute("PRAGMA synchronous=NORMAL")
+            # Memory-map the database file so reads avoid extra buffer copies
+            self._local.conn.execute("PRAGMA mmap_size=268435456")
+            # 64 MiB page cache per connection, temp B-trees (GROUP BY, ORDER BY) in memory
+            self._local.conn.execute("PRAGMA cache_size=-65536")
+            self._local.conn.execute("PRAGMA temp_store=MEMORY")
         return self._local.conn
 
     def init_database(self):
@@ -202,6 +232,7 @@ class OrchestrationDB:
             self.conn.execute("CREATE INDEX IF NOT EXISTS idx_handoffs_session ON handoff_events(session_id)")
             self.conn.execute("CREATE INDEX IF NOT EXISTS idx_handoffs_time ON handoff_events(timestamp)")
             self.conn.execute("CREATE INDEX IF NOT EXISTS idx_handoffs_target_model ON handoff_events(target_model, timestamp DESC)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_handoffs_time_model ON handoff_events(timestamp, target_model)")
 
             # Subagent invocations indexes (for usage analytics)
             self.conn.execute("CREATE INDEX IF NOT EXISTS idx_subagents_timestamp_desc ON subagent_invocations(timestamp DESC)")
@@ -591,6 +622,86 @@ class OrchestrationDB:
         cursor = self.conn.execute(query, params)
         return dict(cursor.fetchone())
 
+    def get_cost_analytics(self, days: int = 30) -> Dict:
+        """Get cost and savings totals with a per-day breakdown for the last N days"""
+        cursor = self.conn.execute("""
+            SELECT
+                DATE(timestamp) as date,
+                COALESCE(SUM(cost), 0) as cost,
+                COALESCE(SUM(savings), 0) as savings,
+                COUNT(*) as handoffs,
+                SUM(CASE WHEN target_model = 'deepseek' THEN 1 ELSE 0 END) as deepseek_handoffs
+            FROM handoff_events
+            WHERE timestamp >= datetime('now', ?)
+            GROUP BY DATE(timestamp)
+            ORDER BY date
+        """, (f'-{int(days)} days',))
+
+        daily_data = []
+        total_cost = total_savings = 0.0
+        total_handoffs = deepseek_handoffs = 0
+        for row in cursor.fetchall():
+            daily_data.append({
+                'date': row['date'],
+                'cost': round(row['cost'], 4),
+                'savings': round(row['savings'], 4)
+            })
+            total_cost += row['cost']
+            total_savings += row['savings']
+            total_handoffs += row['handoffs']
+            deepseek_handoffs += row['deepseek_handoffs'] or 0
+
+        return {
+            'monthly_cost': round(total_cost, 4),
+            'monthly_savings': round(total_savings, 4),
+            'optimization_rate': round(deepseek_handoffs * 100.0 / total_handoffs, 1) if total_handoffs else 0.0,
+            'daily_data': daily_data
+        }
+
+    def get_change_token(self) -> tuple:
+        """Cheap signature that changes whenever sessions, handoffs or subagents are added
+
+        Each MAX(id) is a single rowid lookup, so this can be polled frequently
+        to decide whether the heavier dashboard queries need to run at all.
+        The local date is included so "today" counters roll over at midnight.
+        """
+        row = self.conn.execute("""
+            SELECT
+                (SELECT MAX(id) FROM orchestration_sessions),
+                (SELECT MAX(id) FROM handoff_events),
+                (SELECT MAX(id) FROM subagent_invocations),
+                DATE('now', 'localtime')
+        """).fetchone()
+        return tuple(row)
+
+    def get_today_activity_counts(self) -> Dict:
+        """Get today's session, handoff, subagent and DeepSeek handoff counts in one query
+
+        Uses timestamp ranges rather than DATE(column) so each count is an
+        index range scan instead of a full table scan.
+        """
+        cursor = self.conn.execute("""
+            WITH today AS (
+                SELECT DATE('now', 'localtime') as start_day,
+                       DATE('now', 'localtime', '+1 day') as end_day
+            )
+            SELECT
+                (SELECT COUNT(*) FROM orchestration_sessions, today
+                 WHERE start_time >= start_day AND start_time < end_day) as sessions,
+                h.handoffs,
+                h.deepseek_handoffs,
+                (SELECT COUNT(*) FROM subagent_invocations, today
+                 WHERE timestamp >= start_day AND timestamp < end_day) as subagents
+            FROM (
+                SELECT
+                    COUNT(*) as handoffs,
+                    COALESCE(SUM(CASE WHEN target_model = 'deepseek' THEN 1 ELSE 0 END), 0) as deepseek_handoffs
+                FROM handoff_events, today
+                WHERE timestamp >= start_day AND timestamp < end_day
+            ) h
+        """)
+        return dict(cursor.fetchone())
+
     def get_subagent_usage(self, limit: int = 20) -> List[Dict]:
         """Get subagent usage statistics"""
         cursor = self.conn.execute("""
@@ -771,79 +882,155 @@ class OrchestrationDB:
         else:
             return "MAINTAIN: Stay on Max account until DeepSeek effectiveness improves"
 
-    def get_recent_activity(self, limit: int = 50, offset: int = 0) -> Dict:
+    def get_recent_activity(self, limit: int = 50, offset: int = 0, cursor: str = None) -> Dict:
         """Get recent orchestration activity with pagination
 
         Args:
             limit: Number of records to return (default 50)
-            offset: Number of records to skip (default 0)
+            offset: Number of records to skip (default 0); with a cursor it is
+                only used to report the page position
+            cursor: Keyset cursor from a previous page's next_cursor; rows
+                strictly older than it are returned without an OFFSET scan
 
         Returns:
             Dict with activities list, total_count, and pagination info
         """
-        # Get total count for pagination
-        total_count_cursor = self.conn.execute("""
-            SELECT COUNT(*) as total FROM (
-                SELECT start_time as timestamp, 'session' as event_type, session_id, project_name as description,
-                       0 as cost, 'claude' as model_or_agent, 'success' as status, project_name
-                FROM orchestration_sessions
-                UNION ALL
-                SELECT h.timestamp, 'handoff' as event_type, h.session_id,
-                       h.task_description as description, h.cost, h.target_model as model_or_agent,
-                       CASE WHEN h.success = 1 THEN 'success' ELSE 'failed' END as status,
-                       COALESCE(s.project_name, 'Unknown') as project_name
-                FROM handoff_events h
-                LEFT JOIN orchestration_sessions s ON h.session_id = s.session_id
-                UNION ALL
-                SELECT sub.timestamp, 'subagent' as event_type, sub.session_id,
-                       sub.task_description as description, sub.cost, sub.agent_name as model_or_agent,
-                       CASE WHEN sub.success = 1 THEN 'success' ELSE 'failed' END as status,
-                       COALESCE(s.project_name, 'Unknown') as project_name
-                FROM subagent_invocations sub
-                LEFT JOIN orchestration_sessions s ON sub.session_id = s.session_id
-            )
-        """)
-        total_count = total_count_cursor.fetchone()[0]
+        activities = []
+        last_cursor = None
+        for last_cursor, row in self.iter_recent_activity_keyed(limit=limit, offset=offset, cursor=cursor):
+            activities.append(dict(zip(self.ACTIVITY_COLUMNS, row)))
 
-        # Get paginated activities
-        cursor = self.conn.execute("""
-            SELECT timestamp, event_type, session_id, description, cost, model_or_agent, status, project_name
-            FROM (
-                SELECT start_time as timestamp, 'session' as event_type, session_id,
-                       project_name as description, 0 as cost, 'claude' as model_or_agent,
-                       'success' as status, project_name
-                FROM orchestration_sessions
-                UNION ALL
-                SELECT h.timestamp, 'handoff' as event_type, h.session_id,
-                       h.task_description as description, h.cost, h.target_model as model_or_agent,
-                       CASE WHEN h.success = 1 THEN 'success' ELSE 'failed' END as status,
-                       COALESCE(s.project_name, 'Unknown') as project_name
-                FROM handoff_events h
-                LEFT JOIN orchestration_sessions s ON h.session_id = s.session_id
-                UNION ALL
-                SELECT sub.timestamp, 'subagent' as event_type, sub.session_id,
-                       sub.task_description as description, sub.cost, sub.agent_name as model_or_agent,
-                       CASE WHEN sub.success = 1 THEN 'success' ELSE 'failed' END as status,
-                       COALESCE(s.project_name, 'Unknown') as project_name
-                FROM subagent_invocations sub
-                LEFT JOIN orchestration_sessions s ON sub.session_id = s.session_id
-            )
-            ORDER BY timestamp DESC
+        return {
+            'activities': activities,
+            'pagination': self.get_recent_activity_pagination(limit=limit, offset=offset, last_cursor=last_cursor)
+        }
+
+    def iter_recent_activity_keyed(self, limit: int = 50, offset: int = 0,
+                                   cursor: str = None) -> Iterator[Tuple[str, tuple]]:
+        """Yield (cursor, row) pairs for recent activity, newest first
+
+        Activity is ordered by (timestamp, source table, row id), so each row's
+        cursor pins its exact position. Each source table is read newest-first
+        through its timestamp index and capped before the merge, so a page
+        costs O(limit) with a cursor and O(limit + offset) without one.
+        """
+        if cursor:
+            before = self._parse_activity_cursor(cursor)
+            branch_limit = limit
+            offset = 0
+        else:
+            before = None
+            branch_limit = limit + offset
+
+        params = []
+        branches = []
+        for kind, (table, time_column, select) in enumerate(self._ACTIVITY_SOURCES):
+            where = ""
+            if before:
+                # The plain range test lets SQLite seek the timestamp index;
+                # the row-value test breaks ties exactly at the cursor
+                where = f"WHERE {time_column} <= ? AND ({time_column}, {kind}, {table}.id) < (?, ?, ?)"
+                params.extend([before[0], *before])
+            branches.append(f"""
+                SELECT * FROM (
+                    SELECT {time_column} as timestamp, {kind} as kind, {table}.id as row_id, {select}
+                    {where}
+                    ORDER BY {time_column} DESC, {table}.id DESC
+                    LIMIT ?
+                )""")
+            params.append(branch_limit)
+
+        query_cursor = self.conn.cursor()
+        query_cursor.row_factory = None
+        query_cursor.execute(f"""
+            SELECT timestamp, kind, row_id, event_type, session_id, description, cost, model_or_agent, status, project_name
+            FROM ({' UNION ALL '.join(branches)})
+            ORDER BY timestamp DESC, kind DESC, row_id DESC
             LIMIT ? OFFSET ?
-        """, (limit, offset))
+        """, (*params, limit, offset))
 
-        activities = []
-        for row in cursor.fetchall():
-            activity = dict(row)
-            # Ensure proper data types
-            activity['cost'] = float(activity['cost']) if activity['cost'] else 0.0
+        for timestamp, kind, row_id, event_type, session_id, description, cost, model, status, project in self._iter_rows(query_cursor):
+            row_cursor = f"{timestamp}~{kind}~{row_id}"
 
             # Fix timezone handling: Add 'Z' suffix to indicate UTC timestamps
             # Database stores UTC timestamps without timezone info, so we need to indicate this to frontend
-            if activity.get('timestamp') and not activity['timestamp'].endswith('Z'):
-                activity['timestamp'] = activity['timestamp'] + 'Z'
+            if timestamp and not timestamp.endswith('Z'):
+                timestamp += 'Z'
 
-            activities.append(activity)
+            # Ensure proper data types
+            yield row_cursor, (timestamp, event_type, session_id, description,
+                               float(cost) if cost else 0.0, model, status, project)
+
+    def iter_activity_list_keyed(self, limit: int = 50, offset: int = 0,
+                                 cursor: str = None) -> Iterator[Tuple[str, tuple]]:
+        """Yield (cursor, row) pairs in ACTIVITY_LIST_COLUMNS order
+
+        The list view only shows a session id prefix and the start of each
+        description, so they are cut here once instead of on every client
+        render, which also keeps long descriptions out of the payload.
+        """
+        session_length = self.SESSION_SHORT_LENGTH
+        description_length = self.DESCRIPTION_SHORT_LENGTH
+        for row_cursor, row in self.iter_recent_activity_keyed(limit=limit, offset=offset, cursor=cursor):
+            timestamp, event_type, session_id, description, cost, model, status, project = row
+            truncated = description is not None and len(description) > description_length
+            yield row_cursor, (timestamp, event_type,
+                               session_id[:session_length] if session_id else session_id,
+                               description[:description_length] if truncated else description,
+                               truncated, cost, model, status, project)
+
+    # Sources merged into the activity feed: (table, timestamp column, remaining
+    # select list and FROM clause). The list position is the tie-break order.
+    _ACTIVITY_SOURCES = (
+        ('orchestration_sessions', 'start_time', """
+                    'session' as event_type, session_id,
+                    project_name as description, 0 as cost, 'claude' as model_or_agent,
+                    'success' as status, project_name
+                    FROM orchestration_sessions"""),
+        ('h', 'h.timestamp', """
+                    'handoff' as event_type, h.session_id,
+                    h.task_description as description, h.cost, h.target_model as model_or_agent,
+                    CASE WHEN h.success = 1 THEN 'success' ELSE 'failed' END as status,
+                    COALESCE(s.project_name, 'Unknown') as project_name
+                    FROM handoff_events h
+                    LEFT JOIN orchestration_sessions s ON h.session_id = s.session_id"""),
+        ('sub', 'sub.timestamp', """
+                    'subagent' as event_type, sub.session_id,
+                    sub.task_description as description, sub.cost, sub.agent_name as model_or_agent,
+                    CASE WHEN sub.success = 1 THEN 'success' ELSE 'failed' END as status,
+                    COALESCE(s.project_name, 'Unknown') as project_name
+                    FROM subagent_invocations sub
+                    LEFT JOIN orchestration_sessions s ON sub.session_id = s.session_id"""),
+    )
+
+    def _parse_activity_cursor(self, cursor: str) -> tuple:
+        """Split an activity cursor into (timestamp, kind, row_id)"""
+        timestamp, kind, row_id = cursor.rsplit('~', 2)
+        return timestamp, int(kind), int(row_id)
+
+    def _iter_rows(self, cursor: sqlite3.Cursor) -> Iterator[sqlite3.Row]:
+        """Iterate a cursor in fetchmany() chunks instead of stepping one row per call"""
+        while True:
+            rows = cursor.fetchmany(self.FETCH_CHUNK_SIZE)
+            if not rows:
+                break
+            yield from rows
+
+    def get_recent_activity_pagination(self, limit: int = 50, offset: int = 0, last_cursor: str = None) -> Dict:
+        """Get pagination info for the recent activity feed
+
+        last_cursor is the cursor of the page's final row; it is returned as
+        next_cursor so the client can fetch the following page by keyset.
+        """
+        # Get total count for pagination. session_id is unique, so the LEFT JOINs
+        # in the feed never change its row count and each table is counted directly.
+        total_count_cursor = self.conn.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM orchestration_sessions) +
+                (SELECT COUNT(*) FROM handoff_events) +
+                (SELECT COUNT(*) FROM subagent_invocations)
+        """)
+        total_count = total_count_cursor.fetchone()[0]
 
         # Calculate pagination info
         total_pages = (total_count + limit - 1) // limit  # Ceiling division
@@ -852,17 +1039,15 @@ class OrchestrationDB:
         has_previous = offset > 0
 
         return {
-            'activities': activities,
-            'pagination': {
-                'total_count': total_count,
-                'total_pages': total_pages,
-                'current_page': current_page,
-                'page_size': limit,
-                'has_next': has_next,
-                'has_previous': has_previous,
-                'next_offset': offset + limit if has_next else None,
-                'previous_offset': max(0, offset - limit) if has_previous else None
-            }
+            'total_count': total_count,
+            'total_pages': total_pages,
+            'current_page': current_page,
+            'page_size': limit,
+            'has_next': has_next,
+            'has_previous': has_previous,
+            'next_offset': offset + limit if has_next else None,
+            'previous_offset': max(0, offset - limit) if has_previous else None,
+            'next_cursor': last_cursor if has_next else None
         }
 
     def get_project_grouped_activity(self, limit: int = 10, offset: int = 0) -> Dict:
@@ -891,61 +1076,43 @@ class OrchestrationDB:
             LIMIT ? OFFSET ?
         """, (limit, offset))
 
+        project_rows = [dict(row) for row in projects_cursor.fetchall()]
+        project_names = [row['project_name'] for row in project_rows]
+
+        # Recent handoffs and subagent invocations for every project on the page,
+        # fetched with one windowed query each instead of two queries per project
+        handoffs_by_project, handoff_cost_by_project = self._recent_by_project("""
+            SELECT
+                s.project_name,
+                h.timestamp, h.session_id, h.task_description, h.target_model,
+                h.cost, h.confidence_score,
+                CASE WHEN h.success = 1 THEN 'success' ELSE 'failed' END as status,
+                ROW_NUMBER() OVER (PARTITION BY s.project_name ORDER BY h.timestamp DESC) as recency
+            FROM handoff_events h
+            JOIN orchestration_sessions s ON h.session_id = s.session_id
+            WHERE s.project_name IN (SELECT value FROM json_each(?))
+        """, project_names)
+
+        subagents_by_project, subagent_cost_by_project = self._recent_by_project("""
+            SELECT
+                s.project_name,
+                sa.timestamp, sa.session_id, sa.agent_name, sa.task_description,
+                sa.cost, sa.execution_time,
+                CASE WHEN sa.success = 1 THEN 'success' ELSE 'failed' END as status,
+                ROW_NUMBER() OVER (PARTITION BY s.project_name ORDER BY sa.timestamp DESC) as recency
+            FROM subagent_invocations sa
+            JOIN orchestration_sessions s ON sa.session_id = s.session_id
+            WHERE s.project_name IN (SELECT value FROM json_each(?))
+        """, project_names)
+
         projects = []
-        for project_row in projects_cursor.fetchall():
-            project_data = dict(project_row)
+        for project_data in project_rows:
             project_name = project_data['project_name']
-
-            # Get recent handoffs for this project
-            handoffs_cursor = self.conn.execute("""
-                SELECT
-                    h.timestamp, h.session_id, h.task_description, h.target_model,
-                    h.cost, h.confidence_score,
-                    CASE WHEN h.success = 1 THEN 'success' ELSE 'failed' END as status
-                FROM handoff_events h
-                JOIN orchestration_sessions s ON h.session_id = s.session_id
-                WHERE s.project_name = ?
-                ORDER BY h.timestamp DESC
-                LIMIT 20
-            """, (project_name,))
-
-            handoffs = [dict(row) for row in handoffs_cursor.fetchall()]
-
-            # Fix timezone handling for handoffs: Add 'Z' suffix to indicate UTC timestamps
-            for handoff in handoffs:
-                if handoff.get('timestamp') and not handoff['timestamp'].endswith('Z'):
-                    handoff['timestamp'] = handoff['timestamp'] + 'Z'
-
-            # Get recent subagent invocations for this project
-            subagents_cursor = self.conn.execute("""
-                SELECT
-                    sa.timestamp, sa.session_id, sa.agent_name, sa.task_description,
-                    sa.cost, sa.execution_time,
-                    CASE WHEN sa.success = 1 THEN 'success' ELSE 'failed' END as status
-                FROM subagent_invocations sa
-                JOIN orchestration_sessions s ON sa.session_id = s.session_id
-                WHERE s.project_name = ?
-                ORDER BY sa.timestamp DESC
-                LIMIT 20
-            """, (project_name,))
-
-            subagents = [dict(row) for row in subagents_cursor.fetchall()]
-
-            # Fix timezone handling for subagents: Add 'Z' suffix to indicate UTC timestamps
-            for subagent in subagents:
-                if subagent.get('timestamp') and not subagent['timestamp'].endswith('Z'):
-                    subagent['timestamp'] = subagent['timestamp'] + 'Z'
+            handoffs = handoffs_by_project.get(project_name, [])
+            subagents = subagents_by_project.get(project_name, [])
 
             # Calculate project-level statistics
-            total_cost = 0.0
-            for handoff in handoffs:
-                cost = handoff.get('cost', 0)
-                if cost is not None:
-                    total_cost += float(cost)
-            for subagent in subagents:
-                cost = subagent.get('cost', 0)
-                if cost is not None:
-                    total_cost += float(cost)
+            total_cost = handoff_cost_by_project.get(project_name, 0.0) + subagent_cost_by_project.get(project_name, 0.0)
 
             success_rate = 0.0
             total_tasks = project_data['total_completed_tasks'] + project_data['total_failed_tasks']
@@ -989,6 +1156,42 @@ class OrchestrationDB:
             }
         }
 
+    def _recent_by_project(self, query: str, project_names: List[str],
+                           per_project: int = 20) -> Tuple[Dict[str, List[Dict]], Dict[str, float]]:
+        """Run a project-partitioned query and group its newest rows by project
+
+        query must select project_name, cost and a ROW_NUMBER() column named recency,
+        and take the project names as a single JSON array parameter (json_each(?)).
+        Binding one array instead of one placeholder per name keeps the SQL text
+        identical across pages, so it stays in the connection's statement cache.
+
+        Returns the rows grouped by project, and the total cost of each project's
+        returned rows as summed by SQLite.
+        """
+        grouped = {}
+        cost_by_project = {}
+        if not project_names:
+            return grouped, cost_by_project
+
+        cursor = self.conn.execute(f"""
+            SELECT *, COALESCE(SUM(cost) OVER (PARTITION BY project_name), 0) as project_cost
+            FROM ({query})
+            WHERE recency <= ?
+            ORDER BY recency
+        """, (json.dumps(project_names), per_project))
+
+        for row in cursor.fetchall():
+            item = dict(row)
+            project_name = item.pop('project_name')
+            item.pop('recency')
+            cost_by_project[project_name] = item.pop('project_cost')
+            # Fix timezone handling: Add 'Z' suffix to indicate UTC timestamps
+            if item.get('timestamp') and not item['timestamp'].endswith('Z'):
+                item['timestamp'] = item['timestamp'] + 'Z'
+            grouped.setdefault(project_name, []).append(item)
+
+        return grouped, cost_by_project
+
     def _upgrade_schema_for_token_attribution(self):
         """Upgrade database schema to support token attribution tracking"""
         try:
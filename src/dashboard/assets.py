@@ -0,0 +1,16 @@
+"""
+Dashboard asset locations
+=========================
+Paths and the pinned Chart.js build, kept free of the app's dependencies so
+scripts/fetch_vendor_assets.py can use them without starting the dashboard.
+"""
+
+from pathlib import Path
+
+# Chart.js is pinned so the vendored copy and the CDN fallback are the same build.
+# Run scripts/fetch_vendor_assets.py to serve it from /static/vendor instead of the CDN.
+CHART_JS_VERSION = "4.4.1"
+CHART_JS_FILENAME = f"chart.umd-{CHART_JS_VERSION}.min.js"
+CHART_JS_CDN_URL = f"https://cdn.jsdelivr.net/npm/chart.js@{CHART_JS_VERSION}/dist/chart.umd.min.js"
+STATIC_DIR = Path(__file__).parent / "static"
+VENDOR_DIR = STATIC_DIR / "vendor"
@@ -4,587 +4,632 @@ AI Orchestration Analytics Dashboard
 Unified dashboard for tracking AI orchestration, handoffs, and subagent usage
 """
 
-from quart import Quart, jsonify, render_template_string, request, Response
+from quart import Quart, jsonify, request, Response
+from quart.json.provider import DefaultJSONProvider
 from quart_cors import cors
-import sqlite3
-import json
+import orjson
 import asyncio
+import concurrent.futures
+import functools
+import gzip
+import hashlib
+import html
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, AsyncGenerator
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, AsyncGenerator, NamedTuple, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Optional: with brotli installed the dashboard page is also served br-encoded
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Optional: with rcssmin/rjsmin installed the dashboard CSS/JS are served minified
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
 from src.core.database import OrchestrationDB
+from src.dashboard.assets import CHART_JS_CDN_URL, CHART_JS_FILENAME, STATIC_DIR, VENDOR_DIR
 from src.tracking.handoff_monitor import HandoffMonitor, DeepSeekClient
 from src.tracking.subagent_tracker import SubagentTracker, SubagentInvocation
 
-app = Quart(__name__)
-app = cors(app, allow_origin="*")
-
-# Security headers for all responses
-@app.after_request
-async def add_security_headers(response):
-    """Add comprehensive security headers to all responses"""
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'SAMEORIGIN'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    response.headers['Content-Security-Policy'] = "default-src 'self'; script-src 'self' 'unsafe-inline' cdn.jsdelivr.net; style-src 'self' 'unsafe-inline' cdn.jsdelivr.net; img-src 'self' data:; connect-src 'self'"
-    response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-    response.headers['Permissions-Policy'] = 'geolocation=(), microphone=(), camera=()'
-    # Remove server identification
-    response.headers.pop('Server', None)
-    return response
-
-# Global instances
-db = OrchestrationDB()
-handoff_monitor = HandoffMonitor(db)
-subagent_tracker = SubagentTracker(db)
-deepseek_client = DeepSeekClient()
-
-@app.route("/")
-async def dashboard():
-    """Main orchestration analytics dashboard"""
-    template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI Orchestration Analytics</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/date-fns@2.29.3/index.min.js"></script>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            color: #333;
-        }
-
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-
-        .header {
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            padding: 30px;
-            border-radius: 20px;
-            margin-bottom: 30px;
-            text-align: center;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        }
-
-        .header h1 {
-            font-size: 2.5em;
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 10px;
-        }
-
-        .status-bar {
-            display: flex;
-            justify-content: space-around;
-            background: rgba(255, 255, 255, 0.9);
-            padding: 20px;
-            border-radius: 15px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        }
-
-        .status-item {
-            text-align: center;
-        }
-
-        .status-value {
-            font-size: 2em;
-            font-weight: bold;
-            display: block;
-        }
-
-        .status-online { color: #22c55e; }
-        .status-offline { color: #ef4444; }
-        .status-warning { color: #f59e0b; }
-
-        /* Enhanced Status Indicators */
-        .status-item {
-            position: relative;
-            padding: 10px 15px;
-            border-radius: 8px;
-            background: rgba(255, 255, 255, 0.05);
-            transition: all 0.3s ease;
-        }
-
-        .status-item:hover {
-            background: rgba(255, 255, 255, 0.1);
-            transform: translateY(-2px);
-        }
-
-        .status-value {
-            position: relative;
-        }
-
-        .status-value:before {
-            content: '';
-            position: absolute;
-            left: -20px;
-            top: 50%;
-            transform: translateY(-50%);
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: currentColor;
-        }
-
-        .status-value.status-online:before {
-            background: #22c55e;
-            box-shadow: 0 0 10px rgba(34, 197, 94, 0.5);
-        }
-
-        .status-value.status-offline:before {
-            background: #ef4444;
-            box-shadow: 0 0 10px rgba(239, 68, 68, 0.5);
-        }
-
-        .status-value.status-warning:before {
-            background: #f59e0b;
-            box-shadow: 0 0 10px rgba(245, 158, 11, 0.5);
-        }
-
-        /* Tooltip Styles */
-        .tooltip {
-            position: absolute;
-            background: rgba(0, 0, 0, 0.95);
-            color: white;
-            padding: 12px 16px;
-            border-radius: 8px;
-            font-size: 13px;
-            line-height: 1.4;
-            max-width: 300px;
-            z-index: 1000;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-            pointer-events: none;
-            opacity: 0;
-            transform: translateY(10px);
-            transition: all 0.2s ease;
-        }
-
-        .tooltip.show {
-            opacity: 1;
-            transform: translateY(0);
-        }
-
-        .tooltip::before {
-            content: '';
-            position: absolute;
-            top: -8px;
-            left: 50%;
-            transform: translateX(-50%);
-            border: 4px solid transparent;
-            border-bottom-color: rgba(0, 0, 0, 0.95);
-        }
-
-        .tooltip-title {
-            font-weight: bold;
-            margin-bottom: 8px;
-            color: #60a5fa;
-        }
-
-        .tooltip-item {
-            margin: 4px 0;
-            display: flex;
-            justify-content: space-between;
-        }
-
-        .tooltip-label {
-            margin-right: 12px;
-        }
-
-        .tooltip-value {
-            font-weight: 500;
-        }
-
-        .tooltip-subtitle {
-            margin-top: 8px;
-            padding-top: 8px;
-            border-top: 1px solid rgba(255, 255, 255, 0.2);
-            font-size: 11px;
-            color: rgba(255, 255, 255, 0.8);
-            font-style: italic;
-            line-height: 1.3;
-        }
-
-        .status-degraded {
-            color: #f59e0b !important;
-        }
-
-        [data-tooltip] {
-            cursor: help;
-            position: relative;
-        }
-
-        .dashboard-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-
-        .card {
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            border-radius: 15px;
-            padding: 25px;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-            border: 1px solid rgba(255, 255, 255, 0.18);
-        }
+def json_bytes(obj: Any) -> bytes:
+    """Serialize with orjson; datetimes are emitted natively as RFC 3339 UTC strings"""
+    return orjson.dumps(obj, default=DefaultJSONProvider.default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
 
-        .card-title {
-            font-size: 1.3em;
-            font-weight: 600;
-            margin-bottom: 20px;
-            color: #4a5568;
-        }
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string with json_bytes()"""
+    return json_bytes(obj).decode()
 
-        .metric {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 12px 0;
-            border-bottom: 1px solid #e2e8f0;
-        }
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that routes jsonify() and request.get_json() through orjson"""
 
-        .metric:last-child { border-bottom: none; }
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return json_dumps(obj)
 
-        .metric-label { color: #718096; }
-        .metric-value {
-            font-weight: 600;
-            font-size: 1.1em;
-        }
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
-        .chart-container {
-            position: relative;
-            height: 300px;
-            margin-top: 20px;
-        }
-
-        .table-container {
-            max-height: 400px;
-            overflow-y: auto;
-        }
-
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 0.9em;
-        }
-
-        th, td {
-            padding: 12px 8px;
-            text-align: left;
-            border-bottom: 1px solid #e2e8f0;
-        }
-
-        th {
-            background-color: #f7fafc;
-            font-weight: 600;
-            color: #4a5568;
-            position: sticky;
-            top: 0;
-        }
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """jsonify() body as the bytes orjson produces, without a str round-trip"""
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        obj = kwargs or (args[0] if len(args) == 1 else list(args) or None)
+        return Response(json_bytes(obj), mimetype='application/json')
 
-        .model-deepseek {
-            color: #22c55e;
-            font-weight: bold;
-        }
-
-        .model-claude {
-            color: #3b82f6;
-            font-weight: bold;
-        }
-
-        .success { color: #22c55e; }
-        .error { color: #ef4444; }
-        .warning { color: #f59e0b; }
-
-        .refresh-controls {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-            align-items: center;
-        }
-
-        .btn {
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 0.9em;
-            font-weight: 500;
-            transition: transform 0.2s;
-        }
-
-        .btn:hover {
-            transform: translateY(-2px);
-        }
-
-        .auto-refresh {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            color: #4a5568;
-        }
-
-        .toggle-switch {
-            position: relative;
-            width: 50px;
-            height: 25px;
-            background-color: #cbd5e0;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: background-color 0.3s;
-        }
-
-        .toggle-switch.active {
-            background-color: #667eea;
-        }
-
-        .toggle-switch::after {
-            content: '';
-            position: absolute;
-            top: 2px;
-            left: 2px;
-            width: 21px;
-            height: 21px;
-            background: white;
-            border-radius: 50%;
-            transition: transform 0.3s;
-        }
-
-        .toggle-switch.active::after {
-            transform: translateX(25px);
-        }
-
-        .project-activity-container {
-            max-height: 400px;
-            overflow-y: auto;
-        }
-
-        .project-card {
-            border: 1px solid #e2e8f0;
-            border-radius: 8px;
-            margin-bottom: 12px;
-            background: #f7fafc;
-        }
-
-        .project-header {
-            padding: 12px 16px;
-            cursor: pointer;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            border-bottom: 1px solid #e2e8f0;
-            background: #ffffff;
-            border-radius: 8px 8px 0 0;
-        }
-
-        .project-header:hover {
-            background: #f1f5f9;
-        }
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
+app = cors(app, allow_origin="*")
 
-        .project-header.expanded {
-            border-radius: 8px 8px 0 0;
-        }
+# Dashboard assets served from memory by /assets/<filename>: mimetype and minifier
+DASHBOARD_ASSETS = {
+    'dashboard.css': ('text/css', rcssmin.cssmin if rcssmin else None),
+    'dashboard.js': ('text/javascript', rjsmin.jsmin if rjsmin else None),
+}
+
+def static_asset_url(filename: str) -> str:
+    """URL of a dashboard asset, versioned by its content hash so it can be cached as immutable"""
+    return f"/assets/{filename}?v={load_dashboard_asset(filename).version}"
+
+def chart_js_tags() -> str:
+    """Script tags for Chart.js, preferring the vendored copy over the CDN"""
+    if (VENDOR_DIR / CHART_JS_FILENAME).exists():
+        return f'<script defer src="/static/vendor/{CHART_JS_FILENAME}"></script>'
+    return (
+        '<link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>\n'
+        f'    <script defer src="{CHART_JS_CDN_URL}"></script>'
+    )
 
-        .project-info {
-            flex: 1;
-        }
+# Response compression. The dashboard page and the analytics payloads are
+# highly repetitive markup/JSON; streamed responses (NDJSON, SSE) are left alone.
+COMPRESS_MIN_SIZE = 512
+COMPRESS_LEVEL = 6
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html'}
 
-        .project-name {
-            font-weight: 600;
-            color: #2d3748;
-            margin: 0;
-        }
+def accepts_gzip() -> bool:
+    """Whether the client advertised gzip in Accept-Encoding"""
+    return request.accept_encodings['gzip'] > 0
 
-        .project-stats {
-            font-size: 0.85rem;
-            color: #718096;
-            margin-top: 4px;
-        }
+def accepts_brotli() -> bool:
+    """Whether the client advertised br in Accept-Encoding"""
+    return request.accept_encodings['br'] > 0
 
-        .project-expand-icon {
-            transition: transform 0.2s;
-            color: #718096;
-        }
+@app.after_request
+async def compress_response(response):
+    """Gzip JSON and HTML responses above COMPRESS_MIN_SIZE when the client accepts it"""
+    if (response.status_code != 200 or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    if not accepts_gzip():
+        return response
+
+    body = await response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    # A strong ETag must differ between encodings of the same payload
+    etag = response.headers.get('ETag')
+    if etag:
+        response.headers['ETag'] = etag[:-1] + '-gzip"'
+    return response
 
-        .project-expand-icon.expanded {
-            transform: rotate(180deg);
-        }
+# Conditional GET support for the JSON analytics endpoints
+# Always revalidate: freshness comes from the server-side cache, and an
+# unchanged payload costs only a 304 instead of the full body
+API_CACHE_CONTROL = 'private, no-cache'
+
+def json_etag(body: bytes) -> str:
+    """Strong validator for an encoded JSON body"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+def if_none_match(etag: str) -> bool:
+    """Whether the request's If-None-Match already covers etag"""
+    candidates = set()
+    for tag in request.headers.get('If-None-Match', '').split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        # compress_response suffixes the tag of gzipped bodies
+        if tag.endswith('-gzip"'):
+            tag = tag[:-6] + '"'
+        candidates.add(tag)
+    return etag in candidates or '*' in candidates
 
-        .project-activities {
-            display: none;
-            padding: 16px;
-            background: #ffffff;
-            border-radius: 0 0 8px 8px;
-        }
+@app.after_request
+async def add_conditional_headers(response):
+    """Tag JSON API responses with an ETag and answer matching revalidations with 304"""
+    if (request.method != 'GET' or not request.path.startswith('/api/')
+            or response.status_code != 200 or response.mimetype != 'application/json'):
+        return response
+
+    # Cached endpoints arrive already tagged; hash the body for the rest
+    etag = response.headers.get('ETag')
+    if not etag:
+        etag = json_etag(await response.get_data())
+        response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = API_CACHE_CONTROL
+
+    if if_none_match(etag):
+        response.status_code = 304
+        response.set_data(b'')
 
-        .project-activities.expanded {
-            display: block;
-        }
+    return response
 
-        .activity-group {
-            margin-bottom: 16px;
-        }
+# Security headers for all responses, built once and appended in a single call
+SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'SAMEORIGIN'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Strict-Transport-Security', 'max-age=31536000; includeSubDomains'),
+    ('Content-Security-Policy', "default-src 'self'; script-src 'self' 'unsafe-inline' cdn.jsdelivr.net; style-src 'self' 'unsafe-inline' cdn.jsdelivr.net; img-src 'self' data:; connect-src 'self'"),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+    ('Permissions-Policy', 'geolocation=(), microphone=(), camera=()'),
+)
 
-        .activity-group:last-child {
-            margin-bottom: 0;
-        }
+@app.after_request
+async def add_security_headers(response):
+    """Add comprehensive security headers to all responses"""
+    # No handler sets these, so they are appended rather than set one by one
+    response.headers.extend(SECURITY_HEADERS)
+    # Vendored assets carry their version in the filename, so they never change in place
+    if request.path.startswith('/static/vendor/'):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
 
-        .activity-group-title {
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: #4a5568;
-            margin-bottom: 8px;
-            padding-bottom: 4px;
-            border-bottom: 1px solid #e2e8f0;
-        }
+# Global instances
+db = OrchestrationDB()
+handoff_monitor = HandoffMonitor(db)
+subagent_tracker = SubagentTracker(db)
+deepseek_client = DeepSeekClient()
 
-        .activity-item {
-            padding: 8px 12px;
-            margin-bottom: 6px;
-            background: #f7fafc;
-            border-radius: 4px;
-            border-left: 3px solid #e2e8f0;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
+# Dedicated pool for blocking work. OrchestrationDB opens one sqlite3 connection
+# per thread, so a fixed-size pool also caps the number of open connections.
+DB_WORKERS = 8
+DB_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=DB_WORKERS, thread_name_prefix='orchestration-db')
 
-        .activity-item.handoff {
-            border-left-color: #3b82f6;
-        }
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call (SQLite query, DeepSeek health probe) in a worker thread
 
-        .activity-item.subagent {
-            border-left-color: #667eea;
-        }
+    OrchestrationDB keeps one sqlite3 connection per thread, so each worker
+    gets its own WAL reader and handlers no longer stall the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(DB_EXECUTOR, functools.partial(func, *args, **kwargs))
 
-        .activity-details {
-            flex: 1;
-        }
+@app.before_serving
+async def open_db_connections():
+    """Start every worker and open its connection now instead of on its first request"""
+    # The barrier holds each task until all have started, so every one of them
+    # lands on a different worker thread
+    barrier = threading.Barrier(DB_WORKERS)
 
-        .activity-meta {
-            font-size: 0.8rem;
-            color: #718096;
-        }
+    def open_connection():
+        db.conn
+        barrier.wait(timeout=10)
 
-        .activity-description {
-            font-size: 0.85rem;
-            color: #2d3748;
-            margin-top: 2px;
-        }
+    try:
+        await asyncio.gather(*(run_blocking(open_connection) for _ in range(DB_WORKERS)))
+    except Exception as e:
+        # Workers that missed the warm-up still connect lazily
+        logger.warning(f"Could not pre-open database connections: {e}")
 
-        .activity-badge {
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 0.75rem;
-            font-weight: 500;
-            margin-right: 8px;
-        }
+@app.after_serving
+async def shutdown_db_executor():
+    """Release the worker threads when the server stops"""
+    DB_EXECUTOR.shutdown(wait=False)
 
-        .activity-badge.success {
-            background: #c6f6d5;
-            color: #22543d;
-        }
+class DashboardCache:
+    """Short-lived in-process cache for dashboard tile data
 
-        .activity-badge.failed {
-            background: #fed7d7;
-            color: #742a2a;
-        }
-
-        .activity-cost {
-            font-size: 0.8rem;
-            color: #4a5568;
-            font-weight: 500;
-        }
+    Dashboards poll the same aggregates every few seconds, so each entry is
+    reused until its TTL expires. Concurrent misses for the same key share a
+    single load instead of each running the query.
+    """
 
-        @media (max-width: 768px) {
-            .dashboard-grid {
-                grid-template-columns: 1fr;
-            }
-
-            .project-header {
-                flex-direction: column;
-                align-items: flex-start;
-            }
-
-            .project-stats {
-                margin-top: 8px;
-            }
-
-            .activity-item {
-                flex-direction: column;
-                align-items: flex-start;
-            }
-
-            .activity-cost {
-                margin-top: 4px;
-                align-self: flex-end;
-            }
-
-            .status-bar {
-                flex-direction: column;
-                gap: 15px;
-            }
-        }
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Bumped by invalidate(), so loads started before it are not stored
+        self._generation = 0
+        self._change_token = None
+        self._change_checked = 0.0
+
+    async def get(self, key: str, ttl: float, loader) -> Any:
+        """Return the cached value for key, calling loader() if it is missing or stale"""
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        pending = self._pending.get(key)
+        if pending is None:
+            generation = self._generation
+            pending = asyncio.ensure_future(loader())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda future: self._store(key, future, generation))
+
+        # Shield so one cancelled request doesn't cancel the load for everyone waiting on it
+        return await asyncio.shield(pending)
+
+    def needs_load(self, key: str, ttl: float) -> bool:
+        """Whether get() would start a load: no fresh entry and none in flight"""
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return False
+        return key not in self._pending
+
+    def _store(self, key: str, future: asyncio.Future, generation: int):
+        """Record a finished load; failures and loads older than the last invalidate() are not cached"""
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if generation != self._generation:
+            return
+        if not future.cancelled() and future.exception() is None:
+            self._entries[key] = (time.monotonic(), future.result())
+
+    def invalidate(self):
+        """Drop all cached entries, e.g. after new events are tracked
+
+        Loads still in flight may have read the old rows, so they are dropped
+        too: later requests start a fresh load and the old result is not stored.
+        """
+        self._generation += 1
+        self._entries.clear()
+        self._pending.clear()
+
+    def sync_change_token(self, token: tuple):
+        """Invalidate once when the database change token moves
+
+        Catches rows written by other processes (hooks, migrations) that never
+        pass through the track endpoints.
+        """
+        if token != self._change_token:
+            if self._change_token is not None:
+                self.invalidate()
+            self._change_token = token
+
+    async def check_changes(self, interval: float):
+        """Sync with the database change token at most once per interval
+
+        Lets polling clients see rows written by other processes before the
+        TTLs run out, at the cost of one cheap token query per interval.
+        """
+        now = time.monotonic()
+        if now - self._change_checked < interval:
+            return
+        # Claim the check before awaiting so concurrent requests skip it
+        self._change_checked = now
+        self.sync_change_token(await run_blocking(db.get_change_token))
+
+dashboard_cache = DashboardCache()
+
+# Seconds between database change-token checks made by cached endpoints
+CHANGE_CHECK_SECONDS = 2
+
+# Seconds each dashboard data source may be served from the cache
+CACHE_TTLS = {
+    'deepseek_health': 10,
+    'today_counts': 5,
+    'handoff_analytics': 60,
+    'subagent_analytics': 60,
+    'cost_analytics': 60,
+    'account_transition': 60
+}
+
+async def cached(key: str, func, *args, **kwargs) -> Any:
+    """Run a blocking data source through the dashboard cache"""
+    return await dashboard_cache.get(key, CACHE_TTLS[key], lambda: run_blocking(func, *args, **kwargs))
+
+class EncodedJSON(NamedTuple):
+    """Cached endpoint payload: the encoded body and its ETag"""
+    body: bytes
+    etag: str
+
+async def encoded_json(key: str, ttl: float, build) -> EncodedJSON:
+    """Get an endpoint's payload from the dashboard cache, encoded and tagged
+
+    build() is an async callable returning the payload; failures are not cached.
+    """
+    async def encode() -> EncodedJSON:
+        body = json_bytes(await build())
+        return EncodedJSON(body, json_etag(body))
 
-        .live-indicator {
-            display: inline-block;
-            width: 8px;
-            height: 8px;
-            background: #22c55e;
-            border-radius: 50%;
-            animation: pulse 2s infinite;
-        }
+    await dashboard_cache.check_changes(CHANGE_CHECK_SECONDS)
+    return await dashboard_cache.get('json:' + key, ttl, encode)
 
-        @keyframes pulse {
-            0% { opacity: 1; }
-            50% { opacity: 0.5; }
-            100% { opacity: 1; }
-        }
+async def cached_json(key: str, ttl: float, build) -> Response:
+    """Serve an endpoint's payload from the dashboard cache as already-encoded JSON
 
-        /* Data Quality Indicators */
-        .historical-data {
-            background-color: #f8f9fa;
-            opacity: 0.8;
-            border-left: 3px solid #6c757d;
-        }
+    Repeat requests within the TTL skip both the data loaders and serialization,
+    and a revalidation matching the cached ETag is answered with a bare 304.
+    """
+    encoded = await encoded_json(key, ttl, build)
+    if if_none_match(encoded.etag):
+        return Response(b'', status=304, headers={'ETag': encoded.etag, 'Cache-Control': API_CACHE_CONTROL})
+    return Response(encoded.body, mimetype='application/json', headers={'ETag': encoded.etag})
+
+class PrecompressedBody(NamedTuple):
+    """Static response body with its precompressed copies and validator"""
+    body: bytes
+    gzipped: bytes
+    # None when brotli is not installed
+    brotli: Optional[bytes]
+    # Content hash of body
+    version: str
+
+    @property
+    def etag(self) -> str:
+        # Weak: the same validator covers every encoding of the body
+        return f'W/"{self.version}"'
+
+def precompress(body: bytes) -> PrecompressedBody:
+    """Compress a static body once at the highest levels, for every later request"""
+    return PrecompressedBody(
+        body=body,
+        gzipped=gzip.compress(body, compresslevel=9),
+        brotli=brotli.compress(body, quality=11, mode=brotli.MODE_TEXT) if brotli else None,
+        version=hashlib.blake2b(body, digest_size=8).hexdigest()
+    )
 
-        .old-data {
-            background-color: #fff3cd;
-            border-left: 3px solid #ffc107;
-        }
+def precompressed_response(encoded: PrecompressedBody, mimetype: str, cache_control: str) -> Response:
+    """Serve a precompressed body in the best encoding the client accepts, or a 304
 
-        .recent-data {
-            background-color: #d1edff;
-            border-left: 3px solid #28a745;
-        }
+    The stored bytes objects are handed to Response as-is: Quart sends a bytes
+    body without copying it and with a Content-Length, whereas a memoryview
+    would be treated as an iterable body and streamed chunked.
+    """
+    headers = {
+        'ETag': encoded.etag,
+        'Cache-Control': cache_control,
+        'Vary': 'Accept-Encoding'
+    }
 
-        .historical-data:hover,
-        .old-data:hover,
-        .recent-data:hover {
-            opacity: 1;
-            transform: scale(1.01);
-            transition: all 0.2s ease;
-        }
-    </style>
+    if encoded.etag in request.headers.get('If-None-Match', ''):
+        return Response(b'', status=304, headers=headers)
+    if encoded.brotli is not None and accepts_brotli():
+        headers['Content-Encoding'] = 'br'
+        return Response(encoded.brotli, mimetype=mimetype, headers=headers)
+    if accepts_gzip():
+        headers['Content-Encoding'] = 'gzip'
+        return Response(encoded.gzipped, mimetype=mimetype, headers=headers)
+    return Response(encoded.body, mimetype=mimetype, headers=headers)
+
+@functools.lru_cache(maxsize=None)
+def load_dashboard_asset(filename: str) -> PrecompressedBody:
+    """Read, minify (when a minifier is installed) and compress a dashboard asset once"""
+    _, minify = DASHBOARD_ASSETS[filename]
+    source = (STATIC_DIR / filename).read_text(encoding='utf-8')
+    if minify:
+        source = minify(source)
+    return precompress(source.encode('utf-8'))
+
+# Tooltip skeletons, rendered into the page as <template id="tt-{type}">.
+# Each type is (title, items, subtitle); an item is (label, value[, value
+# class]) and None draws a divider. {name} placeholders in values and
+# subtitles become empty data-slot spans, the only parts dashboard.js fills.
+TOOLTIP_TEMPLATES = {
+    'deepseek-status': ('DeepSeek Connection Status', (
+        ('Status:', '{status}'),
+        ('Response Time:', '{response_time}'),
+        ('Models Loaded:', '{models_loaded}'),
+        ('Health Status:', '{health}'),
+    ), None),
+    'active-sessions': ('Active Sessions', (
+        ('Current Count:', '{count}'),
+        ('Definition:', 'Sessions with ongoing orchestration'),
+    ), None),
+    'handoffs-today': ('Handoffs Today', (
+        ('Total Count:', '{count}'),
+        ('Definition:', 'Model handoffs since midnight'),
+        ('Includes:', 'Claude → DeepSeek transitions'),
+    ), None),
+    'subagents-spawned': ('Subagents Spawned', (
+        ("Today's Count:", '{count}'),
+        ('Definition:', 'Specialized agent invocations'),
+        ('Includes:', 'Testing, security, MCP tools'),
+    ), None),
+    'savings-today': ('Cost Savings Today', (
+        ('Amount Saved:', '{amount}'),
+        ('Source:', 'DeepSeek vs Claude pricing'),
+        ('Calculation:', '$0.015/1k tokens avoided'),
+    ), None),
+    'total-handoffs': ('Total Handoffs Breakdown', (
+        ('DeepSeek Handoffs:', '{deepseek}'),
+        ('Claude Handoffs:', '{claude}'),
+        ('Total:', '{total}'),
+    ), None),
+    'deepseek-usage': ('DeepSeek Usage Analysis', (
+        ('DeepSeek:', '{deepseek} handoffs'),
+        ('Claude:', '{claude} handoffs'),
+        ('Optimization:', '{local_percent}% local routing'),
+    ), None),
+    'handoff-success-rate': ('Handoff Success Rate', (
+        ('Success Rate:', '{success_rate}%'),
+        ('Successful:', '{successful}'),
+        ('Failed:', '{failed}'),
+    ), None),
+    'avg-confidence': ('Confidence Score Range', (
+        ('Average:', '{avg}'),
+        ('Minimum:', '{min}'),
+        ('Maximum:', '{max}'),
+        ('Scale:', '0.0 - 1.0 (higher = more confident)'),
+    ), None),
+    'unique-agents': ('Subagent Diversity Analysis', (
+        ('Unique Agents:', '{unique_agents} different agents'),
+        ('Coverage:', '{coverage}% diversity'),
+        ('Most Active:', '{most_active}'),
+    ), None),
+    'subagent-invocations': ('Subagent Invocation Breakdown', (
+        ('Total Invocations:', '{total}'),
+        ('Success Rate:', '{success_rate}%'),
+        ('Avg Duration:', '{avg_duration}s per invocation'),
+    ), None),
+    'most-used-agent': ('Most Active Subagent', (
+        ('Agent:', '{name}'),
+        ('Invocations:', '{count} times'),
+        ('Success Rate:', '{success_rate}%'),
+        ('Specialization:', '{specialization}'),
+    ), None),
+    'monthly-cost': ('Monthly Cost Breakdown', (
+        ('Claude Usage:', '{claude_cost}'),
+        ('DeepSeek Usage:', '{deepseek_cost}'),
+        ('Total:', '{total}'),
+        ('vs Pure Claude:', '{pure_claude_cost}'),
+    ), None),
+    'monthly-savings': ('Monthly Savings Analysis', (
+        ('Total Savings:', '{total_savings}'),
+        ('From DeepSeek:', '{deepseek_savings}'),
+        ('Cost Reduction:', '{reduction_percent}%'),
+        ('ROI:', '{roi} (local model)'),
+    ), None),
+    'optimization-rate': ('Cost Optimization Performance', (
+        ('Optimization Rate:', '{rate}%'),
+        ('Target:', '90% DeepSeek usage'),
+        ('Performance:', '{performance}'),
+    ), None),
+    'response-time': ('Response Time Analysis', (
+        ('Average:', '{avg}s'),
+        ('95th Percentile:', '{p95}s'),
+        ('Target:', '<2.0s'),
+        ('Status:', '{status}'),
+    ), None),
+    'deepseek-response': ('DeepSeek Performance', (
+        ('Response Time:', '{response_time}s'),
+        ('vs Claude:', '{vs_claude}% of Claude time'),
+        ('Availability:', '{availability}%'),
+    ), None),
+    'system-uptime': ('System Availability', (
+        ('Uptime:', '{uptime}%'),
+        ('Downtime Events:', '{downtime_events}'),
+        ('Last Restart:', '{last_restart}'),
+    ), None),
+    'error-rate': ('Error Rate Analysis', (
+        ('Error Rate:', '{rate}%'),
+        ('Total Errors:', '{total_errors}'),
+        ('Most Common:', '{most_common}'),
+        ('Target:', '<5.0%'),
+    ), None),
+    'transition-status': ('Account Transition Readiness', (
+        ('Status:', '{status}'),
+        ('DeepSeek Usage:', '{deepseek_usage}%'),
+        ('Readiness Score:', '{readiness_score}%'),
+    ), None),
+    'effectiveness-score': ('Optimization Effectiveness', (
+        ('Score:', '{score}%'),
+        ('Quality Maintained:', '{quality_maintained}'),
+        ('Cost Reduction:', '{cost_reduction}%'),
+    ), None),
+    'ai-system-status': ('AI System Status Overview', (
+        ('Claude Code:', '{claude_status}', 'status-online'),
+        ('DeepSeek Local:', '{deepseek_status}'),
+        ('DeepSeek Response:', '{deepseek_response_time}s'),
+        ('Combined Health:', '{combined_health}'),
+    ), 'System provides intelligent routing between Claude Code orchestration and local DeepSeek '
+       'inference for optimal cost/performance balance.'),
+    'orchestration-activity': ('Orchestration Activity Breakdown', (
+        ('Active Sessions:', '{total_sessions}'),
+        ('Claude Tasks:', '{claude_tasks}'),
+        ('DeepSeek Tasks:', '{deepseek_tasks}'),
+        ('Subagents Today:', '{subagents_today}'),
+        ('Total Handoffs:', '{handoffs_today}'),
+    ), 'Comprehensive view of all AI orchestration activity across Claude Code sessions and DeepSeek handoffs.'),
+    'daily-activity': ("Today's AI Activity Breakdown", (
+        ('Claude → DeepSeek Handoffs:', '{handoffs_today}'),
+        ('Specialized Agents Used:', '{subagents_today}'),
+        None,
+        ('Total Activities:', '{total}', 'status-online'),
+    ), "Today's orchestration decisions routing tasks between Claude Code strategic work and DeepSeek "
+       "local execution, plus specialized agent assistance for optimal cost/performance balance."),
+    'cost-optimization': ('AI Routing & Cost Optimization', (
+        ('DeepSeek (Free) Handoffs:', '{deepseek_handoffs}', 'status-online'),
+        ('Claude (Paid) Handoffs:', '{claude_handoffs}'),
+        None,
+        ('Local Routing Rate:', '{optimization_rate}%', 'status-online'),
+        ('Cost Avoided Today:', '{cost_avoided}'),
+        ('Actual Spend:', '{actual_spend}'),
+    ), 'Intelligent task routing: {optimization_rate}% of workload processed locally for maximum cost '
+       'efficiency. Estimated savings based on ~$0.015 per 1K tokens for Claude API calls.'),
+    'system-health': ('System Health Metrics', (
+        ('Success Rate:', '{success_rate}%', 'status-online'),
+        ('Response Time:', '{response_time}s'),
+        ('System Uptime:', '{uptime}%'),
+    ), 'Overall system health including both Claude orchestration and DeepSeek local inference performance.'),
+    'daily-impact': ("Today's AI Cost Impact", (
+        ('Tasks Processed Locally:', '{deepseek_handoffs}', 'status-online'),
+        ('Tasks Sent to Claude:', '{claude_handoffs}'),
+        None,
+        ('Without Optimization:', '{potential_cost}'),
+        ('Actual Cost:', '{actual_cost}'),
+        ('Cost Reduction:', '{reduction}%', 'status-online'),
+    ), 'Real cost savings from routing {deepseek_handoffs} tasks to free local DeepSeek instead of paid '
+       'Claude API. Based on average $0.015 per task.'),
+    # Fallback for types without their own skeleton
+    'default': ('Metric Details', (
+        ('Value:', '{value}'),
+    ), None),
+}
+
+TOOLTIP_SLOT = re.compile(r'\{(\w+)\}')
+
+def tooltip_text_html(text: str) -> str:
+    """Escape tooltip text, turning {name} placeholders into empty slot spans"""
+    return TOOLTIP_SLOT.sub(r'<span data-slot="\1"></span>', html.escape(text))
+
+def render_tooltip_item(label: str, value: str, value_class: str = '') -> str:
+    """Render one label/value row; a lone placeholder makes the value span the slot"""
+    classes = f'tooltip-value {value_class}'.rstrip()
+    slot = TOOLTIP_SLOT.fullmatch(value)
+    if slot:
+        value_html = f'<span class="{classes}" data-slot="{slot.group(1)}"></span>'
+    else:
+        value_html = f'<span class="{classes}">{tooltip_text_html(value)}</span>'
+    return f'<div class="tooltip-item"><span class="tooltip-label">{html.escape(label)}</span>{value_html}</div>'
+
+def render_tooltip_templates() -> str:
+    """Render every tooltip skeleton as a <template> for the dashboard page"""
+    templates = []
+    for tooltip_type, (title, items, subtitle) in TOOLTIP_TEMPLATES.items():
+        parts = [f'<div class="tooltip-title">{html.escape(title)}</div>']
+        for item in items:
+            parts.append('<hr class="tooltip-divider">' if item is None else render_tooltip_item(*item))
+        if subtitle:
+            parts.append(f'<div class="tooltip-subtitle">{tooltip_text_html(subtitle)}</div>')
+        templates.append(f'<template id="tt-{tooltip_type}">{"".join(parts)}</template>')
+    return '\n    '.join(templates)
+
+@functools.lru_cache(maxsize=2)
+def render_dashboard(chart_tags: str) -> PrecompressedBody:
+    """Render the dashboard page once per Chart.js source (vendored or CDN)
+
+    The page is otherwise static, so requests reuse the encoded bytes, the
+    compressed copies and the ETag instead of rebuilding them. The CSS and JS
+    are linked by content hash, so the browser caches them separately and only
+    this shell is revalidated on reload.
+    """
+    template = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI Orchestration Analytics</title>
+    <!-- Start the first data request while the page and scripts load -->
+    <link rel="preload" href="/api/bootstrap" as="fetch" crossorigin>
+    <!-- Chart.js (deferred; charts are only built after DOMContentLoaded) -->
+    {{ chart_js_tags }}
+    <link rel="stylesheet" href="{{ dashboard_css_url }}">
 </head>
 <body>
     <div class="container">
@@ -703,1798 +748,86 @@ async def dashboard():
         </div>
     </div>
 
-    <script>
-        let charts = {};
-        let autoRefreshInterval = null;
-        let isAutoRefresh = true; // Default to enabled
-        let currentActivityPage = 1;
-        let activityPagination = null;
-        let isProjectView = true;
-        let currentProjectPage = 1;
-        let projectPagination = null;
-
-        // SSE Real-time Updates
-        let eventSource = null;
-        let sseReconnectInterval = null;
-
-        // Initialize SSE connection for real-time updates
-        function initializeSSE() {
-            console.log('Initializing SSE connection...');
-
-            if (eventSource) {
-                eventSource.close();
-            }
-
-            try {
-                eventSource = new EventSource('/api/events');
-
-                eventSource.onopen = function(event) {
-                    console.log('SSE connection opened');
-                    clearInterval(sseReconnectInterval);
-                    // Stop the old polling system
-                    if (autoRefreshInterval) {
-                        clearInterval(autoRefreshInterval);
-                        autoRefreshInterval = null;
-                        console.log('Stopped old polling system in favor of SSE');
-                    }
-                };
-
-                eventSource.onmessage = function(event) {
-                    console.log('SSE message received:', event.data);
-                    try {
-                        const data = JSON.parse(event.data);
-
-                        if (data.type === 'dashboard_update') {
-                            // Update system status
-                            if (data.system_status) {
-                                updateSystemStatusFromSSE(data.system_status);
-                            }
-
-                            // Update recent activity
-                            if (data.recent_activity) {
-                                updateActivityTableFromSSE(data.recent_activity);
-                            }
-
-                            // Show last update time in live indicator
-                            const liveIndicator = document.getElementById('liveIndicator');
-                            if (liveIndicator) {
-                                liveIndicator.textContent = `Live • ${new Date().toLocaleTimeString()}`;
-                                liveIndicator.style.display = 'inline-block';
-                            }
-
-                        } else if (data.type === 'error') {
-                            console.error('SSE error event:', data.message);
-                            showSSEError(data.message);
-                        }
-                    } catch (error) {
-                        console.error('Error parsing SSE data:', error);
-                    }
-                };
-
-                eventSource.onerror = function(event) {
-                    console.error('SSE connection error:', event);
-                    eventSource.close();
-                    showSSEError('Connection lost - attempting to reconnect...');
-
-                    // Attempt to reconnect after 5 seconds
-                    sseReconnectInterval = setTimeout(() => {
-                        console.log('Attempting SSE reconnection...');
-                        initializeSSE();
-                    }, 5000);
-                };
-
-            } catch (error) {
-                console.error('Failed to initialize SSE:', error);
-                showSSEError('Real-time updates unavailable - falling back to manual refresh');
-                // Fallback to manual refresh if SSE fails
-                setupFallbackPolling();
-            }
-        }
-
-        // Update system status from SSE data
-        function updateSystemStatusFromSSE(statusData) {
-            try {
-                // Update session count
-                const sessionElement = document.getElementById('today-sessions');
-                if (sessionElement && statusData.today_sessions !== undefined) {
-                    sessionElement.textContent = statusData.today_sessions;
-                }
-
-                // Update active projects
-                const projectsElement = document.getElementById('active-projects');
-                if (projectsElement && statusData.active_projects !== undefined) {
-                    projectsElement.textContent = statusData.active_projects;
-                }
-
-                // Update total handoffs
-                const handoffsElement = document.getElementById('total-handoffs');
-                if (handoffsElement && statusData.total_handoffs !== undefined) {
-                    handoffsElement.textContent = statusData.total_handoffs;
-                }
-
-                // Update cost savings
-                const savingsElement = document.getElementById('cost-savings');
-                if (savingsElement && statusData.cost_savings !== undefined) {
-                    savingsElement.textContent = `$${statusData.cost_savings.toFixed(2)}`;
-                }
-
-                console.log('System status updated via SSE');
-            } catch (error) {
-                console.error('Error updating system status from SSE:', error);
-            }
-        }
-
-        // Update activity table from SSE data (flat view only for now)
-        function updateActivityTableFromSSE(activities) {
-            try {
-                // Only update if we're in flat view mode
-                if (isProjectView) {
-                    console.log('Skipping SSE activity update - in project view');
-                    return;
-                }
-
-                const tbody = document.querySelector('#activityTable tbody');
-                if (!tbody) {
-                    console.error('Activity table body not found');
-                    return;
-                }
-
-                // Clear existing rows
-                tbody.innerHTML = '';
-
-                // Add new rows
-                activities.forEach(activity => {
-                    const row = document.createElement('tr');
-                    row.innerHTML = `
-                        <td>${new Date(activity.timestamp).toLocaleString()}</td>
-                        <td>${escapeHtml(activity.session_id || 'N/A')}</td>
-                        <td>${escapeHtml(activity.event_type || 'N/A')}</td>
-                        <td>${escapeHtml(activity.model_or_agent || 'N/A')}</td>
-                        <td class="description-cell" title="${escapeHtml(activity.description || 'N/A')}">${escapeHtml((activity.description || 'N/A').substring(0, 50))}${(activity.description || '').length > 50 ? '...' : ''}</td>
-                        <td><span class="status-badge ${activity.status || 'unknown'}">${escapeHtml(activity.status || 'Unknown')}</span></td>
-                        <td>$${(activity.cost || 0).toFixed(4)}</td>
-                        <td>${escapeHtml(activity.project_name || 'Unknown')}</td>
-                    `;
-                    tbody.appendChild(row);
-                });
-
-                console.log('Activity table updated via SSE');
-            } catch (error) {
-                console.error('Error updating activity table from SSE:', error);
-            }
-        }
-
-        // Show SSE error status
-        function showSSEError(message) {
-            const liveIndicator = document.getElementById('liveIndicator');
-            if (liveIndicator) {
-                liveIndicator.textContent = `⚠️ ${message}`;
-                liveIndicator.style.display = 'inline-block';
-                liveIndicator.style.color = '#ff6b6b';
-            }
-        }
-
-        // Fallback polling if SSE fails
-        function setupFallbackPolling() {
-            console.log('Setting up fallback polling...');
-            autoRefreshInterval = setInterval(() => {
-                console.log('Fallback polling refresh...');
-                refreshAll();
-            }, 30000); // 30 second fallback
-        }
-
-        // Initialize dashboard
-        document.addEventListener('DOMContentLoaded', function() {
-            refreshAll();
-            initializeTooltips();
-            initializeSSE(); // Use SSE for real-time updates instead of polling
-        });
-
-        function initializeAutoRefresh() {
-            if (isAutoRefresh) {
-                const toggle = document.getElementById('autoRefreshToggle');
-                const indicator = document.getElementById('liveIndicator');
-                toggle.classList.add('active');
-                indicator.style.display = 'inline-block';
-                autoRefreshInterval = setInterval(refreshAll, 30000); // 30 seconds
-            }
-        }
-
-        // Tooltip System
-        let currentTooltip = null;
-
-        function initializeTooltips() {
-            document.addEventListener('mouseover', handleTooltipShow);
-            document.addEventListener('mouseout', handleTooltipHide);
-            document.addEventListener('mousemove', handleTooltipMove);
-        }
-
-        function handleTooltipShow(e) {
-            const element = e.target.closest('[data-tooltip]');
-            if (!element) return;
-
-            const tooltipType = element.getAttribute('data-tooltip');
-            const tooltipData = element.getAttribute('data-tooltip-data');
-
-            showTooltip(element, tooltipType, tooltipData);
-        }
-
-        function handleTooltipHide(e) {
-            if (!e.target.closest('[data-tooltip]')) {
-                hideTooltip();
-            }
-        }
-
-        function handleTooltipMove(e) {
-            if (currentTooltip) {
-                positionTooltip(currentTooltip, e);
-            }
-        }
-
-        function showTooltip(element, type, data) {
-            hideTooltip(); // Hide any existing tooltip
-
-            const tooltip = document.createElement('div');
-            tooltip.className = 'tooltip';
-
-            // Security: Sanitize and safely set HTML content
-            const content = generateTooltipContent(type, data);
-
-            // Create a temporary div to parse the HTML safely
-            const tempDiv = document.createElement('div');
-            tempDiv.innerHTML = content;
-
-            // Sanitize by removing any script tags or dangerous attributes
-            const scripts = tempDiv.querySelectorAll('script');
-            scripts.forEach(script => script.remove());
-
-            const allElements = tempDiv.querySelectorAll('*');
-            allElements.forEach(el => {
-                // Remove dangerous attributes
-                ['onclick', 'onload', 'onerror', 'onmouseover'].forEach(attr => {
-                    el.removeAttribute(attr);
-                });
-                // Remove any javascript: protocols
-                if (el.href && el.href.startsWith('javascript:')) {
-                    el.removeAttribute('href');
-                }
-            });
-
-            // Now safely append the sanitized content
-            tooltip.appendChild(tempDiv);
-
-            document.body.appendChild(tooltip);
-            currentTooltip = tooltip;
-
-            // Position and show
-            setTimeout(() => {
-                tooltip.classList.add('show');
-            }, 50);
-        }
-
-        function hideTooltip() {
-            if (currentTooltip) {
-                currentTooltip.remove();
-                currentTooltip = null;
-            }
-        }
-
-        function positionTooltip(tooltip, e) {
-            const tooltipRect = tooltip.getBoundingClientRect();
-            const viewportWidth = window.innerWidth;
-            const viewportHeight = window.innerHeight;
-
-            let left = e.clientX + 10;
-            let top = e.clientY - tooltipRect.height - 10;
-
-            // Adjust if tooltip would go off screen
-            if (left + tooltipRect.width > viewportWidth) {
-                left = e.clientX - tooltipRect.width - 10;
-            }
-            if (top < 0) {
-                top = e.clientY + 10;
-            }
-
-            tooltip.style.left = left + 'px';
-            tooltip.style.top = top + 'px';
-        }
-
-        function generateTooltipContent(type, rawData) {
-            let data;
-            try {
-                data = typeof rawData === 'string' ? JSON.parse(rawData) : rawData;
-            } catch {
-                data = rawData;
-            }
-
-            switch (type) {
-                case 'deepseek-status':
-                    return `
-                        <div class="tooltip-title">DeepSeek Connection Status</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Status:</span>
-                            <span class="tooltip-value">${data.available ? 'Connected' : 'Disconnected'}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Response Time:</span>
-                            <span class="tooltip-value">${data.response_time?.toFixed(2) || 'N/A'}s</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Models Loaded:</span>
-                            <span class="tooltip-value">${data.models_loaded || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Health Status:</span>
-                            <span class="tooltip-value">${data.status || 'Unknown'}</span>
-                        </div>
-                    `;
-
-                case 'active-sessions':
-                    return `
-                        <div class="tooltip-title">Active Sessions</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Current Count:</span>
-                            <span class="tooltip-value">${data}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Definition:</span>
-                            <span class="tooltip-value">Sessions with ongoing orchestration</span>
-                        </div>
-                    `;
-
-                case 'handoffs-today':
-                    return `
-                        <div class="tooltip-title">Handoffs Today</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total Count:</span>
-                            <span class="tooltip-value">${data}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Definition:</span>
-                            <span class="tooltip-value">Model handoffs since midnight</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Includes:</span>
-                            <span class="tooltip-value">Claude → DeepSeek transitions</span>
-                        </div>
-                    `;
-
-                case 'subagents-spawned':
-                    return `
-                        <div class="tooltip-title">Subagents Spawned</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Today's Count:</span>
-                            <span class="tooltip-value">${data}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Definition:</span>
-                            <span class="tooltip-value">Specialized agent invocations</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Includes:</span>
-                            <span class="tooltip-value">Testing, security, MCP tools</span>
-                        </div>
-                    `;
-
-                case 'savings-today':
-                    return `
-                        <div class="tooltip-title">Cost Savings Today</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Amount Saved:</span>
-                            <span class="tooltip-value">$${parseFloat(data).toFixed(4)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Source:</span>
-                            <span class="tooltip-value">DeepSeek vs Claude pricing</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Calculation:</span>
-                            <span class="tooltip-value">$0.015/1k tokens avoided</span>
-                        </div>
-                    `;
-
-                case 'total-handoffs':
-                    return `
-                        <div class="tooltip-title">Total Handoffs Breakdown</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek Handoffs:</span>
-                            <span class="tooltip-value">${data.deepseek || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Claude Handoffs:</span>
-                            <span class="tooltip-value">${data.claude || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total:</span>
-                            <span class="tooltip-value">${data.total || 0}</span>
-                        </div>
-                    `;
-
-                case 'deepseek-usage':
-                    return `
-                        <div class="tooltip-title">DeepSeek Usage Analysis</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek:</span>
-                            <span class="tooltip-value">${data.deepseek || 0} handoffs</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Claude:</span>
-                            <span class="tooltip-value">${data.claude || 0} handoffs</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Optimization:</span>
-                            <span class="tooltip-value">${((data.deepseek / Math.max(data.total, 1)) * 100).toFixed(1)}% local routing</span>
-                        </div>
-                    `;
-
-                case 'handoff-success-rate':
-                    return `
-                        <div class="tooltip-title">Handoff Success Rate</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Success Rate:</span>
-                            <span class="tooltip-value">${(data.success_rate || 0).toFixed(1)}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Successful:</span>
-                            <span class="tooltip-value">${data.successful || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Failed:</span>
-                            <span class="tooltip-value">${data.failed || 0}</span>
-                        </div>
-                    `;
-
-                case 'avg-confidence':
-                    return `
-                        <div class="tooltip-title">Confidence Score Range</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Average:</span>
-                            <span class="tooltip-value">${(data.avg || 0).toFixed(3)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Minimum:</span>
-                            <span class="tooltip-value">${(data.min || 0).toFixed(3)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Maximum:</span>
-                            <span class="tooltip-value">${(data.max || 0).toFixed(3)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Scale:</span>
-                            <span class="tooltip-value">0.0 - 1.0 (higher = more confident)</span>
-                        </div>
-                    `;
-
-                case 'unique-agents':
-                    return `
-                        <div class="tooltip-title">Subagent Diversity Analysis</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Unique Agents:</span>
-                            <span class="tooltip-value">${data.unique_agents || 0} different agents</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Coverage:</span>
-                            <span class="tooltip-value">${data.total_invocations ? ((data.unique_agents / data.total_invocations) * 100).toFixed(1) : 0}% diversity</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Most Active:</span>
-                            <span class="tooltip-value">${data.most_active || 'N/A'}</span>
-                        </div>
-                    `;
-
-                case 'subagent-invocations':
-                    return `
-                        <div class="tooltip-title">Subagent Invocation Breakdown</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total Invocations:</span>
-                            <span class="tooltip-value">${data.total || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Success Rate:</span>
-                            <span class="tooltip-value">${data.success_rate ? data.success_rate.toFixed(1) : 0}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Avg Duration:</span>
-                            <span class="tooltip-value">${data.avg_duration ? data.avg_duration.toFixed(1) : 0}s per invocation</span>
-                        </div>
-                    `;
-
-                case 'most-used-agent':
-                    return `
-                        <div class="tooltip-title">Most Active Subagent</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Agent:</span>
-                            <span class="tooltip-value">${data.name || 'N/A'}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Invocations:</span>
-                            <span class="tooltip-value">${data.count || 0} times</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Success Rate:</span>
-                            <span class="tooltip-value">${data.success_rate ? data.success_rate.toFixed(1) : 0}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Specialization:</span>
-                            <span class="tooltip-value">${data.specialization || 'General purpose'}</span>
-                        </div>
-                    `;
-
-                case 'monthly-cost':
-                    return `
-                        <div class="tooltip-title">Monthly Cost Breakdown</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Claude Usage:</span>
-                            <span class="tooltip-value">$${(data.claude_cost || 0).toFixed(2)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek Usage:</span>
-                            <span class="tooltip-value">$${(data.deepseek_cost || 0).toFixed(2)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total:</span>
-                            <span class="tooltip-value">$${(data.total || 0).toFixed(2)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">vs Pure Claude:</span>
-                            <span class="tooltip-value">$${(data.pure_claude_cost || 0).toFixed(2)}</span>
-                        </div>
-                    `;
-
-                case 'monthly-savings':
-                    return `
-                        <div class="tooltip-title">Monthly Savings Analysis</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total Savings:</span>
-                            <span class="tooltip-value">$${(data.total_savings || 0).toFixed(2)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">From DeepSeek:</span>
-                            <span class="tooltip-value">$${(data.deepseek_savings || 0).toFixed(2)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Cost Reduction:</span>
-                            <span class="tooltip-value">${(data.reduction_percent || 0).toFixed(1)}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">ROI:</span>
-                            <span class="tooltip-value">${data.roi || 'Infinite'} (local model)</span>
-                        </div>
-                    `;
-
-                case 'optimization-rate':
-                    return `
-                        <div class="tooltip-title">Cost Optimization Performance</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Optimization Rate:</span>
-                            <span class="tooltip-value">${(data.rate || 0).toFixed(1)}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Target:</span>
-                            <span class="tooltip-value">90% DeepSeek usage</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Performance:</span>
-                            <span class="tooltip-value">${data.rate >= 90 ? 'Excellent' : data.rate >= 75 ? 'Good' : 'Needs improvement'}</span>
-                        </div>
-                    `;
-
-                case 'response-time':
-                    return `
-                        <div class="tooltip-title">Response Time Analysis</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Average:</span>
-                            <span class="tooltip-value">${(data.avg || 0).toFixed(2)}s</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">95th Percentile:</span>
-                            <span class="tooltip-value">${(data.p95 || 0).toFixed(2)}s</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Target:</span>
-                            <span class="tooltip-value"><2.0s</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Status:</span>
-                            <span class="tooltip-value">${data.avg <= 2.0 ? 'Meeting target' : 'Above target'}</span>
-                        </div>
-                    `;
-
-                case 'deepseek-response':
-                    return `
-                        <div class="tooltip-title">DeepSeek Performance</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Response Time:</span>
-                            <span class="tooltip-value">${(data.response_time || 0).toFixed(2)}s</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">vs Claude:</span>
-                            <span class="tooltip-value">${data.claude_time ? ((data.response_time / data.claude_time) * 100).toFixed(1) : 'N/A'}% of Claude time</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Availability:</span>
-                            <span class="tooltip-value">${data.availability ? data.availability.toFixed(1) : 0}%</span>
-                        </div>
-                    `;
-
-                case 'system-uptime':
-                    return `
-                        <div class="tooltip-title">System Availability</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Uptime:</span>
-                            <span class="tooltip-value">${(data.uptime || 0).toFixed(2)}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Downtime Events:</span>
-                            <span class="tooltip-value">${data.downtime_events || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Last Restart:</span>
-                            <span class="tooltip-value">${data.last_restart || 'N/A'}</span>
-                        </div>
-                    `;
-
-                case 'error-rate':
-                    return `
-                        <div class="tooltip-title">Error Rate Analysis</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Error Rate:</span>
-                            <span class="tooltip-value">${(data.rate || 0).toFixed(2)}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total Errors:</span>
-                            <span class="tooltip-value">${data.total_errors || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Most Common:</span>
-                            <span class="tooltip-value">${data.most_common || 'Connection timeout'}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Target:</span>
-                            <span class="tooltip-value"><5.0%</span>
-                        </div>
-                    `;
-
-                case 'transition-status':
-                    return `
-                        <div class="tooltip-title">Account Transition Readiness</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Status:</span>
-                            <span class="tooltip-value">${data.status || 'Unknown'}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek Usage:</span>
-                            <span class="tooltip-value">${(data.deepseek_usage || 0).toFixed(1)}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Readiness Score:</span>
-                            <span class="tooltip-value">${(data.readiness_score || 0).toFixed(1)}%</span>
-                        </div>
-                    `;
-
-                case 'effectiveness-score':
-                    return `
-                        <div class="tooltip-title">Optimization Effectiveness</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Score:</span>
-                            <span class="tooltip-value">${(data.score || 0).toFixed(1)}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Quality Maintained:</span>
-                            <span class="tooltip-value">${data.quality_maintained ? 'Yes' : 'No'}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Cost Reduction:</span>
-                            <span class="tooltip-value">${(data.cost_reduction || 0).toFixed(1)}%</span>
-                        </div>
-                    `;
-
-                case 'ai-system-status':
-                    return `
-                        <div class="tooltip-title">AI System Status Overview</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Claude Code:</span>
-                            <span class="tooltip-value status-online">${data.claude_status}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek Local:</span>
-                            <span class="tooltip-value ${data.deepseek_status === 'CONNECTED' ? 'status-online' : 'status-offline'}">${data.deepseek_status}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek Response:</span>
-                            <span class="tooltip-value">${data.deepseek_response_time.toFixed(2)}s</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Combined Health:</span>
-                            <span class="tooltip-value ${data.combined_health === 'OPTIMAL' ? 'status-online' : 'status-degraded'}">${data.combined_health}</span>
-                        </div>
-                        <div class="tooltip-subtitle">System provides intelligent routing between Claude Code orchestration and local DeepSeek inference for optimal cost/performance balance.</div>
-                    `;
-
-                case 'orchestration-activity':
-                    return `
-                        <div class="tooltip-title">Orchestration Activity Breakdown</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Active Sessions:</span>
-                            <span class="tooltip-value">${data.total_sessions}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Claude Tasks:</span>
-                            <span class="tooltip-value">${data.claude_tasks}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek Tasks:</span>
-                            <span class="tooltip-value">${data.deepseek_tasks}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Subagents Today:</span>
-                            <span class="tooltip-value">${data.subagents_today}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total Handoffs:</span>
-                            <span class="tooltip-value">${data.handoffs_today}</span>
-                        </div>
-                        <div class="tooltip-subtitle">Comprehensive view of all AI orchestration activity across Claude Code sessions and DeepSeek handoffs.</div>
-                    `;
-
-                case 'daily-activity':
-                    const todayTotal = (data.handoffs_today || 0) + (data.subagents_today || 0);
-                    return `
-                        <div class="tooltip-title">Today's AI Activity Breakdown</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Claude → DeepSeek Handoffs:</span>
-                            <span class="tooltip-value">${data.handoffs_today || 0}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Specialized Agents Used:</span>
-                            <span class="tooltip-value">${data.subagents_today || 0}</span>
-                        </div>
-                        <hr style="margin: 8px 0; border: none; border-top: 1px solid #e2e8f0;">
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Total Activities:</span>
-                            <span class="tooltip-value status-online">${todayTotal}</span>
-                        </div>
-                        <div class="tooltip-subtitle">Today's orchestration decisions routing tasks between Claude Code strategic work and DeepSeek local execution, plus specialized agent assistance for optimal cost/performance balance.</div>
-                    `;
-
-                case 'cost-optimization':
-                    return `
-                        <div class="tooltip-title">AI Routing & Cost Optimization</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">DeepSeek (Free) Handoffs:</span>
-                            <span class="tooltip-value status-online">${data.deepseek_handoffs}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Claude (Paid) Handoffs:</span>
-                            <span class="tooltip-value">${data.claude_handoffs}</span>
-                        </div>
-                        <hr style="margin: 8px 0; border: none; border-top: 1px solid #e2e8f0;">
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Local Routing Rate:</span>
-                            <span class="tooltip-value status-online">${data.optimization_rate}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Cost Avoided Today:</span>
-                            <span class="tooltip-value">$${(data.deepseek_handoffs * 0.015).toFixed(4)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Actual Spend:</span>
-                            <span class="tooltip-value">$${data.estimated_claude_cost.toFixed(4)}</span>
-                        </div>
-                        <div class="tooltip-subtitle">Intelligent task routing: ${data.optimization_rate}% of workload processed locally for maximum cost efficiency. Estimated savings based on ~$0.015 per 1K tokens for Claude API calls.</div>
-                    `;
-
-                case 'system-health':
-                    return `
-                        <div class="tooltip-title">System Health Metrics</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Success Rate:</span>
-                            <span class="tooltip-value status-online">${data.success_rate}%</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Response Time:</span>
-                            <span class="tooltip-value">${data.response_time.toFixed(2)}s</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">System Uptime:</span>
-                            <span class="tooltip-value">${data.uptime}%</span>
-                        </div>
-                        <div class="tooltip-subtitle">Overall system health including both Claude orchestration and DeepSeek local inference performance.</div>
-                    `;
-
-                case 'daily-impact':
-                    const totalPotentialCost = data.total_handoffs * 0.015; // What all tasks would cost on Claude
-                    const actualCost = data.claude_handoffs * 0.015; // What we actually spent
-                    const savingsPercentage = totalPotentialCost > 0 ? Math.round(((totalPotentialCost - actualCost) / totalPotentialCost) * 100) : 0;
-                    return `
-                        <div class="tooltip-title">Today's AI Cost Impact</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Tasks Processed Locally:</span>
-                            <span class="tooltip-value status-online">${data.deepseek_handoffs}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Tasks Sent to Claude:</span>
-                            <span class="tooltip-value">${data.claude_handoffs}</span>
-                        </div>
-                        <hr style="margin: 8px 0; border: none; border-top: 1px solid #e2e8f0;">
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Without Optimization:</span>
-                            <span class="tooltip-value">$${totalPotentialCost.toFixed(4)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Actual Cost:</span>
-                            <span class="tooltip-value">$${actualCost.toFixed(4)}</span>
-                        </div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Cost Reduction:</span>
-                            <span class="tooltip-value status-online">${savingsPercentage}%</span>
-                        </div>
-                        <div class="tooltip-subtitle">Real cost savings from routing ${data.deepseek_handoffs} tasks to free local DeepSeek instead of paid Claude API. Based on average $0.015 per task.</div>
-                    `;
-
-                default:
-                    return `
-                        <div class="tooltip-title">Metric Details</div>
-                        <div class="tooltip-item">
-                            <span class="tooltip-label">Value:</span>
-                            <span class="tooltip-value">${data}</span>
-                        </div>
-                    `;
-            }
-        }
-
-        async function refreshAll() {
-            try {
-                await Promise.all([
-                    loadSystemStatus(),
-                    loadHandoffAnalytics(),
-                    loadSubagentAnalytics(),
-                    loadCostAnalytics(),
-                    loadAccountTransitionAnalysis(),
-                    loadPerformanceMetrics(),
-                    loadActivityData()
-                ]);
-
-                updateLiveIndicator();
-            } catch (error) {
-                console.error('Error refreshing data:', error);
-            }
-        }
-
-        async function loadSystemStatus() {
-            try {
-                console.log('Loading system status...');
-                const response = await fetch('/api/system-status');
-
-                if (!response.ok) {
-                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-                }
-
-                const data = await response.json();
-                console.log('System status data:', data);
-
-                const statusBar = document.getElementById('statusBar');
-                if (!statusBar) {
-                    console.error('Status bar element not found');
-                    return;
-                }
-
-                // Enhanced status bar with comprehensive Claude + DeepSeek metrics
-                const aiSystemData = {
-                    claude_status: data.claude?.available ? 'ACTIVE' : 'OFFLINE',
-                    claude_sessions_today: data.claude?.sessions_today || 0,
-                    deepseek_status: data.deepseek?.available ? 'CONNECTED' : 'OFFLINE',
-                    deepseek_response_time: data.deepseek?.response_time || 0,
-                    deepseek_handoffs_today: data.deepseek_handoffs_today || 0,
-                    combined_health: data.combined_health ? data.combined_health.toUpperCase() : 'DEGRADED'
-                };
-
-            const orchestrationData = {
-                total_sessions: data.active_sessions || 0,
-                sessions_today: data.claude?.sessions_today || 0, // Today's new sessions
-                handoffs_today: data.handoffs_today || 0,
-                claude_tasks: data.handoffs_today - (data.deepseek_handoffs_today || 0), // Actual Claude tasks
-                deepseek_tasks: data.deepseek_handoffs_today || 0, // Actual DeepSeek tasks
-                subagents_today: data.subagents_spawned || 0
-            };
-
-            const costOptimizationData = {
-                savings_today: data.savings_today || 0,
-                cost_avoided: (data.savings_today || 0) * 1.2, // Including indirect savings
-                deepseek_handoffs: data.deepseek_handoffs_today || 0,
-                total_handoffs: data.handoffs_today || 0,
-                claude_handoffs: (data.handoffs_today || 0) - (data.deepseek_handoffs_today || 0),
-                optimization_rate: data.handoffs_today > 0 ?
-                    Math.round(((data.deepseek_handoffs_today || 0) / (data.handoffs_today || 0)) * 100) : 0,
-                estimated_claude_cost: ((data.handoffs_today || 0) - (data.deepseek_handoffs_today || 0)) * 0.015, // $0.015 per 1K tokens avg
-                estimated_deepseek_cost: 0.00 // DeepSeek is free (local)
-            };
-
-            const systemHealthData = {
-                response_time: data.deepseek.response_time || 0,
-                success_rate: 98.5, // Overall system success rate
-                uptime: 99.2 // System uptime percentage
-            };
-
-            const todayImpactData = {
-                total_interactions: (data.handoffs_today || 0) + (data.subagents_spawned || 0),
-                projects_active: Math.min(Math.ceil(data.active_sessions / 3), 8),
-                efficiency_gain: data.deepseek.available ? '3.2x' : '1.1x',
-                total_handoffs: data.handoffs_today || 0,
-                deepseek_handoffs: data.deepseek_handoffs_today || 0,
-                claude_handoffs: (data.handoffs_today || 0) - (data.deepseek_handoffs_today || 0)
-            };
-
-            statusBar.innerHTML = `
-                <div class="status-item">
-                    <span class="status-value ${aiSystemData.combined_health === 'OPTIMAL' ? 'status-online' : 'status-offline'}"
-                          data-tooltip="ai-system-status" data-tooltip-data='${JSON.stringify(aiSystemData).replace(/'/g, "&apos;")}'>
-                        ${aiSystemData.combined_health}
-                    </span>
-                    <label>AI System Status</label>
-                </div>
-                <div class="status-item">
-                    <span class="status-value" data-tooltip="daily-activity"
-                          data-tooltip-data='${JSON.stringify(orchestrationData).replace(/'/g, "&apos;")}'>
-                        ${orchestrationData.handoffs_today + orchestrationData.subagents_today}
-                    </span>
-                    <label>Today's AI Activity</label>
-                </div>
-                <div class="status-item">
-                    <span class="status-value status-online" data-tooltip="cost-optimization"
-                          data-tooltip-data='${JSON.stringify(costOptimizationData).replace(/'/g, "&apos;")}'>
-                        ${costOptimizationData.optimization_rate}%
-                    </span>
-                    <label>Cost Optimization Rate</label>
-                </div>
-                <div class="status-item">
-                    <span class="status-value" data-tooltip="system-health"
-                          data-tooltip-data='${JSON.stringify(systemHealthData).replace(/'/g, "&apos;")}'>
-                        ${systemHealthData.success_rate}%
-                    </span>
-                    <label>System Health Score</label>
-                </div>
-                <div class="status-item">
-                    <span class="status-value status-online" data-tooltip="daily-impact"
-                          data-tooltip-data='${JSON.stringify(todayImpactData).replace(/'/g, "&apos;")}'>
-                        $${(data.savings_today || 0).toFixed(2)}
-                    </span>
-                    <label>Today's AI Savings</label>
-                </div>
-            `;
-
-                console.log('Status bar updated successfully');
-            } catch (error) {
-                console.error('Error loading system status:', error);
-                const statusBar = document.getElementById('statusBar');
-                if (statusBar) {
-                    statusBar.innerHTML = `
-                        <div class="status-item">
-                            <span class="status-value status-offline">ERROR</span>
-                            <label>System Status</label>
-                        </div>
-                        <div class="status-item">
-                            <span class="status-value">--</span>
-                            <label>Loading...</label>
-                        </div>
-                        <div class="status-item">
-                            <span class="status-value">--</span>
-                            <label>Please Refresh</label>
-                        </div>
-                    `;
-                }
-            }
-        }
-
-        async function loadHandoffAnalytics() {
-            const response = await fetch('/api/handoff-analytics');
-            const data = await response.json();
-
-            const metrics = document.getElementById('handoffMetrics');
-            const handoffBreakdown = {
-                total: data.total_handoffs || 0,
-                deepseek: data.deepseek_handoffs || 0,
-                claude: data.claude_handoffs || 0
-            };
-            const successBreakdown = {
-                success_rate: data.success_rate || 0,
-                successful: data.successful_handoffs || 0,
-                failed: data.failed_handoffs || 0
-            };
-            const confidenceBreakdown = {
-                avg: data.avg_confidence || 0,
-                min: data.min_confidence || 0,
-                max: data.max_confidence || 1.0
-            };
-
-            metrics.innerHTML = `
-                <div class="metric">
-                    <span class="metric-label">Total Handoffs</span>
-                    <span class="metric-value" data-tooltip="total-handoffs"
-                          data-tooltip-data='${JSON.stringify(handoffBreakdown).replace(/'/g, "&apos;")}'>
-                        ${data.total_handoffs || 0}
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">DeepSeek Usage</span>
-                    <span class="metric-value model-deepseek" data-tooltip="deepseek-usage"
-                          data-tooltip-data='${JSON.stringify(handoffBreakdown).replace(/'/g, "&apos;")}'>
-                        ${((data.deepseek_handoffs / Math.max(data.total_handoffs, 1)) * 100).toFixed(1)}%
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Success Rate</span>
-                    <span class="metric-value success" data-tooltip="handoff-success-rate"
-                          data-tooltip-data='${JSON.stringify(successBreakdown).replace(/'/g, "&apos;")}'>
-                        ${(data.success_rate || 0).toFixed(1)}%
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Avg Confidence</span>
-                    <span class="metric-value" data-tooltip="avg-confidence"
-                          data-tooltip-data='${JSON.stringify(confidenceBreakdown).replace(/'/g, "&apos;")}'>
-                        ${(data.avg_confidence || 0).toFixed(2)}
-                    </span>
+    <!-- Row, item and tile skeletons cloned by dashboard.js; they are filled via textContent -->
+    <template id="activityRowTpl"><tr><td></td><td></td><td></td><td></td><td></td><td></td><td></td><td></td></tr></template>
+    <template id="projectCardTpl">
+        <div class="project-card">
+            <div class="project-header">
+                <div class="project-info">
+                    <h4 class="project-name"></h4>
+                    <div class="project-stats"><span class="project-totals"></span><br><small class="project-dates"></small></div>
                 </div>
-            `;
-
-            // Update handoff chart
-            updateHandoffChart(data);
-        }
-
-        async function loadSubagentAnalytics() {
-            const response = await fetch('/api/subagent-analytics');
-            const data = await response.json();
-
-            const metrics = document.getElementById('subagentMetrics');
-            const topAgent = data.usage_statistics?.[0];
-
-            const uniqueAgentData = {
-                unique_agents: data.patterns?.unique_agents_used || 0,
-                total_invocations: data.patterns?.total_invocations || 0,
-                most_active: topAgent?.agent_name || 'N/A'
-            };
-
-            const invocationData = {
-                total: data.patterns?.total_invocations || 0,
-                success_rate: data.patterns?.overall_success_rate || 0,
-                avg_duration: data.patterns?.avg_execution_time || 0
-            };
-
-            const mostUsedAgentData = {
-                name: topAgent?.agent_name || 'N/A',
-                count: topAgent?.count || 0,
-                success_rate: topAgent?.success_rate || 0,
-                specialization: topAgent?.specialization || 'General purpose'
-            };
-
-            metrics.innerHTML = `
-                <div class="metric">
-                    <span class="metric-label">Unique Agents Used</span>
-                    <span class="metric-value" data-tooltip="unique-agents"
-                          data-tooltip-data='${JSON.stringify(uniqueAgentData).replace(/'/g, "&apos;")}'>
-                        ${data.patterns?.unique_agents_used || 0}
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Total Invocations</span>
-                    <span class="metric-value" data-tooltip="subagent-invocations"
-                          data-tooltip-data='${JSON.stringify(invocationData).replace(/'/g, "&apos;")}'>
-                        ${data.patterns?.total_invocations || 0}
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Most Used Agent</span>
-                    <span class="metric-value" data-tooltip="most-used-agent"
-                          data-tooltip-data='${JSON.stringify(mostUsedAgentData).replace(/'/g, "&apos;")}'>
-                        ${topAgent?.agent_name || 'None'}
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Avg Success Rate</span>
-                    <span class="metric-value success" data-tooltip="most-used-agent"
-                          data-tooltip-data='${JSON.stringify(mostUsedAgentData).replace(/'/g, "&apos;")}'>
-                        ${topAgent ? topAgent.success_rate.toFixed(1) : 0}%
-                    </span>
-                </div>
-            `;
-
-            // Update subagent chart
-            updateSubagentChart(data);
-        }
-
-        async function loadCostAnalytics() {
-            const response = await fetch('/api/cost-analytics');
-            const data = await response.json();
-
-            const metrics = document.getElementById('costMetrics');
-
-            const costBreakdown = {
-                total: data.monthly_cost || 0,
-                claude_cost: data.claude_cost || 0,
-                deepseek_cost: data.deepseek_cost || 0,
-                pure_claude_cost: data.pure_claude_cost || (data.monthly_cost + data.monthly_savings) || 0
-            };
-
-            const savingsBreakdown = {
-                total_savings: data.monthly_savings || 0,
-                deepseek_savings: data.deepseek_savings || data.monthly_savings || 0,
-                reduction_percent: data.cost_reduction_percent || 0,
-                roi: 'Infinite'
-            };
-
-            const optimizationData = {
-                rate: data.optimization_rate || 0
-            };
-
-            metrics.innerHTML = `
-                <div class="metric">
-                    <span class="metric-label">Monthly Cost</span>
-                    <span class="metric-value" data-tooltip="monthly-cost"
-                          data-tooltip-data='${JSON.stringify(costBreakdown).replace(/'/g, "&apos;")}'>
-                        $${(data.monthly_cost || 0).toFixed(2)}
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Monthly Savings</span>
-                    <span class="metric-value status-online" data-tooltip="monthly-savings"
-                          data-tooltip-data='${JSON.stringify(savingsBreakdown).replace(/'/g, "&apos;")}'>
-                        $${(data.monthly_savings || 0).toFixed(2)}
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Optimization Rate</span>
-                    <span class="metric-value" data-tooltip="optimization-rate"
-                          data-tooltip-data='${JSON.stringify(optimizationData).replace(/'/g, "&apos;")}'>
-                        ${(data.optimization_rate || 0).toFixed(1)}%
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Projected Annual</span>
-                    <span class="metric-value status-online" data-tooltip="monthly-savings"
-                          data-tooltip-data='${JSON.stringify({...savingsBreakdown, annual_savings: (data.monthly_savings || 0) * 12}).replace(/'/g, "&apos;")}'>
-                        $${((data.monthly_savings || 0) * 12).toFixed(0)}
-                    </span>
-                </div>
-            `;
-
-            // Update cost chart
-            updateCostChart(data);
-        }
-
-        async function loadPerformanceMetrics() {
-            const response = await fetch('/api/performance-metrics');
-            const data = await response.json();
-
-            const metrics = document.getElementById('performanceMetrics');
-
-            const responseTimeData = {
-                avg: data.avg_response_time || 0,
-                p95: data.p95_response_time || 0
-            };
-
-            const deepseekResponseData = {
-                response_time: data.deepseek_response_time || 0,
-                claude_time: data.claude_response_time || 0,
-                availability: data.deepseek_availability || 0
-            };
-
-            const uptimeData = {
-                uptime: data.uptime || 0,
-                downtime_events: data.downtime_events || 0,
-                last_restart: data.last_restart || 'N/A'
-            };
-
-            const errorData = {
-                rate: data.error_rate || 0,
-                total_errors: data.total_errors || 0,
-                most_common: data.most_common_error || 'Connection timeout'
-            };
-
-            metrics.innerHTML = `
-                <div class="metric">
-                    <span class="metric-label">Avg Response Time</span>
-                    <span class="metric-value" data-tooltip="response-time"
-                          data-tooltip-data='${JSON.stringify(responseTimeData).replace(/'/g, "&apos;")}'>
-                        ${(data.avg_response_time || 0).toFixed(2)}s
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">DeepSeek Response</span>
-                    <span class="metric-value" data-tooltip="deepseek-response"
-                          data-tooltip-data='${JSON.stringify(deepseekResponseData).replace(/'/g, "&apos;")}'>
-                        ${(data.deepseek_response_time || 0).toFixed(2)}s
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">System Uptime</span>
-                    <span class="metric-value success" data-tooltip="system-uptime"
-                          data-tooltip-data='${JSON.stringify(uptimeData).replace(/'/g, "&apos;")}'>
-                        ${(data.uptime || 0).toFixed(1)}%
-                    </span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">Error Rate</span>
-                    <span class="metric-value ${data.error_rate > 5 ? 'error' : 'success'}" data-tooltip="error-rate"
-                          data-tooltip-data='${JSON.stringify(errorData).replace(/'/g, "&apos;")}'>
-                        ${(data.error_rate || 0).toFixed(1)}%
-                    </span>
-                </div>
-            `;
-        }
-
-        async function loadAccountTransitionAnalysis() {
-            try {
-                const response = await fetch('/api/account-transition-analysis');
-                const data = await response.json();
-
-                if (data.transition_projection) {
-                    const projection = data.transition_projection;
-                    const metrics = document.getElementById('accountTransitionMetrics');
-
-                    // Status color based on readiness
-                    const readinessColor = projection.transition_readiness === 'ready' ? '#10B981' :
-                                         projection.transition_readiness === 'approaching' ? '#F59E0B' : '#EF4444';
-
-                    const transitionStatusData = {
-                        status: projection.transition_readiness,
-                        deepseek_usage: projection.deepseek_utilization_ratio * 100,
-                        readiness_score: projection.effectiveness_score * 100
-                    };
-
-                    const effectivenessData = {
-                        score: projection.effectiveness_score * 100,
-                        quality_maintained: projection.quality_maintained || true,
-                        cost_reduction: projection.cost_reduction_percent || 0
-                    };
-
-                    const savingsProjectionData = {
-                        monthly_savings: projection.potential_monthly_savings,
-                        annual_savings: projection.potential_monthly_savings * 12,
-                        current_usage: projection.deepseek_utilization_ratio * 100,
-                        target_usage: 90
-                    };
-
-                    metrics.innerHTML = `
-                        <div class="metric">
-                            <span class="metric-label">Transition Status</span>
-                            <span class="metric-value" style="color: ${readinessColor}" data-tooltip="transition-status"
-                                  data-tooltip-data='${JSON.stringify(transitionStatusData).replace(/'/g, "&apos;")}'>
-                                ${projection.transition_readiness.toUpperCase()}
-                            </span>
-                        </div>
-                        <div class="metric">
-                            <span class="metric-label">DeepSeek Utilization</span>
-                            <span class="metric-value" data-tooltip="transition-status"
-                                  data-tooltip-data='${JSON.stringify(transitionStatusData).replace(/'/g, "&apos;")}'>
-                                ${(projection.deepseek_utilization_ratio * 100).toFixed(1)}%
-                            </span>
-                        </div>
-                        <div class="metric">
-                            <span class="metric-label">Effectiveness Score</span>
-                            <span class="metric-value success" data-tooltip="effectiveness-score"
-                                  data-tooltip-data='${JSON.stringify(effectivenessData).replace(/'/g, "&apos;")}'>
-                                ${(projection.effectiveness_score * 100).toFixed(1)}%
-                            </span>
-                        </div>
-                        <div class="metric">
-                            <span class="metric-label">Potential Monthly Savings</span>
-                            <span class="metric-value success" data-tooltip="monthly-savings"
-                                  data-tooltip-data='${JSON.stringify(savingsProjectionData).replace(/'/g, "&apos;")}'>
-                                $${projection.potential_monthly_savings.toFixed(0)}
-                            </span>
-                        </div>
-                        <div class="recommendation-box" style="margin-top: 15px; padding: 12px; background: rgba(16, 185, 129, 0.1); border-left: 4px solid #10B981; border-radius: 4px;">
-                            <strong>Recommendation:</strong><br>
-                            <span style="font-size: 13px;">${projection.recommendation}</span>
-                        </div>
-                    `;
-
-                    // Create transition projection chart
-                    updateTransitionChart(projection);
-                }
-            } catch (error) {
-                console.error('Error loading account transition analysis:', error);
-                const metrics = document.getElementById('accountTransitionMetrics');
-                metrics.innerHTML = '<div class="error">Error loading transition analysis</div>';
-            }
-        }
-
-        function updateTransitionChart(projection) {
-            const ctx = document.getElementById('transitionChart').getContext('2d');
-
-            new Chart(ctx, {
-                type: 'doughnut',
-                data: {
-                    labels: ['DeepSeek Usage', 'Claude Usage'],
-                    datasets: [{
-                        data: [
-                            projection.deepseek_utilization_ratio * 100,
-                            (1 - projection.deepseek_utilization_ratio) * 100
-                        ],
-                        backgroundColor: ['#10B981', '#667eea'],
-                        borderWidth: 2,
-                        borderColor: '#ffffff'
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        title: {
-                            display: true,
-                            text: 'Current Usage Distribution',
-                            font: { size: 14, weight: 'bold' }
-                        },
-                        legend: {
-                            position: 'bottom',
-                            labels: { padding: 20, usePointStyle: true }
-                        }
-                    }
-                }
-            });
-        }
-
-        // Security: HTML escaping function to prevent XSS
-        function escapeHtml(unsafe) {
-            if (typeof unsafe !== 'string') return unsafe;
-            return unsafe
-                .replace(/&/g, "&amp;")
-                .replace(/</g, "&lt;")
-                .replace(/>/g, "&gt;")
-                .replace(/"/g, "&quot;")
-                .replace(/'/g, "&#039;");
-        }
-
-        async function loadRecentActivity(page = 1) {
-            try {
-                const response = await fetch(`/api/recent-activity?page=${page}&limit=50`);
-                const data = await response.json();
-
-                if (data.status === 'success') {
-                    currentActivityPage = page;
-                    activityPagination = data.pagination;
-
-                    const tbody = document.getElementById('activityBody');
-                    tbody.innerHTML = data.activities.map(activity => {
-                        // Determine data quality/type
-                        const isHistorical = activity.session_id?.startsWith('migrated_');
-                        const isOld = new Date() - new Date(activity.timestamp) > 24 * 60 * 60 * 1000; // Older than 24 hours
-                        const dataQualityClass = isHistorical ? 'historical-data' : (isOld ? 'old-data' : 'recent-data');
-                        const dataQualityIndicator = isHistorical ? ' 📁' : (isOld ? ' ⏰' : ' 🟢');
-
-                        return `
-                        <tr class="${dataQualityClass}">
-                            <td>${new Date(activity.timestamp).toLocaleString()}${dataQualityIndicator}</td>
-                            <td>${escapeHtml(activity.session_id?.substring(0, 8)) || 'N/A'}</td>
-                            <td>${escapeHtml(activity.event_type)}</td>
-                            <td class="model-${escapeHtml(activity.model_or_agent?.toLowerCase()) || ''}">${escapeHtml(activity.model_or_agent) || 'Unknown'}</td>
-                            <td>${escapeHtml(activity.description?.substring(0, 50)) || ''}${activity.description?.length > 50 ? '...' : ''}</td>
-                            <td class="${escapeHtml(activity.status)}">${escapeHtml(activity.status)}</td>
-                            <td>$${(activity.cost || 0).toFixed(3)}</td>
-                            <td>${escapeHtml(activity.project_name) || 'Unknown'}</td>
-                        </tr>
-                        `;
-                    }).join('');
-
-                    // Update pagination info
-                    updateActivityPagination();
-                } else {
-                    console.error('Error loading recent activity:', data.error);
-                    const tbody = document.getElementById('activityBody');
-                    tbody.innerHTML = '<tr><td colspan="7" style="text-align: center; color: #ff6b6b;">Error loading activity data</td></tr>';
-                }
-            } catch (error) {
-                console.error('Error fetching recent activity:', error);
-                const tbody = document.getElementById('activityBody');
-                tbody.innerHTML = '<tr><td colspan="7" style="text-align: center; color: #ff6b6b;">Error loading activity data</td></tr>';
-            }
-        }
-
-        function updateActivityPagination() {
-            if (!activityPagination) return;
-
-            const paginationInfo = document.getElementById('paginationInfo');
-            const pageInfo = document.getElementById('pageInfo');
-            const prevBtn = document.getElementById('prevBtn');
-            const nextBtn = document.getElementById('nextBtn');
-
-            // Update info text
-            const start = ((currentActivityPage - 1) * 50) + 1;
-            const end = Math.min(currentActivityPage * 50, activityPagination.total_count);
-            paginationInfo.textContent = `Showing ${start}-${end} of ${activityPagination.total_count} activities`;
-
-            // Update page info
-            pageInfo.textContent = `Page ${currentActivityPage} of ${activityPagination.total_pages}`;
-
-            // Update button states
-            prevBtn.disabled = !activityPagination.has_previous;
-            nextBtn.disabled = !activityPagination.has_next;
-        }
-
-        function loadActivityPage(direction) {
-            if (isProjectView) {
-                if (!projectPagination) return;
-                let newPage = currentProjectPage;
-                if (direction === 'next' && projectPagination.has_next) {
-                    newPage = currentProjectPage + 1;
-                } else if (direction === 'prev' && projectPagination.has_previous) {
-                    newPage = currentProjectPage - 1;
-                }
-                if (newPage !== currentProjectPage) {
-                    loadProjectGroupedActivity(newPage);
-                }
-            } else {
-                if (!activityPagination) return;
-                let newPage = currentActivityPage;
-                if (direction === 'next' && activityPagination.has_next) {
-                    newPage = currentActivityPage + 1;
-                } else if (direction === 'prev' && activityPagination.has_previous) {
-                    newPage = currentActivityPage - 1;
-                }
-                if (newPage !== currentActivityPage) {
-                    loadRecentActivity(newPage);
-                }
-            }
-        }
-
-        // New activity management functions
-        async function loadActivityData() {
-            if (isProjectView) {
-                await loadProjectGroupedActivity();
-            } else {
-                await loadRecentActivity();
-            }
-        }
-
-        async function loadProjectGroupedActivity(page = 1) {
-            try {
-                const response = await fetch(`/api/project-grouped-activity?page=${page}&limit=10`);
-                const data = await response.json();
-
-                if (data.status === 'success') {
-                    currentProjectPage = page;
-                    projectPagination = data.pagination;
-
-                    const container = document.getElementById('projectGroupedView');
-                    container.innerHTML = data.projects.map(project => `
-                        <div class="project-card">
-                            <div class="project-header" onclick="toggleProject('${project.project_name}')">
-                                <div class="project-info">
-                                    <h4 class="project-name">${project.project_name}</h4>
-                                    <div class="project-stats">
-                                        ${project.session_count} sessions •
-                                        ${project.total_handoffs} handoffs •
-                                        ${project.total_subagents} subagents •
-                                        ${project.success_rate}% success •
-                                        $${project.total_cost} total cost
-                                        <br>
-                                        <small>${formatDateRange(project.earliest_session, project.latest_session)}</small>
-                                    </div>
-                                </div>
-                                <div class="project-expand-icon" id="icon-${project.project_name}">▼</div>
-                            </div>
-                            <div class="project-activities" id="activities-${project.project_name}">
-                                ${renderProjectActivities(project)}
-                            </div>
-                        </div>
-                    `).join('');
-
-                    updatePagination();
-                } else {
-                    console.error('Error loading project activity:', data.error);
-                    const container = document.getElementById('projectGroupedView');
-                    container.innerHTML = '<div style="text-align: center; color: #ff6b6b; padding: 20px;">Error loading project activity data</div>';
-                }
-            } catch (error) {
-                console.error('Error fetching project activity:', error);
-                const container = document.getElementById('projectGroupedView');
-                container.innerHTML = '<div style="text-align: center; color: #ff6b6b; padding: 20px;">Error loading project activity data</div>';
-            }
-        }
-
-        function renderProjectActivities(project) {
-            let html = '';
-
-            // Handoffs section
-            if (project.handoffs && project.handoffs.length > 0) {
-                html += `
-                    <div class="activity-group">
-                        <div class="activity-group-title">Model Handoffs (${project.handoffs.length})</div>
-                        ${project.handoffs.map(handoff => `
-                            <div class="activity-item handoff">
-                                <div class="activity-details">
-                                    <div class="activity-meta">
-                                        ${new Date(handoff.timestamp).toLocaleString()} •
-                                        Session: ${handoff.session_id?.substring(0, 8)} •
-                                        Confidence: ${(handoff.confidence_score || 0).toFixed(2)}
-                                    </div>
-                                    <div class="activity-description">${handoff.task_description}</div>
-                                </div>
-                                <div style="display: flex; align-items: center;">
-                                    <span class="activity-badge ${handoff.status}">${handoff.status}</span>
-                                    <span class="activity-cost">$${(handoff.cost || 0).toFixed(3)}</span>
-                                </div>
-                            </div>
-                        `).join('')}
-                    </div>
-                `;
-            }
-
-            // Subagents section
-            if (project.subagents && project.subagents.length > 0) {
-                html += `
-                    <div class="activity-group">
-                        <div class="activity-group-title">Subagent Invocations (${project.subagents.length})</div>
-                        ${project.subagents.map(subagent => `
-                            <div class="activity-item subagent">
-                                <div class="activity-details">
-                                    <div class="activity-meta">
-                                        ${new Date(subagent.timestamp).toLocaleString()} •
-                                        Session: ${subagent.session_id?.substring(0, 8)} •
-                                        Agent: ${subagent.agent_name}
-                                        ${subagent.execution_time ? ` • ${subagent.execution_time.toFixed(1)}s` : ''}
-                                    </div>
-                                    <div class="activity-description">${subagent.task_description}</div>
-                                </div>
-                                <div style="display: flex; align-items: center;">
-                                    <span class="activity-badge ${subagent.status}">${subagent.status}</span>
-                                    <span class="activity-cost">$${(subagent.cost || 0).toFixed(3)}</span>
-                                </div>
-                            </div>
-                        `).join('')}
-                    </div>
-                `;
-            }
-
-            if (!html) {
-                html = '<div style="text-align: center; color: #718096; padding: 20px;">No handoffs or subagent activities found for this project.</div>';
-            }
-
-            return html;
-        }
-
-        function formatDateRange(earliest, latest) {
-            const early = new Date(earliest);
-            const late = new Date(latest);
-
-            if (early.toDateString() === late.toDateString()) {
-                return `${early.toLocaleDateString()}`;
-            } else {
-                return `${early.toLocaleDateString()} - ${late.toLocaleDateString()}`;
-            }
-        }
-
-        function toggleProject(projectName) {
-            const activities = document.getElementById(`activities-${projectName}`);
-            const icon = document.getElementById(`icon-${projectName}`);
-            const header = activities.previousElementSibling;
-
-            if (activities.classList.contains('expanded')) {
-                activities.classList.remove('expanded');
-                icon.classList.remove('expanded');
-                header.classList.remove('expanded');
-            } else {
-                activities.classList.add('expanded');
-                icon.classList.add('expanded');
-                header.classList.add('expanded');
-            }
-        }
-
-        function toggleActivityView() {
-            const toggleBtn = document.getElementById('toggleViewBtn');
-            const projectView = document.getElementById('projectGroupedView');
-            const flatView = document.getElementById('flatActivityView');
-
-            if (isProjectView) {
-                // Switch to flat view
-                projectView.style.display = 'none';
-                flatView.style.display = 'block';
-                toggleBtn.textContent = 'Switch to Project View';
-                isProjectView = false;
-                loadRecentActivity(1);
-            } else {
-                // Switch to project view
-                flatView.style.display = 'none';
-                projectView.style.display = 'block';
-                toggleBtn.textContent = 'Switch to Flat View';
-                isProjectView = true;
-                loadProjectGroupedActivity(1);
-            }
-        }
-
-        function updatePagination() {
-            if (isProjectView && projectPagination) {
-                updateProjectPagination();
-            } else if (!isProjectView && activityPagination) {
-                updateActivityPagination();
-            }
-        }
-
-        function updateProjectPagination() {
-            const paginationInfo = document.getElementById('paginationInfo');
-            const pageInfo = document.getElementById('pageInfo');
-            const prevBtn = document.getElementById('prevBtn');
-            const nextBtn = document.getElementById('nextBtn');
-
-            // Update info text
-            const start = ((currentProjectPage - 1) * 10) + 1;
-            const end = Math.min(currentProjectPage * 10, projectPagination.total_count);
-            paginationInfo.textContent = `Showing ${start}-${end} of ${projectPagination.total_count} projects`;
-
-            // Update page info
-            pageInfo.textContent = `Page ${currentProjectPage} of ${projectPagination.total_pages}`;
-
-            // Update buttons
-            prevBtn.disabled = !projectPagination.has_previous;
-            nextBtn.disabled = !projectPagination.has_next;
-        }
-
-        function updateHandoffChart(data) {
-            const ctx = document.getElementById('handoffChart').getContext('2d');
-
-            if (charts.handoff) {
-                charts.handoff.destroy();
-            }
-
-            charts.handoff = new Chart(ctx, {
-                type: 'doughnut',
-                data: {
-                    labels: ['DeepSeek', 'Claude'],
-                    datasets: [{
-                        data: [data.deepseek_handoffs || 0, data.claude_handoffs || 0],
-                        backgroundColor: ['#22c55e', '#3b82f6'],
-                        borderWidth: 0
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: {
-                            position: 'bottom'
-                        }
-                    }
-                }
-            });
-        }
-
-        function updateSubagentChart(data) {
-            const ctx = document.getElementById('subagentChart').getContext('2d');
-
-            if (charts.subagent) {
-                charts.subagent.destroy();
-            }
-
-            const agents = data.usage_statistics?.slice(0, 5) || [];
-
-            charts.subagent = new Chart(ctx, {
-                type: 'bar',
-                data: {
-                    labels: agents.map(a => a.agent_name?.replace(/-/g, ' ') || 'Unknown'),
-                    datasets: [{
-                        label: 'Invocations',
-                        data: agents.map(a => a.invocation_count || 0),
-                        backgroundColor: '#667eea',
-                        borderColor: '#764ba2',
-                        borderWidth: 1
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    scales: {
-                        y: {
-                            beginAtZero: true
-                        }
-                    },
-                    plugins: {
-                        legend: {
-                            display: false
-                        }
-                    }
-                }
-            });
-        }
-
-        function updateCostChart(data) {
-            const ctx = document.getElementById('costChart').getContext('2d');
-
-            if (charts.cost) {
-                charts.cost.destroy();
-            }
-
-            charts.cost = new Chart(ctx, {
-                type: 'line',
-                data: {
-                    labels: data.daily_data?.map(d => new Date(d.date).toLocaleDateString()) || [],
-                    datasets: [{
-                        label: 'Cost',
-                        data: data.daily_data?.map(d => d.cost) || [],
-                        borderColor: '#ef4444',
-                        backgroundColor: 'rgba(239, 68, 68, 0.1)',
-                        fill: true
-                    }, {
-                        label: 'Savings',
-                        data: data.daily_data?.map(d => d.savings) || [],
-                        borderColor: '#22c55e',
-                        backgroundColor: 'rgba(34, 197, 94, 0.1)',
-                        fill: true
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    scales: {
-                        y: {
-                            beginAtZero: true
-                        }
-                    }
-                }
-            });
-        }
+                <div class="project-expand-icon">▼</div>
+            </div>
+            <div class="project-activities"></div>
+        </div>
+    </template>
+    <template id="metricTpl"><div class="metric"><span class="metric-label"></span><span class="metric-value"></span></div></template>
+    <template id="statusItemTpl"><div class="status-item"><span class="status-value"></span><label></label></div></template>
+    <template id="recommendationTpl">
+        <div class="recommendation-box" style="margin-top: 15px; padding: 12px; background: rgba(16, 185, 129, 0.1); border-left: 4px solid #10B981; border-radius: 4px;">
+            <strong>Recommendation:</strong><br>
+            <span class="recommendation-text" style="font-size: 13px;"></span>
+        </div>
+    </template>
+    <template id="activityGroupTpl"><div class="activity-group"><div class="activity-group-title"></div></div></template>
+    <template id="activityItemTpl">
+        <div class="activity-item">
+            <div class="activity-details">
+                <div class="activity-meta"></div>
+                <div class="activity-description"></div>
+            </div>
+            <div style="display: flex; align-items: center;">
+                <span class="activity-badge"></span>
+                <span class="activity-cost"></span>
+            </div>
+        </div>
+    </template>
 
-        function toggleAutoRefresh() {
-            const toggle = document.getElementById('autoRefreshToggle');
-            const indicator = document.getElementById('liveIndicator');
-
-            isAutoRefresh = !isAutoRefresh;
-
-            if (isAutoRefresh) {
-                toggle.classList.add('active');
-                indicator.style.display = 'inline-block';
-                autoRefreshInterval = setInterval(refreshAll, 30000); // 30 seconds
-            } else {
-                toggle.classList.remove('active');
-                indicator.style.display = 'none';
-                if (autoRefreshInterval) {
-                    clearInterval(autoRefreshInterval);
-                }
-            }
-        }
+    <!-- Tooltip skeletons; only their data-slot spans are filled in -->
+    {{ tooltip_templates }}
 
-        function updateLiveIndicator() {
-            const indicator = document.getElementById('liveIndicator');
-            if (isAutoRefresh) {
-                indicator.style.animation = 'none';
-                setTimeout(() => {
-                    indicator.style.animation = 'pulse 2s infinite';
-                }, 10);
-            }
-        }
-    </script>
+    <script defer src="{{ dashboard_js_url }}"></script>
 </body>
 </html>
     """
-    return template
+    page = (template
+            .replace('{{ chart_js_tags }}', chart_tags)
+            .replace('{{ dashboard_css_url }}', static_asset_url('dashboard.css'))
+            .replace('{{ dashboard_js_url }}', static_asset_url('dashboard.js'))
+            .replace('{{ tooltip_templates }}', render_tooltip_templates())
+            .encode('utf-8'))
+    return precompress(page)
+
+@app.route("/")
+async def dashboard():
+    """Main orchestration analytics dashboard"""
+    # The page preloads /api/bootstrap; start building it while the page is sent
+    start_bootstrap_warmup()
+    return precompressed_response(render_dashboard(chart_js_tags()), 'text/html', 'public, max-age=60')
+
+@app.route("/assets/<filename>")
+async def dashboard_asset(filename):
+    """Dashboard CSS/JS, minified and precompressed in memory"""
+    if filename not in DASHBOARD_ASSETS:
+        return Response(b'', status=404)
+    mimetype, _ = DASHBOARD_ASSETS[filename]
+    # The page links assets with a ?v= content hash, so a given URL never changes
+    return precompressed_response(load_dashboard_asset(filename), mimetype,
+                                  'public, max-age=31536000, immutable')
+
+@app.before_serving
+async def prerender_dashboard():
+    """Encode and compress the page and its assets at startup so the first visitor doesn't pay for it"""
+    render_dashboard(chart_js_tags())
 
 # API Endpoints
-@app.route("/api/system-status")
-async def system_status():
-    """Get current system status with comprehensive Claude Code + DeepSeek metrics"""
-    deepseek_health = deepseek_client.get_health_status()
-
-    # Get today's actual activity using proper SQLite date functions
-    today_sessions = db.conn.execute("""
-        SELECT COUNT(*) FROM orchestration_sessions
-        WHERE DATE(start_time) = DATE('now', 'localtime')
-    """).fetchone()[0]
-
-    today_handoffs = db.conn.execute("""
-        SELECT COUNT(*) FROM handoff_events
-        WHERE DATE(timestamp) = DATE('now', 'localtime')
-    """).fetchone()[0]
-
-    today_subagents = db.conn.execute("""
-        SELECT COUNT(*) FROM subagent_invocations
-        WHERE DATE(timestamp) = DATE('now', 'localtime')
-    """).fetchone()[0]
-
-    # Calculate today's savings (estimated based on handoffs to DeepSeek)
-    deepseek_handoffs_today = db.conn.execute("""
-        SELECT COUNT(*) FROM handoff_events
-        WHERE DATE(timestamp) = DATE('now', 'localtime') AND target_model = 'deepseek'
-    """).fetchone()[0]
+def system_status_payload(deepseek_health: Dict, today_counts: Dict) -> Dict:
+    """Build the system status tile from DeepSeek health and today's activity counts"""
+    today_sessions = today_counts['sessions']
+    today_handoffs = today_counts['handoffs']
+    today_subagents = today_counts['subagents']
+    deepseek_handoffs_today = today_counts['deepseek_handoffs']
 
     # Estimate savings: ~$0.015 per DeepSeek handoff (average task cost saved)
     estimated_savings = deepseek_handoffs_today * 0.015
@@ -2507,7 +840,7 @@ async def system_status():
         'orchestration_active': True
     }
 
-    return jsonify({
+    return {
         'claude': claude_status,
         'deepseek': deepseek_health,
         'active_sessions': today_sessions,
@@ -2516,46 +849,177 @@ async def system_status():
         'savings_today': estimated_savings,
         'deepseek_handoffs_today': deepseek_handoffs_today,
         'combined_health': 'optimal' if (claude_status['available'] and deepseek_health['available']) else 'degraded'
-    })
+    }
+
+def performance_metrics_payload(deepseek_health: Dict) -> Dict:
+    """Build the performance metrics tile from DeepSeek health"""
+    return {
+        'avg_response_time': 1.8,
+        'deepseek_response_time': deepseek_health.get('response_time', 0),
+        'uptime': 99.2,
+        'error_rate': 2.1
+    }
+
+def format_pct(value: Any) -> str:
+    """Format a percentage to one decimal for display, so clients never run toFixed"""
+    return f"{value or 0:.1f}"
+
+def load_handoff_analytics() -> Dict:
+    """Get handoff analytics with the tile percentages precomputed"""
+    analytics = db.get_handoff_analytics()
+    total = analytics.get('total_handoffs') or 0
+    deepseek = analytics.get('deepseek_handoffs') or 0
+    analytics['deepseek_pct'] = format_pct(deepseek * 100.0 / total if total else 0)
+    analytics['success_pct'] = format_pct(analytics.get('success_rate'))
+    return analytics
+
+def load_subagent_analytics() -> Dict:
+    """Get subagent usage analytics with per-agent success percentages precomputed"""
+    analytics = subagent_tracker.get_agent_usage_analytics()
+    for stat in analytics['usage_statistics']:
+        stat['success_pct'] = format_pct(stat.get('success_rate'))
+    return analytics
+
+async def load_account_transition() -> Dict:
+    """Get the account transition analysis, cached between dashboard refreshes"""
+    return await dashboard_cache.get('account_transition', CACHE_TTLS['account_transition'], _load_account_transition)
+
+async def _load_account_transition() -> Dict:
+    """Run the transition projection and daily account analysis queries concurrently"""
+    projection, recent_analysis = await asyncio.gather(
+        run_blocking(db.get_account_transition_projection),
+        run_blocking(db.get_claude_account_analysis, period_type='daily', limit=30)
+    )
+    return {
+        'transition_projection': projection,
+        'historical_analysis': recent_analysis,
+        'status': 'success'
+    }
+
+@app.route("/api/system-status")
+async def system_status():
+    """Get current system status with comprehensive Claude Code + DeepSeek metrics"""
+    async def build() -> Dict:
+        deepseek_health, today_counts = await asyncio.gather(
+            cached('deepseek_health', deepseek_client.get_health_status),
+            cached('today_counts', db.get_today_activity_counts)
+        )
+        return system_status_payload(deepseek_health, today_counts)
+
+    return await cached_json('system_status', CACHE_TTLS['today_counts'], build)
 
 @app.route("/api/handoff-analytics")
 async def handoff_analytics():
     """Get handoff analytics data"""
-    analytics = db.get_handoff_analytics()
-    return jsonify(analytics)
+    return await cached_json('handoff_analytics', CACHE_TTLS['handoff_analytics'],
+                             lambda: cached('handoff_analytics', load_handoff_analytics))
 
 @app.route("/api/subagent-analytics")
 async def subagent_analytics():
     """Get subagent usage analytics"""
-    analytics = subagent_tracker.get_agent_usage_analytics()
-    return jsonify(analytics)
+    return await cached_json('subagent_analytics', CACHE_TTLS['subagent_analytics'],
+                             lambda: cached('subagent_analytics', load_subagent_analytics))
 
 @app.route("/api/cost-analytics")
 async def cost_analytics():
     """Get cost optimization analytics"""
-    # Placeholder implementation
-    return jsonify({
-        'monthly_cost': 15.50,
-        'monthly_savings': 185.20,
-        'optimization_rate': 92.3,
-        'daily_data': [
-            {'date': '2025-01-13', 'cost': 0.85, 'savings': 8.20},
-            {'date': '2025-01-14', 'cost': 1.20, 'savings': 12.50},
-            {'date': '2025-01-15', 'cost': 0.95, 'savings': 15.80}
-        ]
-    })
+    try:
+        return await cached_json('cost_analytics', CACHE_TTLS['cost_analytics'],
+                                 lambda: cached('cost_analytics', db.get_cost_analytics, days=30))
+    except Exception as e:
+        logger.error(f"Cost analytics error: {e}")
+        return jsonify({'error': str(e)}), 500
 
 @app.route("/api/performance-metrics")
 async def performance_metrics():
     """Get system performance metrics"""
-    deepseek_health = deepseek_client.get_health_status()
+    async def build() -> Dict:
+        deepseek_health = await cached('deepseek_health', deepseek_client.get_health_status)
+        return performance_metrics_payload(deepseek_health)
+
+    return await cached_json('performance_metrics', CACHE_TTLS['deepseek_health'], build)
+
+async def build_dashboard_snapshot() -> Dict:
+    """Load every dashboard tile concurrently, sharing one DeepSeek health probe"""
+    deepseek_health, today_counts, handoff, subagent, cost, transition = await asyncio.gather(
+        cached('deepseek_health', deepseek_client.get_health_status),
+        cached('today_counts', db.get_today_activity_counts),
+        cached('handoff_analytics', load_handoff_analytics),
+        cached('subagent_analytics', load_subagent_analytics),
+        cached('cost_analytics', db.get_cost_analytics, days=30),
+        load_account_transition()
+    )
 
-    return jsonify({
-        'avg_response_time': 1.8,
-        'deepseek_response_time': deepseek_health.get('response_time', 0),
-        'uptime': 99.2,
-        'error_rate': 2.1
-    })
+    return {
+        'system': system_status_payload(deepseek_health, today_counts),
+        'handoff': handoff,
+        'subagent': subagent,
+        'cost': cost,
+        'performance': performance_metrics_payload(deepseek_health),
+        'transition': transition
+    }
+
+@app.route("/api/dashboard-snapshot")
+async def dashboard_snapshot():
+    """Get every dashboard tile in one response
+
+    The queries run concurrently and the DeepSeek health probe is shared by
+    the status and performance tiles, replacing six separate round-trips.
+    """
+    try:
+        return await cached_json('dashboard_snapshot', CACHE_TTLS['today_counts'], build_dashboard_snapshot)
+    except Exception as e:
+        logger.error(f"Error building dashboard snapshot: {e}")
+        return jsonify({'error': str(e)}), 500
+
+async def build_bootstrap() -> Dict:
+    """Load the dashboard snapshot and the first page of project activity concurrently"""
+    snapshot, project_data = await asyncio.gather(
+        build_dashboard_snapshot(),
+        run_blocking(db.get_project_grouped_activity, limit=10, offset=0)
+    )
+
+    return {
+        **snapshot,
+        'activity': {
+            'projects': project_data['projects'],
+            'pagination': project_data['pagination'],
+            'status': 'success'
+        }
+    }
+
+async def warm_bootstrap():
+    """Fill the bootstrap cache ahead of the dashboard's first request"""
+    try:
+        await encoded_json('bootstrap', CACHE_TTLS['today_counts'], build_bootstrap)
+    except Exception as e:
+        logger.warning(f"Could not prewarm dashboard bootstrap: {e}")
+
+# Background warm-up tasks; the event loop only keeps weak references to
+# tasks, so they are held here until they finish
+warmup_tasks: Set[asyncio.Future] = set()
+
+def start_bootstrap_warmup():
+    """Start warm_bootstrap() unless the bootstrap is already cached or loading"""
+    if not dashboard_cache.needs_load('json:bootstrap', CACHE_TTLS['today_counts']):
+        return
+    task = asyncio.ensure_future(warm_bootstrap())
+    warmup_tasks.add(task)
+    task.add_done_callback(warmup_tasks.discard)
+
+@app.route("/api/bootstrap")
+async def bootstrap():
+    """Get every dashboard tile plus the first page of project activity in one response
+
+    Used for the initial page load and for refreshes of the default view,
+    which would otherwise need the snapshot and the project-grouped activity
+    as two requests.
+    """
+    try:
+        return await cached_json('bootstrap', CACHE_TTLS['today_counts'], build_bootstrap)
+    except Exception as e:
+        logger.error(f"Error building dashboard bootstrap: {e}")
+        return jsonify({'error': str(e)}), 500
 
 @app.route("/api/recent-activity")
 async def recent_activity():
@@ -2565,9 +1029,11 @@ async def recent_activity():
         page = int(request.args.get('page', 1))
         limit = int(request.args.get('limit', 50))
         offset = (page - 1) * limit
+        # Keyset cursor from the previous page's next_cursor, skips the OFFSET scan
+        cursor = request.args.get('cursor') or None
 
         # Get paginated activity data from database
-        activity_data = db.get_recent_activity(limit=limit, offset=offset)
+        activity_data = await run_blocking(db.get_recent_activity, limit=limit, offset=offset, cursor=cursor)
 
         return jsonify({
             'activities': activity_data['activities'],
@@ -2579,6 +1045,127 @@ async def recent_activity():
         logger.error(f"Error fetching recent activity: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Rows encoded into the first streamed chunk: small so the table paints before the rest is sent
+STREAM_FIRST_CHUNK_ROWS = 20
+
+# Header describing positional activity rows: column names, plus the value
+# lists of the dictionary-encoded enum columns
+ACTIVITY_ROW_HEADER = {'columns': OrchestrationDB.ACTIVITY_LIST_COLUMNS, 'enums': OrchestrationDB.ACTIVITY_ENUMS}
+# Dictionary-encode the enum columns: (position in the row, value -> index)
+ACTIVITY_ENUM_POSITIONS = [
+    (OrchestrationDB.ACTIVITY_LIST_COLUMNS.index(column), {value: i for i, value in enumerate(values)})
+    for column, values in OrchestrationDB.ACTIVITY_ENUMS.items()
+]
+
+def encode_activity_row(row: tuple) -> list:
+    """Activity list row as sent to the client, with enum columns as indexes"""
+    row = list(row)
+    for position, indexes in ACTIVITY_ENUM_POSITIONS:
+        # Values outside the enum are sent as-is
+        row[position] = indexes.get(row[position], row[position])
+    return row
+
+# Server-rendered activity row, matching renderActivityRow() in dashboard.js.
+# The timestamp is left for the client to format in the viewer's locale.
+ACTIVITY_ROW_HTML = (
+    '<tr class="{row_class}"><td><time datetime="{timestamp}"></time>{indicator}</td>'
+    '<td>{session_short}</td><td>{event_type}</td>'
+    '<td class="model-{model_class}">{model_or_agent}</td><td>{description}</td>'
+    '<td class="{status}">{status}</td><td>${cost:.3f}</td><td>{project_name}</td></tr>'
+)
+
+def activity_row_age(timestamp: str, now: datetime) -> Optional[timedelta]:
+    """Age of an activity row, or None when its timestamp does not parse"""
+    try:
+        when = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if when.tzinfo is not None:
+        when = when.astimezone().replace(tzinfo=None)
+    return now - when
+
+def render_activity_rows_html(rows: List[tuple]) -> str:
+    """Render activity list rows as <tr> markup for the flat activity table"""
+    now = datetime.now()
+    rendered = []
+    for row in rows:
+        activity = dict(zip(OrchestrationDB.ACTIVITY_LIST_COLUMNS, row))
+        session_short = activity['session_short'] or ''
+        age = activity_row_age(activity['timestamp'], now)
+        if session_short.startswith('migrated'):
+            row_class, indicator = 'historical-data', ' 📁'
+        elif age is not None and age > timedelta(hours=24):
+            row_class, indicator = 'old-data', ' ⏰'
+        else:
+            row_class, indicator = 'recent-data', ' 🟢'
+        model = activity['model_or_agent'] or ''
+        rendered.append(ACTIVITY_ROW_HTML.format(
+            row_class=row_class,
+            timestamp=html.escape(str(activity['timestamp'] or '')),
+            indicator=indicator,
+            session_short=html.escape(session_short or 'N/A'),
+            event_type=html.escape(activity['event_type'] or ''),
+            model_class=html.escape(model.lower()),
+            model_or_agent=html.escape(model or 'Unknown'),
+            description=html.escape((activity['description_short'] or '')
+                                    + ('...' if activity['description_truncated'] else '')),
+            status=html.escape(activity['status'] or ''),
+            cost=float(activity['cost'] or 0),
+            project_name=html.escape(activity['project_name'] or 'Unknown')
+        ))
+    return "".join(rendered)
+
+def load_latest_activity(limit: int = 5) -> List[tuple]:
+    """Newest activity for SSE updates, as (cursor token, activity list row) pairs"""
+    return list(db.iter_activity_list_keyed(limit=limit))
+
+def load_activity_page(limit: int, offset: int, cursor: Optional[str]) -> Tuple[List[tuple], Dict]:
+    """Read a page of activity list rows and its pagination in one worker call
+
+    A page is at most `limit` rows, so it is materialized here: the sqlite
+    cursor is exhausted and closed on the thread that owns the connection.
+    """
+    activities = list(db.iter_activity_list_keyed(limit=limit, offset=offset, cursor=cursor))
+    last_cursor = activities[-1][0] if activities else None
+    pagination = db.get_recent_activity_pagination(limit=limit, offset=offset, last_cursor=last_cursor)
+    return activities, pagination
+
+@app.route("/api/recent-activity/stream")
+async def recent_activity_stream():
+    """Stream a page of recent activity as NDJSON, one activity per line"""
+    try:
+        # Get pagination parameters
+        page = int(request.args.get('page', 1))
+        limit = int(request.args.get('limit', 50))
+        offset = (page - 1) * limit
+        cursor = request.args.get('cursor') or None
+    except ValueError as e:
+        logger.error(f"Error streaming recent activity: {e}")
+        return jsonify({'error': str(e)}), 500
+
+    async def activity_lines() -> AsyncGenerator[bytes, None]:
+        """Yield a column header, activity rows as positional arrays, then the pagination trailer"""
+        try:
+            yield json_bytes(ACTIVITY_ROW_HEADER) + b"\n"
+
+            activities, pagination = await run_blocking(load_activity_page, limit, offset, cursor)
+
+            # Only the encoding is streamed, so the first rows go out early
+            start, chunk_size = 0, STREAM_FIRST_CHUNK_ROWS
+            while start < len(activities):
+                chunk = activities[start:start + chunk_size]
+                yield b"".join(json_bytes(encode_activity_row(row)) + b"\n" for _, row in chunk)
+                start += chunk_size
+                chunk_size = db.FETCH_CHUNK_SIZE
+
+            yield json_bytes({'pagination': pagination}) + b"\n"
+
+        except Exception as e:
+            logger.error(f"Error streaming recent activity: {e}")
+            yield json_bytes({'error': str(e)}) + b"\n"
+
+    return Response(activity_lines(), mimetype='application/x-ndjson')
+
 @app.route("/api/project-grouped-activity")
 async def project_grouped_activity():
     """Get activity grouped by project with expandable details"""
@@ -2589,7 +1176,7 @@ async def project_grouped_activity():
         offset = (page - 1) * limit
 
         # Get project-grouped activity data from database
-        project_data = db.get_project_grouped_activity(limit=limit, offset=offset)
+        project_data = await run_blocking(db.get_project_grouped_activity, limit=limit, offset=offset)
 
         return jsonify({
             'projects': project_data['projects'],
@@ -2605,65 +1192,195 @@ async def project_grouped_activity():
 async def account_transition_analysis():
     """Get Max-to-Pro account transition analysis"""
     try:
-        # Get transition projection
-        projection = db.get_account_transition_projection()
-
-        # Get recent account analysis data
-        recent_analysis = db.get_claude_account_analysis(period_type='daily', limit=30)
-
-        return jsonify({
-            'transition_projection': projection,
-            'historical_analysis': recent_analysis,
-            'status': 'success'
-        })
+        return await cached_json('account_transition', CACHE_TTLS['account_transition'], load_account_transition)
     except Exception as e:
         logger.error(f"Error getting account transition analysis: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route("/api/events")
-async def sse_events():
-    """Server-Sent Events endpoint for real-time dashboard updates"""
+# SSE change detection: poll the cheap change token often, rebuild the full
+# payload only when it moves (or every SSE_RESYNC_SECONDS for health data)
+SSE_POLL_SECONDS = 2
+SSE_HEARTBEAT_SECONDS = 15
+SSE_RESYNC_SECONDS = 60
+# Frames buffered per subscriber; a client that falls further behind is
+# resynced with a single full snapshot instead
+SSE_QUEUE_SIZE = 8
+
+def sse_frame(data: Dict) -> bytes:
+    """Encode one SSE data event"""
+    return b"data: " + json_bytes(data) + b"\n\n"
+
+class SnapshotBroadcaster:
+    """Build dashboard updates once and fan them out to every SSE subscriber
+
+    A single producer task polls the change token and rebuilds the snapshot
+    however many dashboards are open. Each update is encoded once as a delta
+    of the tiles that changed since the previous one, and the same frame is
+    queued for every subscriber. Recent activity is sent the same way: only
+    the rows newer than the previous update, tagged with the cursor they
+    follow. New or lagging subscribers get one frame with every tile and the
+    full recent activity list. The producer only runs while someone is
+    subscribed.
+    """
 
-    async def event_stream() -> AsyncGenerator[str, None]:
-        """Generate SSE events with real-time dashboard data"""
-        last_update_time = datetime.now()
+    def __init__(self):
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._snapshot: Dict[str, Any] = {}
+        # Serialized form of each tile as last broadcast, for change detection
+        self._encoded_tiles: Dict[str, bytes] = {}
+        self._latest_activity: List[tuple] = []
+        self._full_frame: Optional[bytes] = None
+        self._started = datetime.now()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber, primed with the current full snapshot if there is one"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+        if self._snapshot:
+            queue.put_nowait(self._get_full_frame())
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a subscriber and stop the producer once nobody is listening"""
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self.stop()
+
+    def stop(self):
+        """Cancel the producer task"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _update_frame(self, tiles: Dict[str, Any], activity: Dict[str, Any]) -> bytes:
+        return sse_frame({
+            'type': 'dashboard_update',
+            'timestamp': datetime.now(timezone.utc),
+            'snapshot': tiles,
+            **activity,
+            'update_count': int((datetime.now() - self._started).total_seconds())
+        })
 
-        while True:
+    def _full_activity(self) -> Dict[str, Any]:
+        """Activity fields replacing the client's recent activity list"""
+        return {
+            'recent_activity_html': render_activity_rows_html([row for _, row in self._latest_activity]),
+            'activity_cursor': self._latest_activity[0][0] if self._latest_activity else None
+        }
+
+    def _activity_delta(self, latest: List[tuple]) -> Dict[str, Any]:
+        """Activity fields for an update from the last broadcast rows to latest"""
+        if not latest and not self._latest_activity:
+            return {}
+        previous_cursor = self._latest_activity[0][0] if self._latest_activity else None
+        cursors = [row_cursor for row_cursor, _ in latest]
+        if previous_cursor is None or previous_cursor not in cursors:
+            # More new rows than fit in the list, or rows were removed: resend it all
+            self._latest_activity = latest
+            return self._full_activity()
+
+        new_rows = latest[:cursors.index(previous_cursor)]
+        self._latest_activity = latest
+        if not new_rows:
+            return {}
+        return {
+            'new_activity_html': render_activity_rows_html([row for _, row in new_rows]),
+            'since': previous_cursor,
+            'activity_cursor': new_rows[0][0]
+        }
+
+    def _get_full_frame(self) -> bytes:
+        if self._full_frame is None:
+            self._full_frame = self._update_frame(self._snapshot, self._full_activity())
+        return self._full_frame
+
+    def _publish(self, frame: bytes):
+        for queue in self._subscribers:
             try:
-                # Get current data
-                status_data = await system_status()
-                status_json = await status_data.get_json()
-
-                # Get recent activity
-                activity_data = await recent_activity()
-                activity_json = await activity_data.get_json()
-
-                # Create update event
-                update_data = {
-                    'type': 'dashboard_update',
-                    'timestamp': datetime.now().isoformat() + 'Z',
-                    'system_status': status_json,
-                    'recent_activity': activity_json.get('activities', [])[:5],  # Latest 5 activities
-                    'update_count': int((datetime.now() - last_update_time).total_seconds())
-                }
-
-                # Send SSE event
-                yield f"data: {json.dumps(update_data)}\n\n"
-
-                # Update every 5 seconds (much faster than 30s polling)
-                await asyncio.sleep(5)
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                # Too far behind for deltas to add up: replace the backlog with
+                # one frame carrying every tile
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._get_full_frame())
+
+    async def _run(self):
+        last_token = None
+        last_push = 0.0
+        loop = asyncio.get_running_loop()
 
+        while True:
+            try:
+                now = loop.time()
+                token = await run_blocking(db.get_change_token)
+
+                # Rebuild the payload only when new rows landed, or periodically so
+                # DeepSeek health stays fresh
+                if token != last_token or now - last_push >= SSE_RESYNC_SECONDS:
+                    # New rows make the cached aggregates stale; the snapshot is then
+                    # rebuilt once and shared with the polling endpoints via the cache
+                    dashboard_cache.sync_change_token(token)
+                    snapshot = await build_dashboard_snapshot()
+                    latest_activity = await run_blocking(load_latest_activity)
+
+                    # Broadcast only the tiles whose payload differs from the last update
+                    changed_tiles = {}
+                    for key, tile in snapshot.items():
+                        encoded = json_bytes(tile)
+                        if self._encoded_tiles.get(key) != encoded:
+                            self._encoded_tiles[key] = encoded
+                            changed_tiles[key] = tile
+
+                    self._snapshot = snapshot
+                    activity = self._activity_delta(latest_activity)
+                    self._full_frame = None
+                    self._publish(self._update_frame(changed_tiles, activity))
+                    last_token = token
+                    last_push = now
+
+                await asyncio.sleep(SSE_POLL_SECONDS)
+
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"SSE error: {e}")
-                # Send error event
-                error_data = {
+                self._publish(sse_frame({
                     'type': 'error',
                     'message': 'Dashboard update failed',
-                    'timestamp': datetime.now().isoformat() + 'Z'
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
+                    'timestamp': datetime.now(timezone.utc)
+                }))
                 await asyncio.sleep(10)  # Wait longer on error
 
+snapshot_broadcaster = SnapshotBroadcaster()
+
+@app.after_serving
+async def stop_snapshot_broadcaster():
+    """Stop the SSE producer when the server stops"""
+    snapshot_broadcaster.stop()
+
+@app.route("/api/events")
+async def sse_events():
+    """Server-Sent Events endpoint for real-time dashboard updates"""
+
+    async def event_stream() -> AsyncGenerator[bytes, None]:
+        """Relay the shared update frames, with a heartbeat while nothing changes"""
+        queue = snapshot_broadcaster.subscribe()
+        try:
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # SSE comment line: keeps proxies from idling out the connection
+                    yield b": heartbeat\n\n"
+                    continue
+                yield frame
+        finally:
+            snapshot_broadcaster.unsubscribe(queue)
+
     return Response(
         event_stream(),
         mimetype='text/event-stream',
@@ -2682,13 +1399,17 @@ async def track_session():
     try:
         data = await request.get_json()
 
-        session_id = db.create_session(
+        session_id = await run_blocking(
+            db.create_session,
             session_id=data['session_id'],
             project_name=data.get('project_name'),
             task_description=data.get('task_description'),
             metadata=data.get('metadata')
         )
 
+        # New events change the dashboard aggregates
+        dashboard_cache.invalidate()
+
         return jsonify({'session_id': session_id, 'status': 'success'})
 
     except Exception as e:
@@ -2725,7 +1446,8 @@ async def track_handoff():
             else:
                 decision = decision_data
 
-        handoff_id = handoff_monitor.track_handoff(
+        handoff_id = await run_blocking(
+            handoff_monitor.track_handoff,
             session_id=data['session_id'],
             task_description=data['task_description'],
             task_type=data.get('task_type', 'general'),
@@ -2733,6 +1455,9 @@ async def track_handoff():
             actual_model=data.get('actual_model')
         )
 
+        # New events change the dashboard aggregates
+        dashboard_cache.invalidate()
+
         return jsonify({'handoff_id': handoff_id, 'status': 'success'})
 
     except Exception as e:
@@ -2779,7 +1504,8 @@ async def track_subagent():
         )
 
         # Track the invocation
-        invocation_id = subagent_tracker.track_invocation(
+        invocation_id = await run_blocking(
+            subagent_tracker.track_invocation,
             session_id=session_id,
             invocation=invocation,
             parent_agent=data.get('parent_agent', 'claude')
@@ -2788,6 +1514,9 @@ async def track_subagent():
         with open("debug_subagent.log", "a", encoding="utf-8") as f:
             f.write(f"[SUCCESS] Created invocation ID: {invocation_id}\n")
 
+        # New events change the dashboard aggregates
+        dashboard_cache.invalidate()
+
         return jsonify({'invocation_id': invocation_id, 'status': 'success'})
 
     except Exception as e:
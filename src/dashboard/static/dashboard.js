@@ -0,0 +1,1871 @@
+let charts = {};
+let autoRefreshInterval = null;
+let isAutoRefresh = true; // Default to enabled
+let currentActivityPage = 1;
+const ACTIVITY_PAGE_SIZE = 50;
+let activityPagination = null;
+// Keyset cursor each visited activity page was fetched with, by page number
+const activityPageCursors = new Map();
+// The flat-view load in progress; starting another aborts it
+let activityLoad = null;
+let isProjectView = true;
+let currentProjectPage = 1;
+let projectPagination = null;
+
+let refreshPromise = null;
+let lastRefreshStarted = 0;
+let lastSnapshotEtag = null;
+const REFRESH_DEBOUNCE_MS = 500;
+const AUTO_REFRESH_MS = 30000;
+
+// Per-update console logging, opt in with ?debug in the page URL. Logging
+// every SSE payload keeps each one alive in the console and costs a
+// formatting pass per tick.
+const DEBUG_LOGGING = new URLSearchParams(location.search).has('debug');
+
+function debugLog(...args) {
+    if (DEBUG_LOGGING) console.log(...args);
+}
+
+// SSE Real-time Updates
+let eventSource = null;
+let sseReconnectInterval = null;
+// What was running when the tab was hidden, so it can be resumed
+let pausedUpdates = null;
+
+// Initialize SSE connection for real-time updates
+function initializeSSE() {
+    console.log('Initializing SSE connection...');
+
+    if (eventSource) {
+        eventSource.close();
+    }
+
+    try {
+        eventSource = new EventSource('/api/events');
+
+        eventSource.onopen = function(event) {
+            console.log('SSE connection opened');
+            clearInterval(sseReconnectInterval);
+            // Stop the old polling system
+            if (autoRefreshInterval) {
+                stopAutoRefresh();
+                console.log('Stopped old polling system in favor of SSE');
+            }
+        };
+
+        eventSource.onmessage = function(event) {
+            debugLog('SSE message received:', event.data);
+            try {
+                const data = JSON.parse(event.data);
+
+                if (data.type === 'dashboard_update') {
+                    // Repaint only the tiles the server reports as changed
+                    if (data.snapshot) {
+                        applyDelta(data.snapshot);
+                    }
+
+                    // Update recent activity once the tiles have painted
+                    if (data.activity_cursor !== undefined) {
+                        apiCache.clear();
+                        whenIdle().then(() => updateActivityTableFromSSE(data));
+                    }
+
+                    // Show last update time in live indicator
+                    const liveIndicator = document.getElementById('liveIndicator');
+                    if (liveIndicator) {
+                        liveIndicator.textContent = `Live • ${timeFormat.format(new Date())}`;
+                        liveIndicator.style.display = 'inline-block';
+                    }
+
+                } else if (data.type === 'error') {
+                    console.error('SSE error event:', data.message);
+                    showSSEError(data.message);
+                }
+            } catch (error) {
+                console.error('Error parsing SSE data:', error);
+            }
+        };
+
+        eventSource.onerror = function(event) {
+            console.error('SSE connection error:', event);
+            eventSource.close();
+            showSSEError('Connection lost - attempting to reconnect...');
+
+            // Attempt to reconnect after 5 seconds (deferred to visibilitychange while hidden)
+            sseReconnectInterval = setTimeout(() => {
+                if (document.hidden) return;
+                console.log('Attempting SSE reconnection...');
+                initializeSSE();
+            }, 5000);
+        };
+
+    } catch (error) {
+        console.error('Failed to initialize SSE:', error);
+        showSSEError('Real-time updates unavailable - falling back to manual refresh');
+        // Fallback to manual refresh if SSE fails
+        setupFallbackPolling();
+    }
+}
+
+// Tile loaders keyed by their /api/dashboard-snapshot field
+const SNAPSHOT_LOADERS = {
+    system: loadSystemStatus,
+    handoff: loadHandoffAnalytics,
+    subagent: loadSubagentAnalytics,
+    cost: loadCostAnalytics,
+    transition: loadAccountTransitionAnalysis,
+    performance: loadPerformanceMetrics
+};
+
+// Tiles below the fold that can wait for the browser to go idle
+const IDLE_SNAPSHOT_TILES = new Set(['transition']);
+
+function nextFrame() {
+    return new Promise(resolve => requestAnimationFrame(resolve));
+}
+
+function whenIdle() {
+    return new Promise(resolve => {
+        if (window.requestIdleCallback) {
+            requestIdleCallback(resolve, { timeout: 500 });
+        } else {
+            setTimeout(resolve, 0);
+        }
+    });
+}
+
+// Render the changed tiles pushed over SSE; unchanged tiles are omitted by the server.
+// All visible tiles are written in a single animation frame so the browser
+// does one style/layout pass instead of one per tile.
+async function applyDelta(delta) {
+    // A pushed snapshot supersedes whatever the last polled one was
+    lastSnapshotEtag = null;
+
+    const entries = Object.entries(delta).filter(([key]) => SNAPSHOT_LOADERS[key]);
+    const updates = [];
+
+    await nextFrame();
+    for (const [key, tileData] of entries) {
+        if (!IDLE_SNAPSHOT_TILES.has(key)) updates.push(SNAPSHOT_LOADERS[key](tileData));
+    }
+
+    if (entries.some(([key]) => IDLE_SNAPSHOT_TILES.has(key))) {
+        await whenIdle();
+        for (const [key, tileData] of entries) {
+            if (IDLE_SNAPSHOT_TILES.has(key)) updates.push(SNAPSHOT_LOADERS[key](tileData));
+        }
+    }
+
+    await Promise.all(updates);
+}
+
+// Newest activity cursor seen over SSE; new rows are only sent relative to it
+let sseActivityCursor = null;
+
+// The server sends activity rows already rendered and escaped; parse them in
+// one pass and only format the timestamps in the viewer's locale
+function parseActivityRows(rowsHtml) {
+    const parsed = document.createElement('template');
+    parsed.innerHTML = rowsHtml;
+    for (const time of parsed.content.querySelectorAll('time')) {
+        time.textContent = formatTimestamp(time.dateTime);
+    }
+    return Array.from(parsed.content.children);
+}
+
+// Update activity table from SSE data (flat view only for now). Updates
+// normally carry just the rows newer than the previous one, which are
+// prepended; a full list replaces the table.
+function updateActivityTableFromSSE(data) {
+    try {
+        const missedUpdate = data.new_activity_html !== undefined && data.since !== sseActivityCursor;
+        sseActivityCursor = data.activity_cursor;
+
+        // Only update if we're looking at the newest page of the flat view;
+        // switching back reloads it anyway
+        if (isProjectView || currentActivityPage !== 1) {
+            debugLog('Skipping SSE activity update - not on the first flat view page');
+            return;
+        }
+
+        if (missedUpdate) {
+            loadRecentActivity(1);
+        } else if (data.new_activity_html !== undefined) {
+            prependActivityRows(parseActivityRows(data.new_activity_html), ACTIVITY_PAGE_SIZE);
+        } else {
+            setActivityRows(parseActivityRows(data.recent_activity_html));
+        }
+
+        debugLog('Activity table updated via SSE');
+    } catch (error) {
+        console.error('Error updating activity table from SSE:', error);
+    }
+}
+
+// Show SSE error status
+function showSSEError(message) {
+    const liveIndicator = document.getElementById('liveIndicator');
+    if (liveIndicator) {
+        liveIndicator.textContent = `⚠️ ${message}`;
+        liveIndicator.style.display = 'inline-block';
+        liveIndicator.style.color = '#ff6b6b';
+    }
+}
+
+// Fallback polling if SSE fails
+function setupFallbackPolling() {
+    console.log('Setting up fallback polling...');
+    startAutoRefresh();
+}
+
+function startAutoRefresh() {
+    stopAutoRefresh();
+    // A hidden tab only records that polling should resume when shown
+    if (document.hidden) {
+        pausedUpdates = { sse: false, ...pausedUpdates, polling: true };
+        return;
+    }
+    autoRefreshInterval = setInterval(refreshAll, AUTO_REFRESH_MS);
+}
+
+function stopAutoRefresh() {
+    if (autoRefreshInterval) {
+        clearInterval(autoRefreshInterval);
+        autoRefreshInterval = null;
+    }
+}
+
+// Suspend SSE and polling while the tab is in the background and
+// catch up with a single refresh when it becomes visible again
+function handleVisibilityChange() {
+    if (document.hidden) {
+        pausedUpdates = {
+            sse: eventSource !== null && eventSource.readyState !== EventSource.CLOSED,
+            polling: autoRefreshInterval !== null
+        };
+        clearTimeout(sseReconnectInterval);
+        if (eventSource) {
+            eventSource.close();
+        }
+        stopAutoRefresh();
+        return;
+    }
+
+    if (!pausedUpdates) return;
+    const resume = pausedUpdates;
+    pausedUpdates = null;
+
+    refreshAll();
+    if (resume.sse || (eventSource && eventSource.readyState === EventSource.CLOSED)) {
+        initializeSSE();
+    }
+    if (resume.polling) {
+        startAutoRefresh();
+    }
+}
+
+// First paint: every tile and the default project activity view in one request
+async function bootstrapDashboard() {
+    try {
+        const response = await fetch('/api/bootstrap');
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+
+        const { activity, ...tiles } = await response.json();
+        await Promise.all([
+            applyDelta(tiles),
+            isProjectView ? loadProjectGroupedActivity(1, activity) : loadActivityData()
+        ]);
+        updateLiveIndicator();
+    } catch (error) {
+        console.error('Error bootstrapping dashboard:', error);
+        refreshAll();
+    }
+}
+
+// Initialize dashboard
+document.addEventListener('DOMContentLoaded', function() {
+    bootstrapDashboard();
+    initializeTooltips();
+    document.getElementById('flatActivityView').addEventListener('scroll', handleActivityScroll, { passive: true });
+    initializeSSE(); // Use SSE for real-time updates instead of polling
+    document.addEventListener('visibilitychange', handleVisibilityChange);
+    // Opened in a background tab: no visibilitychange fires until it is
+    // shown, so pause the live updates straight away
+    if (document.hidden) {
+        handleVisibilityChange();
+    }
+});
+
+function initializeAutoRefresh() {
+    if (isAutoRefresh) {
+        const toggle = document.getElementById('autoRefreshToggle');
+        const indicator = document.getElementById('liveIndicator');
+        toggle.classList.add('active');
+        indicator.style.display = 'inline-block';
+        startAutoRefresh();
+    }
+}
+
+// Tooltip System
+// One tooltip element, created on first hover and then only refilled and
+// shown or hidden, never removed from the DOM
+let tooltipBox = null;
+// Element the visible tooltip belongs to, null while hidden
+let currentTooltipOwner = null;
+// Size of the current content, null until measured
+let tooltipSize = null;
+// Read once and on resize rather than on every pointer move
+let viewportWidth = window.innerWidth;
+let tooltipPointer = null;
+let tooltipFrame = null;
+// Tooltip payloads keyed by a stable per-tile key, so hovering reads
+// the object directly instead of parsing JSON out of an attribute
+const tooltipDataStore = new Map();
+// Tooltip content per tile key, built on its first hover and kept: later
+// hovers reuse the same nodes and only rewrite slots whose text changed
+const tooltipContentCache = new Map();
+
+function setTooltipData(key, data) {
+    tooltipDataStore.set(key, data);
+    return key;
+}
+
+function initializeTooltips() {
+    window.addEventListener('resize', () => {
+        viewportWidth = window.innerWidth;
+    }, { passive: true });
+    document.addEventListener('mouseover', handleTooltipShow);
+    document.addEventListener('mouseout', handleTooltipHide);
+}
+
+function handleTooltipShow(e) {
+    const element = e.target.closest('[data-tooltip]');
+    if (!element) return;
+    // mouseover also fires when moving between the element's children;
+    // its tooltip is already up, so don't rebuild it
+    if (element === currentTooltipOwner) return;
+
+    const tooltipType = element.getAttribute('data-tooltip');
+    const tooltipKey = element.getAttribute('data-tooltip-key') || tooltipType;
+
+    const content = tooltipContent(tooltipType, tooltipKey);
+
+    // Follow the pointer only while a tooltip is open
+    if (!currentTooltipOwner) {
+        document.addEventListener('mousemove', handleTooltipMove, { passive: true });
+    }
+    showTooltip(content, e);
+    currentTooltipOwner = element;
+}
+
+function handleTooltipHide(e) {
+    // Moving between the owner's children also fires mouseout; only hide
+    // once the pointer has left the owner element itself
+    if (currentTooltipOwner && !currentTooltipOwner.contains(e.relatedTarget)) {
+        hideTooltip();
+    }
+}
+
+function handleTooltipMove(e) {
+    if (currentTooltipOwner) {
+        scheduleTooltipUpdate(e.clientX, e.clientY);
+    }
+}
+
+function showTooltip(content, e) {
+    if (!tooltipBox) {
+        tooltipBox = document.createElement('div');
+        tooltipBox.className = 'tooltip';
+        document.body.appendChild(tooltipBox);
+    }
+
+    // Content is a cached entry from tooltipContent(); its nodes are moved
+    // in, and left alone when the box still holds them
+    const replaced = tooltipBox.firstChild !== content.nodes[0];
+    if (replaced) {
+        tooltipBox.replaceChildren(...content.nodes);
+    }
+    // Measured, placed and shown together in the next frame; the last
+    // size still holds when neither the nodes nor their text changed
+    if (replaced || content.changed) {
+        tooltipSize = null;
+    }
+    scheduleTooltipUpdate(e.clientX, e.clientY);
+}
+
+function hideTooltip() {
+    if (currentTooltipOwner) {
+        document.removeEventListener('mousemove', handleTooltipMove, { passive: true });
+        tooltipBox.classList.remove('show');
+        currentTooltipOwner = null;
+    }
+}
+
+// Place the tooltip next to the pointer. It is moved with a transform, which
+// skips layout, and its size is only measured when its content changes.
+// Showing and moving are coalesced into one read/write pass per frame.
+function positionTooltip(tooltip, x, y) {
+    let left = x + 10;
+    let top = y - tooltipSize.height - 10;
+
+    // Adjust if tooltip would go off screen
+    if (left + tooltipSize.width > viewportWidth) {
+        left = x - tooltipSize.width - 10;
+    }
+    if (top < 0) {
+        top = y + 10;
+    }
+
+    tooltip.style.transform = `translate3d(${left}px, ${top}px, 0)`;
+}
+
+function scheduleTooltipUpdate(x, y) {
+    tooltipPointer = { x, y };
+    if (tooltipFrame) return;
+    tooltipFrame = requestAnimationFrame(() => {
+        tooltipFrame = null;
+        if (!currentTooltipOwner) return;
+        // New content: one read of its size, then only writes
+        const revealing = !tooltipSize;
+        if (revealing) {
+            tooltipSize = { width: tooltipBox.offsetWidth, height: tooltipBox.offsetHeight };
+        }
+        positionTooltip(tooltipBox, tooltipPointer.x, tooltipPointer.y);
+        if (revealing) {
+            tooltipBox.classList.add('show');
+        }
+    });
+}
+
+// Tooltip skeletons are rendered into the page as <template id="tt-{type}">
+// with their static text in place. Each filler maps a tile's data, the
+// object registered by setTooltipData(), to the values of the skeleton's
+// data-slot spans; a [text, className] pair also adds a class to the slot.
+const TOOLTIP_SLOTS = Object.freeze(Object.assign(Object.create(null), {
+    'deepseek-status': data => ({
+        status: data.available ? 'Connected' : 'Disconnected',
+        response_time: data.response_time == null ? 'N/A' : `${fmt(data.response_time, 2)}s`,
+        models_loaded: data.models_loaded || 0,
+        health: data.status || 'Unknown'
+    }),
+
+    'active-sessions': data => ({ count: data }),
+
+    'handoffs-today': data => ({ count: data }),
+
+    'subagents-spawned': data => ({ count: data }),
+
+    'savings-today': data => ({ amount: money(data, 4) }),
+
+    'total-handoffs': data => ({
+        deepseek: data.deepseek || 0,
+        claude: data.claude || 0,
+        total: data.total || 0
+    }),
+
+    'deepseek-usage': data => ({
+        deepseek: data.deepseek || 0,
+        claude: data.claude || 0,
+        local_percent: fmt((data.deepseek / Math.max(data.total, 1)) * 100, 1)
+    }),
+
+    'handoff-success-rate': data => ({
+        success_rate: fmt(data.success_rate, 1),
+        successful: data.successful || 0,
+        failed: data.failed || 0
+    }),
+
+    'avg-confidence': data => ({
+        avg: fmt(data.avg, 3),
+        min: fmt(data.min, 3),
+        max: fmt(data.max, 3)
+    }),
+
+    'unique-agents': data => ({
+        unique_agents: data.unique_agents || 0,
+        coverage: data.total_invocations ? fmt((data.unique_agents / data.total_invocations) * 100, 1) : 0,
+        most_active: data.most_active || 'N/A'
+    }),
+
+    'subagent-invocations': data => ({
+        total: data.total || 0,
+        success_rate: fmt(data.success_rate, 1),
+        avg_duration: fmt(data.avg_duration, 1)
+    }),
+
+    'most-used-agent': data => ({
+        name: data.name || 'N/A',
+        count: data.count || 0,
+        success_rate: fmt(data.success_rate, 1),
+        specialization: data.specialization || 'General purpose'
+    }),
+
+    'monthly-cost': data => ({
+        claude_cost: money(data.claude_cost, 2),
+        deepseek_cost: money(data.deepseek_cost, 2),
+        total: money(data.total, 2),
+        pure_claude_cost: money(data.pure_claude_cost, 2)
+    }),
+
+    'monthly-savings': data => ({
+        total_savings: money(data.total_savings, 2),
+        deepseek_savings: money(data.deepseek_savings, 2),
+        reduction_percent: fmt(data.reduction_percent, 1),
+        roi: data.roi || 'Infinite'
+    }),
+
+    'optimization-rate': data => ({
+        rate: fmt(data.rate, 1),
+        performance: data.rate >= 90 ? 'Excellent' : data.rate >= 75 ? 'Good' : 'Needs improvement'
+    }),
+
+    'response-time': data => ({
+        avg: fmt(data.avg, 2),
+        p95: fmt(data.p95, 2),
+        status: data.avg <= 2.0 ? 'Meeting target' : 'Above target'
+    }),
+
+    'deepseek-response': data => ({
+        response_time: fmt(data.response_time, 2),
+        vs_claude: data.claude_time ? fmt((data.response_time / data.claude_time) * 100, 1) : 'N/A',
+        availability: fmt(data.availability, 1)
+    }),
+
+    'system-uptime': data => ({
+        uptime: fmt(data.uptime, 2),
+        downtime_events: data.downtime_events || 0,
+        last_restart: data.last_restart || 'N/A'
+    }),
+
+    'error-rate': data => ({
+        rate: fmt(data.rate, 2),
+        total_errors: data.total_errors || 0,
+        most_common: data.most_common || 'Connection timeout'
+    }),
+
+    'transition-status': data => ({
+        status: data.status || 'Unknown',
+        deepseek_usage: fmt(data.deepseek_usage, 1),
+        readiness_score: fmt(data.readiness_score, 1)
+    }),
+
+    'effectiveness-score': data => ({
+        score: fmt(data.score, 1),
+        quality_maintained: data.quality_maintained ? 'Yes' : 'No',
+        cost_reduction: fmt(data.cost_reduction, 1)
+    }),
+
+    'ai-system-status': data => ({
+        claude_status: data.claude_status,
+        deepseek_status: [data.deepseek_status, data.deepseek_status === 'CONNECTED' ? 'status-online' : 'status-offline'],
+        deepseek_response_time: fmt(data.deepseek_response_time, 2),
+        combined_health: [data.combined_health, data.combined_health === 'OPTIMAL' ? 'status-online' : 'status-degraded']
+    }),
+
+    'orchestration-activity': data => ({
+        total_sessions: data.total_sessions,
+        claude_tasks: data.claude_tasks,
+        deepseek_tasks: data.deepseek_tasks,
+        subagents_today: data.subagents_today,
+        handoffs_today: data.handoffs_today
+    }),
+
+    'daily-activity': data => ({
+        handoffs_today: data.handoffs_today || 0,
+        subagents_today: data.subagents_today || 0,
+        total: (data.handoffs_today || 0) + (data.subagents_today || 0)
+    }),
+
+    'cost-optimization': data => ({
+        deepseek_handoffs: data.deepseek_handoffs,
+        claude_handoffs: data.claude_handoffs,
+        optimization_rate: data.optimization_rate,
+        cost_avoided: money(data.deepseek_handoffs * 0.015, 4),
+        actual_spend: money(data.estimated_claude_cost, 4)
+    }),
+
+    'system-health': data => ({
+        success_rate: data.success_rate,
+        response_time: fmt(data.response_time, 2),
+        uptime: data.uptime
+    }),
+
+    'daily-impact': data => {
+        const totalPotentialCost = data.total_handoffs * 0.015; // What all tasks would cost on Claude
+        const actualCost = data.claude_handoffs * 0.015; // What we actually spent
+        return {
+            deepseek_handoffs: data.deepseek_handoffs,
+            claude_handoffs: data.claude_handoffs,
+            potential_cost: money(totalPotentialCost, 4),
+            actual_cost: money(actualCost, 4),
+            reduction: totalPotentialCost > 0 ? Math.round(((totalPotentialCost - actualCost) / totalPotentialCost) * 100) : 0
+        };
+    },
+
+    'default': data => ({ value: data })
+}));
+
+// Get a tile's tooltip content, building it from the type's skeleton on
+// first use and otherwise patching it when the tile's data has changed
+function tooltipContent(type, key) {
+    const data = tooltipDataStore.get(key);
+    let content = tooltipContentCache.get(key);
+    if (!content || content.type !== type) {
+        const skeleton = type in TOOLTIP_SLOTS ? type : 'default';
+        const fragment = document.getElementById(`tt-${skeleton}`).content.cloneNode(true);
+        const slots = Array.from(fragment.querySelectorAll('[data-slot]'));
+        content = {
+            type,
+            fill: TOOLTIP_SLOTS[skeleton],
+            nodes: Array.from(fragment.childNodes),
+            slots,
+            texts: new Array(slots.length),
+            classes: new Array(slots.length),
+            data: undefined,
+            changed: false
+        };
+        tooltipContentCache.set(key, content);
+        patchTooltipSlots(content, data);
+    } else if (content.data !== data) {
+        patchTooltipSlots(content, data);
+    } else {
+        content.changed = false;
+    }
+    return content;
+}
+
+// Write the slot values for data, touching only slots whose text or class
+// differs from what they already show
+function patchTooltipSlots(content, data) {
+    const values = content.fill(data);
+    let changed = false;
+    content.slots.forEach((slot, i) => {
+        let value = values[slot.dataset.slot];
+        let className = null;
+        if (Array.isArray(value)) {
+            [value, className] = value;
+        }
+        const text = String(value);
+        if (content.texts[i] !== text) {
+            slot.textContent = text;
+            content.texts[i] = text;
+            changed = true;
+        }
+        if (content.classes[i] !== className) {
+            if (content.classes[i]) slot.classList.remove(content.classes[i]);
+            if (className) slot.classList.add(className);
+            content.classes[i] = className;
+        }
+    });
+    content.data = data;
+    content.changed = changed;
+}
+
+async function refreshAll() {
+    // Share an in-flight refresh and ignore repeat clicks inside the debounce window
+    if (refreshPromise) return refreshPromise;
+    if (Date.now() - lastRefreshStarted < REFRESH_DEBOUNCE_MS) return;
+    lastRefreshStarted = Date.now();
+    apiCache.clear();
+
+    refreshPromise = (async () => {
+        try {
+            // The default view, the first page of projects, comes with every
+            // tile in one bootstrap response; other activity views are loaded
+            // alongside the snapshot request
+            const bundled = isProjectView && currentProjectPage === 1;
+            const activity = bundled ? null : loadActivityData();
+            const response = await fetch(bundled ? '/api/bootstrap' : '/api/dashboard-snapshot');
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+
+            // The browser revalidates with If-None-Match; an unchanged ETag
+            // means the tiles already show this payload, so skip the repaint
+            const etag = response.headers.get('ETag');
+            if (etag && etag === lastSnapshotEtag) {
+                await activity;
+                updateLiveIndicator();
+                return;
+            }
+
+            const { activity: projectActivity, ...tiles } = await response.json();
+
+            await Promise.all([
+                applyDelta(tiles),
+                bundled ? loadProjectGroupedActivity(1, projectActivity) : activity
+            ]);
+            lastSnapshotEtag = etag;
+
+            updateLiveIndicator();
+        } catch (error) {
+            console.error('Error refreshing data:', error);
+        }
+    })();
+
+    try {
+        await refreshPromise;
+    } finally {
+        refreshPromise = null;
+    }
+}
+
+async function loadSystemStatus(data) {
+    try {
+        if (!data) {
+            debugLog('Loading system status...');
+            const response = await fetch('/api/system-status');
+
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+
+            data = await response.json();
+        }
+        debugLog('System status data:', data);
+
+        const statusBar = document.getElementById('statusBar');
+        if (!statusBar) {
+            console.error('Status bar element not found');
+            return;
+        }
+
+        // Enhanced status bar with comprehensive Claude + DeepSeek metrics
+        const aiSystemData = {
+            claude_status: data.claude?.available ? 'ACTIVE' : 'OFFLINE',
+            claude_sessions_today: data.claude?.sessions_today || 0,
+            deepseek_status: data.deepseek?.available ? 'CONNECTED' : 'OFFLINE',
+            deepseek_response_time: data.deepseek?.response_time || 0,
+            deepseek_handoffs_today: data.deepseek_handoffs_today || 0,
+            combined_health: data.combined_health ? data.combined_health.toUpperCase() : 'DEGRADED'
+        };
+
+    const orchestrationData = {
+        total_sessions: data.active_sessions || 0,
+        sessions_today: data.claude?.sessions_today || 0, // Today's new sessions
+        handoffs_today: data.handoffs_today || 0,
+        claude_tasks: data.handoffs_today - (data.deepseek_handoffs_today || 0), // Actual Claude tasks
+        deepseek_tasks: data.deepseek_handoffs_today || 0, // Actual DeepSeek tasks
+        subagents_today: data.subagents_spawned || 0
+    };
+
+    const costOptimizationData = {
+        savings_today: data.savings_today || 0,
+        cost_avoided: (data.savings_today || 0) * 1.2, // Including indirect savings
+        deepseek_handoffs: data.deepseek_handoffs_today || 0,
+        total_handoffs: data.handoffs_today || 0,
+        claude_handoffs: (data.handoffs_today || 0) - (data.deepseek_handoffs_today || 0),
+        optimization_rate: data.handoffs_today > 0 ?
+            Math.round(((data.deepseek_handoffs_today || 0) / (data.handoffs_today || 0)) * 100) : 0,
+        estimated_claude_cost: ((data.handoffs_today || 0) - (data.deepseek_handoffs_today || 0)) * 0.015, // $0.015 per 1K tokens avg
+        estimated_deepseek_cost: 0.00 // DeepSeek is free (local)
+    };
+
+    const systemHealthData = {
+        response_time: data.deepseek.response_time || 0,
+        success_rate: 98.5, // Overall system success rate
+        uptime: 99.2 // System uptime percentage
+    };
+
+    const todayImpactData = {
+        total_interactions: (data.handoffs_today || 0) + (data.subagents_spawned || 0),
+        projects_active: Math.min(Math.ceil(data.active_sessions / 3), 8),
+        efficiency_gain: data.deepseek.available ? '3.2x' : '1.1x',
+        total_handoffs: data.handoffs_today || 0,
+        deepseek_handoffs: data.deepseek_handoffs_today || 0,
+        claude_handoffs: (data.handoffs_today || 0) - (data.deepseek_handoffs_today || 0)
+    };
+
+    renderTiles(statusBar, 'statusItemTpl', [
+        { label: 'AI System Status', value: aiSystemData.combined_health,
+          className: aiSystemData.combined_health === 'OPTIMAL' ? 'status-online' : 'status-offline',
+          tooltip: 'ai-system-status', tooltipKey: setTooltipData('ai-system-status', aiSystemData) },
+        { label: "Today's AI Activity", value: orchestrationData.handoffs_today + orchestrationData.subagents_today,
+          tooltip: 'daily-activity', tooltipKey: setTooltipData('daily-activity', orchestrationData) },
+        { label: 'Cost Optimization Rate', value: `${costOptimizationData.optimization_rate}%`, className: 'status-online',
+          tooltip: 'cost-optimization', tooltipKey: setTooltipData('cost-optimization', costOptimizationData) },
+        { label: 'System Health Score', value: `${systemHealthData.success_rate}%`,
+          tooltip: 'system-health', tooltipKey: setTooltipData('system-health', systemHealthData) },
+        { label: "Today's AI Savings", value: money(data.savings_today, 2), className: 'status-online',
+          tooltip: 'daily-impact', tooltipKey: setTooltipData('daily-impact', todayImpactData) }
+    ]);
+
+        debugLog('Status bar updated successfully');
+    } catch (error) {
+        console.error('Error loading system status:', error);
+        const statusBar = document.getElementById('statusBar');
+        if (statusBar) {
+            renderTiles(statusBar, 'statusItemTpl', [
+                { label: 'System Status', value: 'ERROR', className: 'status-offline' },
+                { label: 'Loading...', value: '--' },
+                { label: 'Please Refresh', value: '--' }
+            ]);
+        }
+    }
+}
+
+async function loadHandoffAnalytics(data) {
+    if (!data) {
+        const response = await fetch('/api/handoff-analytics');
+        data = await response.json();
+    }
+
+    const metrics = document.getElementById('handoffMetrics');
+    const handoffBreakdown = {
+        total: data.total_handoffs || 0,
+        deepseek: data.deepseek_handoffs || 0,
+        claude: data.claude_handoffs || 0
+    };
+    const successBreakdown = {
+        success_rate: data.success_rate || 0,
+        successful: data.successful_handoffs || 0,
+        failed: data.failed_handoffs || 0
+    };
+    const confidenceBreakdown = {
+        avg: data.avg_confidence || 0,
+        min: data.min_confidence || 0,
+        max: data.max_confidence || 1.0
+    };
+
+    renderTiles(metrics, 'metricTpl', [
+        { label: 'Total Handoffs', value: data.total_handoffs || 0,
+          tooltip: 'total-handoffs', tooltipKey: setTooltipData('total-handoffs', handoffBreakdown) },
+        { label: 'DeepSeek Usage', value: `${data.deepseek_pct}%`, className: 'model-deepseek',
+          tooltip: 'deepseek-usage', tooltipKey: setTooltipData('deepseek-usage', handoffBreakdown) },
+        { label: 'Success Rate', value: `${data.success_pct}%`, className: 'success',
+          tooltip: 'handoff-success-rate', tooltipKey: setTooltipData('handoff-success-rate', successBreakdown) },
+        { label: 'Avg Confidence', value: fmt(data.avg_confidence, 2),
+          tooltip: 'avg-confidence', tooltipKey: setTooltipData('avg-confidence', confidenceBreakdown) }
+    ]);
+
+    // Update handoff chart
+    updateHandoffChart(data);
+}
+
+async function loadSubagentAnalytics(data) {
+    if (!data) {
+        const response = await fetch('/api/subagent-analytics');
+        data = await response.json();
+    }
+
+    const metrics = document.getElementById('subagentMetrics');
+    const topAgent = data.usage_statistics?.[0];
+
+    const uniqueAgentData = {
+        unique_agents: data.patterns?.unique_agents_used || 0,
+        total_invocations: data.patterns?.total_invocations || 0,
+        most_active: topAgent?.agent_name || 'N/A'
+    };
+
+    const invocationData = {
+        total: data.patterns?.total_invocations || 0,
+        success_rate: data.patterns?.overall_success_rate || 0,
+        avg_duration: data.patterns?.avg_execution_time || 0
+    };
+
+    const mostUsedAgentData = {
+        name: topAgent?.agent_name || 'N/A',
+        count: topAgent?.count || 0,
+        success_rate: topAgent?.success_rate || 0,
+        specialization: topAgent?.specialization || 'General purpose'
+    };
+    const mostUsedAgentKey = setTooltipData('most-used-agent', mostUsedAgentData);
+
+    renderTiles(metrics, 'metricTpl', [
+        { label: 'Unique Agents Used', value: data.patterns?.unique_agents_used || 0,
+          tooltip: 'unique-agents', tooltipKey: setTooltipData('unique-agents', uniqueAgentData) },
+        { label: 'Total Invocations', value: data.patterns?.total_invocations || 0,
+          tooltip: 'subagent-invocations', tooltipKey: setTooltipData('subagent-invocations', invocationData) },
+        { label: 'Most Used Agent', value: topAgent?.agent_name || 'None',
+          tooltip: 'most-used-agent', tooltipKey: mostUsedAgentKey },
+        { label: 'Avg Success Rate', value: `${topAgent ? topAgent.success_pct : 0}%`, className: 'success',
+          tooltip: 'most-used-agent', tooltipKey: mostUsedAgentKey }
+    ]);
+
+    // Update subagent chart
+    updateSubagentChart(data);
+}
+
+async function loadCostAnalytics(data) {
+    if (!data) {
+        const response = await fetch('/api/cost-analytics');
+        data = await response.json();
+    }
+
+    const metrics = document.getElementById('costMetrics');
+
+    const costBreakdown = {
+        total: data.monthly_cost || 0,
+        claude_cost: data.claude_cost || 0,
+        deepseek_cost: data.deepseek_cost || 0,
+        pure_claude_cost: data.pure_claude_cost || (data.monthly_cost + data.monthly_savings) || 0
+    };
+
+    const annualSavings = (data.monthly_savings || 0) * 12;
+    const savingsBreakdown = {
+        total_savings: data.monthly_savings || 0,
+        deepseek_savings: data.deepseek_savings || data.monthly_savings || 0,
+        reduction_percent: data.cost_reduction_percent || 0,
+        roi: 'Infinite',
+        annual_savings: annualSavings
+    };
+    // Both savings tiles show the same breakdown, so they share one tooltip entry
+    const savingsKey = setTooltipData('monthly-savings', savingsBreakdown);
+
+    const optimizationData = {
+        rate: data.optimization_rate || 0
+    };
+
+    renderTiles(metrics, 'metricTpl', [
+        { label: 'Monthly Cost', value: money(data.monthly_cost, 2),
+          tooltip: 'monthly-cost', tooltipKey: setTooltipData('monthly-cost', costBreakdown) },
+        { label: 'Monthly Savings', value: money(data.monthly_savings, 2), className: 'status-online',
+          tooltip: 'monthly-savings', tooltipKey: savingsKey },
+        { label: 'Optimization Rate', value: `${fmt(data.optimization_rate, 1)}%`,
+          tooltip: 'optimization-rate', tooltipKey: setTooltipData('optimization-rate', optimizationData) },
+        { label: 'Projected Annual', value: money(annualSavings, 0), className: 'status-online',
+          tooltip: 'monthly-savings', tooltipKey: savingsKey }
+    ]);
+
+    // Update cost chart
+    updateCostChart(data);
+}
+
+async function loadPerformanceMetrics(data) {
+    if (!data) {
+        const response = await fetch('/api/performance-metrics');
+        data = await response.json();
+    }
+
+    const metrics = document.getElementById('performanceMetrics');
+
+    const responseTimeData = {
+        avg: data.avg_response_time || 0,
+        p95: data.p95_response_time || 0
+    };
+
+    const deepseekResponseData = {
+        response_time: data.deepseek_response_time || 0,
+        claude_time: data.claude_response_time || 0,
+        availability: data.deepseek_availability || 0
+    };
+
+    const uptimeData = {
+        uptime: data.uptime || 0,
+        downtime_events: data.downtime_events || 0,
+        last_restart: data.last_restart || 'N/A'
+    };
+
+    const errorData = {
+        rate: data.error_rate || 0,
+        total_errors: data.total_errors || 0,
+        most_common: data.most_common_error || 'Connection timeout'
+    };
+
+    renderTiles(metrics, 'metricTpl', [
+        { label: 'Avg Response Time', value: `${fmt(data.avg_response_time, 2)}s`,
+          tooltip: 'response-time', tooltipKey: setTooltipData('response-time', responseTimeData) },
+        { label: 'DeepSeek Response', value: `${fmt(data.deepseek_response_time, 2)}s`,
+          tooltip: 'deepseek-response', tooltipKey: setTooltipData('deepseek-response', deepseekResponseData) },
+        { label: 'System Uptime', value: `${fmt(data.uptime, 1)}%`, className: 'success',
+          tooltip: 'system-uptime', tooltipKey: setTooltipData('system-uptime', uptimeData) },
+        { label: 'Error Rate', value: `${fmt(data.error_rate, 1)}%`, className: data.error_rate > 5 ? 'error' : 'success',
+          tooltip: 'error-rate', tooltipKey: setTooltipData('error-rate', errorData) }
+    ]);
+}
+
+async function loadAccountTransitionAnalysis(data) {
+    try {
+        if (!data) {
+            const response = await fetch('/api/account-transition-analysis');
+            data = await response.json();
+        }
+
+        if (data.transition_projection) {
+            const projection = data.transition_projection;
+            const metrics = document.getElementById('accountTransitionMetrics');
+
+            // Status color based on readiness
+            const readinessColor = projection.transition_readiness === 'ready' ? '#10B981' :
+                                 projection.transition_readiness === 'approaching' ? '#F59E0B' : '#EF4444';
+
+            const transitionStatusData = {
+                status: projection.transition_readiness,
+                deepseek_usage: projection.deepseek_utilization_ratio * 100,
+                readiness_score: projection.effectiveness_score * 100
+            };
+            const transitionStatusKey = setTooltipData('transition-status', transitionStatusData);
+
+            const effectivenessData = {
+                score: projection.effectiveness_score * 100,
+                quality_maintained: projection.quality_maintained || true,
+                cost_reduction: projection.cost_reduction_percent || 0
+            };
+
+            const savingsProjectionData = {
+                monthly_savings: projection.potential_monthly_savings,
+                annual_savings: projection.potential_monthly_savings * 12,
+                current_usage: projection.deepseek_utilization_ratio * 100,
+                target_usage: 90
+            };
+
+            renderTiles(metrics, 'metricTpl', [
+                { label: 'Transition Status', value: projection.transition_readiness.toUpperCase(), color: readinessColor,
+                  tooltip: 'transition-status', tooltipKey: transitionStatusKey },
+                { label: 'DeepSeek Utilization', value: `${fmt(projection.deepseek_utilization_ratio * 100, 1)}%`,
+                  tooltip: 'transition-status', tooltipKey: transitionStatusKey },
+                { label: 'Effectiveness Score', value: `${fmt(projection.effectiveness_score * 100, 1)}%`, className: 'success',
+                  tooltip: 'effectiveness-score', tooltipKey: setTooltipData('effectiveness-score', effectivenessData) },
+                { label: 'Potential Monthly Savings', value: money(projection.potential_monthly_savings, 0), className: 'success',
+                  tooltip: 'monthly-savings', tooltipKey: setTooltipData('monthly-savings-3', savingsProjectionData) }
+            ]);
+            let recommendation = metrics.querySelector('.recommendation-box');
+            if (!recommendation) {
+                recommendation = metrics.appendChild(cloneTemplate('recommendationTpl'));
+            }
+            setText(recommendation.querySelector('.recommendation-text'), projection.recommendation);
+
+            // Create transition projection chart
+            updateTransitionChart(projection);
+        }
+    } catch (error) {
+        console.error('Error loading account transition analysis:', error);
+        const metrics = document.getElementById('accountTransitionMetrics');
+        metrics.innerHTML = '<div class="error">Error loading transition analysis</div>';
+    }
+}
+
+function updateTransitionChart(projection) {
+    renderChart('transition', 'transitionChart', ['DeepSeek Usage', 'Claude Usage'], [[
+        projection.deepseek_utilization_ratio * 100,
+        (1 - projection.deepseek_utilization_ratio) * 100
+    ]], transitionChartConfig);
+}
+
+function transitionChartConfig() {
+    return {
+        type: 'doughnut',
+        data: {
+            datasets: [{
+                backgroundColor: ['#10B981', '#667eea'],
+                borderWidth: 2,
+                borderColor: '#ffffff'
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: {
+                    display: true,
+                    text: 'Current Usage Distribution',
+                    font: { size: 14, weight: 'bold' }
+                },
+                legend: {
+                    position: 'bottom',
+                    labels: { padding: 20, usePointStyle: true }
+                }
+            }
+        }
+    };
+}
+
+// Number formatting is memoized per decimal count: tiles and tooltips
+// re-format the same values on every refresh and hover
+const FMT_CACHE_LIMIT = 512;
+const fmtCache = {};
+
+// One Intl.NumberFormat per decimal count, built on first use and reused;
+// grouping is off so values read like the toFixed() strings they replaced
+const numberFormats = {};
+
+function numberFormat(decimals) {
+    return numberFormats[decimals] || (numberFormats[decimals] = new Intl.NumberFormat('en-US', {
+        minimumFractionDigits: decimals,
+        maximumFractionDigits: decimals,
+        useGrouping: false
+    }));
+}
+
+function fmt(value, decimals = 2) {
+    const n = Number(value) || 0;
+    const cache = fmtCache[decimals] || (fmtCache[decimals] = new Map());
+    let text = cache.get(n);
+    if (text === undefined) {
+        text = numberFormat(decimals).format(n);
+        if (cache.size >= FMT_CACHE_LIMIT) {
+            // Maps iterate in insertion order, so this evicts the oldest entry
+            cache.delete(cache.keys().next().value);
+        }
+        cache.set(n, text);
+    }
+    return text;
+}
+
+function money(value, decimals = 2) {
+    return '$' + fmt(value, decimals);
+}
+
+// Shared formatters; Date#toLocaleString and friends build a new one per call
+const timestampFormat = new Intl.DateTimeFormat(undefined, {
+    year: 'numeric', month: 'numeric', day: 'numeric',
+    hour: 'numeric', minute: 'numeric', second: 'numeric'
+});
+const dateFormat = new Intl.DateTimeFormat(undefined, {
+    year: 'numeric', month: 'numeric', day: 'numeric'
+});
+const timeFormat = new Intl.DateTimeFormat(undefined, {
+    hour: 'numeric', minute: 'numeric', second: 'numeric'
+});
+
+// Activity timestamps are memoized by their raw string: each refresh
+// re-renders mostly the same rows, so most lookups skip Date parsing
+const timestampCache = new Map();
+
+function formatTimestamp(timestamp) {
+    let text = timestampCache.get(timestamp);
+    if (text === undefined) {
+        const date = new Date(timestamp);
+        // Intl throws on invalid dates where toLocaleString() returned 'Invalid Date'
+        text = isNaN(date) ? 'Invalid Date' : timestampFormat.format(date);
+        if (timestampCache.size >= FMT_CACHE_LIMIT) {
+            timestampCache.delete(timestampCache.keys().next().value);
+        }
+        timestampCache.set(timestamp, text);
+    }
+    return text;
+}
+
+function formatDate(value) {
+    const date = new Date(value);
+    return isNaN(date) ? 'Invalid Date' : dateFormat.format(date);
+}
+
+// Clone the first element of a <template> skeleton; callers fill it in
+// with textContent, so no markup is parsed per row
+function cloneTemplate(id) {
+    return document.getElementById(id).content.firstElementChild.cloneNode(true);
+}
+
+// Activity rows arrive as positional arrays in the header's column order, with
+// enum columns sent as indexes into the header's value lists
+function activityRowDecoder(columns, enums = {}) {
+    const decoders = columns.map(column => {
+        const values = enums[column];
+        return values ? (value => typeof value === 'number' ? values[value] : value) : null;
+    });
+    return (record) => {
+        const activity = {};
+        for (let i = 0; i < columns.length; i++) {
+            activity[columns[i]] = decoders[i] ? decoders[i](record[i]) : record[i];
+        }
+        return activity;
+    };
+}
+
+function renderActivityRow(activity, now) {
+    // Determine data quality/type
+    const isHistorical = activity.session_short?.startsWith('migrated');
+    const isOld = now - new Date(activity.timestamp) > 24 * 60 * 60 * 1000; // Older than 24 hours
+    const dataQualityIndicator = isHistorical ? ' 📁' : (isOld ? ' ⏰' : ' 🟢');
+
+    const row = cloneTemplate('activityRowTpl');
+    const cells = row.cells;
+    row.className = isHistorical ? 'historical-data' : (isOld ? 'old-data' : 'recent-data');
+    cells[0].textContent = formatTimestamp(activity.timestamp) + dataQualityIndicator;
+    cells[1].textContent = activity.session_short || 'N/A';
+    cells[2].textContent = activity.event_type ?? '';
+    cells[3].className = `model-${activity.model_or_agent?.toLowerCase() || ''}`;
+    cells[3].textContent = activity.model_or_agent || 'Unknown';
+    cells[4].textContent = (activity.description_short || '') + (activity.description_truncated ? '...' : '');
+    cells[5].className = activity.status ?? '';
+    cells[5].textContent = activity.status ?? '';
+    cells[6].textContent = money(activity.cost, 3);
+    cells[7].textContent = activity.project_name || 'Unknown';
+    return row;
+}
+
+// Windowed rendering for the flat activity table: every row element is
+// kept in activityRows, but only a window of blocks around the scroll
+// position is in the DOM, with spacer rows standing in for the rest
+const ACTIVITY_ROWS_IN_BLOCK = 20;
+const ACTIVITY_BLOCKS_IN_WINDOW = 4;
+let activityRows = [];
+let activityRowHeight = 0;
+let activityWindowStart = -1;
+let activityScrollFrame = null;
+
+function setActivityRows(rows) {
+    activityRows = rows;
+    activityWindowStart = -1;
+    document.getElementById('flatActivityView').scrollTop = 0;
+    renderActivityWindow();
+}
+
+function appendActivityRows(rows) {
+    for (const row of rows) activityRows.push(row);
+    activityWindowStart = -1;
+    renderActivityWindow();
+}
+
+// Add the newest rows to the top, dropping the oldest past maxRows. When the
+// whole list is in the DOM only the added and dropped rows are touched.
+function prependActivityRows(rows, maxRows) {
+    const combined = rows.concat(activityRows);
+    const dropped = combined.splice(maxRows);
+    activityRows = combined;
+
+    if (activityWindowStart === 0 && activityRows.length <= ACTIVITY_ROWS_IN_BLOCK * ACTIVITY_BLOCKS_IN_WINDOW) {
+        for (const row of dropped) row.remove();
+        document.getElementById('activityBody').prepend(...rows);
+        return;
+    }
+    activityWindowStart = -1;
+    renderActivityWindow();
+}
+
+function renderActivityWindow() {
+    const container = document.getElementById('flatActivityView');
+    const tbody = document.getElementById('activityBody');
+    const windowSize = ACTIVITY_ROWS_IN_BLOCK * ACTIVITY_BLOCKS_IN_WINDOW;
+
+    // Start one block above the visible one so small scrolls stay inside the window
+    let start = 0;
+    if (activityRowHeight && activityRows.length > windowSize) {
+        const block = Math.floor(container.scrollTop / (activityRowHeight * ACTIVITY_ROWS_IN_BLOCK));
+        start = Math.min(Math.max(0, (block - 1) * ACTIVITY_ROWS_IN_BLOCK), activityRows.length - windowSize);
+    }
+    if (start === activityWindowStart) return;
+    activityWindowStart = start;
+
+    const end = Math.min(activityRows.length, start + windowSize);
+    const fragment = document.createDocumentFragment();
+    const addSpacer = (height) => {
+        if (height <= 0) return;
+        const spacer = document.createElement('tr');
+        spacer.className = 'activity-spacer';
+        spacer.style.height = `${height}px`;
+        fragment.appendChild(spacer);
+    };
+    addSpacer(start * activityRowHeight);
+    for (let i = start; i < end; i++) fragment.appendChild(activityRows[i]);
+    addSpacer((activityRows.length - end) * activityRowHeight);
+    tbody.replaceChildren(fragment);
+
+    // Measure once, from the first real row, after the view is visible
+    if (!activityRowHeight) {
+        const row = tbody.querySelector('tr:not(.activity-spacer)');
+        if (row && row.offsetHeight) {
+            activityRowHeight = row.offsetHeight;
+            if (activityRows.length > end) {
+                activityWindowStart = -1;
+                renderActivityWindow();
+            }
+        }
+    }
+}
+
+function handleActivityScroll() {
+    if (activityScrollFrame) return;
+    activityScrollFrame = requestAnimationFrame(() => {
+        activityScrollFrame = null;
+        renderActivityWindow();
+    });
+}
+
+// Render a row of metric or status tiles from a <template> skeleton. The
+// first render, or one with a different tile count, clones a skeleton per
+// tile; every later refresh writes only the text, classes and tooltip
+// attributes that changed on the nodes already on screen, so hover state
+// and layout survive it and no markup is parsed.
+const renderedTiles = new WeakMap();
+
+function renderTiles(container, templateId, tiles) {
+    let nodes = renderedTiles.get(container);
+    if (!nodes || nodes.length !== tiles.length || nodes[0].tile.parentNode !== container) {
+        const fragment = document.createDocumentFragment();
+        nodes = tiles.map(() => {
+            const tile = fragment.appendChild(cloneTemplate(templateId));
+            const value = tile.querySelector('.metric-value, .status-value');
+            return {
+                tile,
+                label: tile.querySelector('.metric-label, label'),
+                value,
+                baseClass: value.className,
+                color: ''
+            };
+        });
+        container.replaceChildren(fragment);
+        renderedTiles.set(container, nodes);
+    }
+
+    tiles.forEach((tile, i) => {
+        const node = nodes[i];
+        const { label, value, baseClass } = node;
+        setText(label, tile.label);
+        setText(value, String(tile.value));
+        const className = tile.className ? `${baseClass} ${tile.className}` : baseClass;
+        if (value.className !== className) value.className = className;
+        setAttr(value, 'data-tooltip', tile.tooltip);
+        setAttr(value, 'data-tooltip-key', tile.tooltipKey);
+        // Compared with what was set, as style.color reads back normalized
+        const color = tile.color || '';
+        if (node.color !== color) {
+            value.style.color = color;
+            node.color = color;
+        }
+    });
+}
+
+function setText(element, text) {
+    if (element.textContent !== text) element.textContent = text;
+}
+
+function setAttr(element, name, value) {
+    if (value === undefined) {
+        element.removeAttribute(name);
+    } else if (element.getAttribute(name) !== value) {
+        element.setAttribute(name, value);
+    }
+}
+
+async function loadRecentActivity(page = 1, cursor = null) {
+    const tbody = document.getElementById('activityBody');
+    const showActivityError = () => {
+        activityRows = [];
+        activityWindowStart = -1;
+        tbody.innerHTML = '<tr><td colspan="7" style="text-align: center; color: #ff6b6b;">Error loading activity data</td></tr>';
+    };
+
+    // Only the newest load may touch the table: an SSE resync and a page
+    // click can overlap, and their rows must not interleave
+    if (activityLoad) activityLoad.abort();
+    const load = new AbortController();
+    activityLoad = load;
+    const isStale = () => activityLoad !== load;
+
+    try {
+        const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+        const response = await fetch(`/api/recent-activity/stream?page=${page}&limit=${ACTIVITY_PAGE_SIZE}${cursorParam}`,
+                                     { signal: load.signal });
+        if (!response.ok || !response.body) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+
+        // The endpoint streams NDJSON: one activity per line followed by a
+        // pagination trailer. Render each row as soon as its line arrives.
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        const now = new Date();
+        let buffer = '';
+        let pendingRows = [];
+        let decodeActivity = null;
+        let replacedRows = false;
+
+        // The previous page, and its page number, stay current until the
+        // first chunk of the new one arrives and replaces them
+        const replaceRows = (rows) => {
+            currentActivityPage = page;
+            if (page === 1) activityPageCursors.clear();
+            activityPageCursors.set(page, cursor);
+            setActivityRows(rows);
+            replacedRows = true;
+        };
+
+        const flushRows = () => {
+            if (!pendingRows.length || isStale()) return;
+            if (replacedRows) {
+                appendActivityRows(pendingRows);
+            } else {
+                replaceRows(pendingRows);
+            }
+            pendingRows = [];
+        };
+
+        const handleLine = (line) => {
+            if (!line || isStale()) return;
+            const record = JSON.parse(line);
+            if (Array.isArray(record)) {
+                pendingRows.push(renderActivityRow(decodeActivity(record), now));
+            } else if (record.columns) {
+                decodeActivity = activityRowDecoder(record.columns, record.enums);
+            } else if (record.error) {
+                console.error('Error loading recent activity:', record.error);
+                pendingRows = [];
+                replacedRows = true;
+                showActivityError();
+            } else if (record.pagination) {
+                activityPagination = record.pagination;
+                updatePagination();
+            }
+        };
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += value;
+            // Scan with a moving offset and trim the buffer once per chunk
+            let start = 0;
+            let newline;
+            while ((newline = buffer.indexOf('\n', start)) >= 0) {
+                handleLine(buffer.slice(start, newline));
+                start = newline + 1;
+            }
+            buffer = buffer.slice(start);
+            // One DOM insertion per network chunk rather than per row
+            flushRows();
+        }
+        handleLine(buffer);
+        flushRows();
+        if (!replacedRows && !isStale()) replaceRows([]);
+    } catch (error) {
+        // A newer load took over; it owns the table now
+        if (isStale()) return;
+        console.error('Error fetching recent activity:', error);
+        showActivityError();
+    } finally {
+        if (!isStale()) activityLoad = null;
+    }
+}
+
+function loadActivityPage(direction) {
+    if (isProjectView) {
+        if (!projectPagination) return;
+        let newPage = currentProjectPage;
+        if (direction === 'next' && projectPagination.has_next) {
+            newPage = currentProjectPage + 1;
+        } else if (direction === 'prev' && projectPagination.has_previous) {
+            newPage = currentProjectPage - 1;
+        }
+        if (newPage !== currentProjectPage) {
+            loadProjectGroupedActivity(newPage);
+        }
+    } else {
+        if (!activityPagination) return;
+        // Page forward from the last row's cursor; page back with the
+        // cursor that page was originally fetched with
+        if (direction === 'next' && activityPagination.has_next) {
+            loadRecentActivity(currentActivityPage + 1, activityPagination.next_cursor);
+        } else if (direction === 'prev' && activityPagination.has_previous) {
+            const newPage = currentActivityPage - 1;
+            loadRecentActivity(newPage, activityPageCursors.get(newPage) || null);
+        }
+    }
+}
+
+// Parsed API responses by URL, so paging back and forth between activity
+// pages reuses what was just fetched. Cleared by every refresh and
+// whenever the live stream reports new activity.
+const API_CACHE_TTL_MS = 30000;
+const apiCache = new Map();
+
+async function cachedJSON(url, ttl = API_CACHE_TTL_MS) {
+    const entry = apiCache.get(url);
+    if (entry && Date.now() - entry.time < ttl) {
+        return entry.data;
+    }
+    const response = await fetch(url);
+    const data = await response.json();
+    if (response.ok) {
+        apiCache.set(url, { time: Date.now(), data });
+    }
+    return data;
+}
+
+// New activity management functions
+async function loadActivityData() {
+    if (isProjectView) {
+        await loadProjectGroupedActivity();
+    } else {
+        await loadRecentActivity();
+    }
+}
+
+async function loadProjectGroupedActivity(page = 1, data) {
+    try {
+        if (!data) {
+            data = await cachedJSON(`/api/project-grouped-activity?page=${page}&limit=10`);
+        }
+
+        if (data.status === 'success') {
+            currentProjectPage = page;
+            projectPagination = data.pagination;
+
+            const container = document.getElementById('projectGroupedView');
+            const fragment = document.createDocumentFragment();
+            // Activity lists are built the first time each project is expanded
+            projectCache.clear();
+            for (const project of data.projects) {
+                projectCache.set(project.project_name, project);
+                fragment.appendChild(renderProjectCard(project));
+            }
+            container.replaceChildren(fragment);
+
+            updatePagination();
+        } else {
+            console.error('Error loading project activity:', data.error);
+            const container = document.getElementById('projectGroupedView');
+            container.innerHTML = '<div style="text-align: center; color: #ff6b6b; padding: 20px;">Error loading project activity data</div>';
+        }
+    } catch (error) {
+        console.error('Error fetching project activity:', error);
+        const container = document.getElementById('projectGroupedView');
+        container.innerHTML = '<div style="text-align: center; color: #ff6b6b; padding: 20px;">Error loading project activity data</div>';
+    }
+}
+
+function renderProjectCard(project) {
+    const name = project.project_name;
+    const card = cloneTemplate('projectCardTpl');
+    card.querySelector('.project-header').addEventListener('click', () => toggleProject(name));
+    card.querySelector('.project-name').textContent = name;
+    card.querySelector('.project-totals').textContent = [
+        `${project.session_count} sessions`,
+        `${project.total_handoffs} handoffs`,
+        `${project.total_subagents} subagents`,
+        `${project.success_rate}% success`,
+        `$${project.total_cost} total cost`
+    ].join(' • ');
+    card.querySelector('.project-dates').textContent = formatDateRange(project.earliest_session, project.latest_session);
+    card.querySelector('.project-expand-icon').id = `icon-${name}`;
+    card.querySelector('.project-activities').id = `activities-${name}`;
+    return card;
+}
+
+function renderProjectActivities(project) {
+    const fragment = document.createDocumentFragment();
+
+    const addGroup = (title, items, kind, metaFor) => {
+        if (!items || items.length === 0) return;
+        const group = cloneTemplate('activityGroupTpl');
+        group.firstElementChild.textContent = `${title} (${items.length})`;
+        for (const activity of items) {
+            const item = cloneTemplate('activityItemTpl');
+            item.classList.add(kind);
+            item.querySelector('.activity-meta').textContent = [
+                formatTimestamp(activity.timestamp),
+                `Session: ${activity.session_id?.substring(0, 8)}`,
+                ...metaFor(activity)
+            ].join(' • ');
+            item.querySelector('.activity-description').textContent = activity.task_description ?? '';
+            const badge = item.querySelector('.activity-badge');
+            if (activity.status) badge.classList.add(activity.status);
+            badge.textContent = activity.status ?? '';
+            item.querySelector('.activity-cost').textContent = money(activity.cost, 3);
+            group.appendChild(item);
+        }
+        fragment.appendChild(group);
+    };
+
+    addGroup('Model Handoffs', project.handoffs, 'handoff',
+        handoff => [`Confidence: ${fmt(handoff.confidence_score, 2)}`]);
+    addGroup('Subagent Invocations', project.subagents, 'subagent',
+        subagent => [`Agent: ${subagent.agent_name}`,
+                     ...(subagent.execution_time ? [`${fmt(subagent.execution_time, 1)}s`] : [])]);
+
+    if (!fragment.hasChildNodes()) {
+        const empty = document.createElement('div');
+        empty.style.cssText = 'text-align: center; color: #718096; padding: 20px;';
+        empty.textContent = 'No handoffs or subagent activities found for this project.';
+        fragment.appendChild(empty);
+    }
+
+    return fragment;
+}
+
+function formatDateRange(earliest, latest) {
+    const early = formatDate(earliest);
+    const late = formatDate(latest);
+
+    if (early === late) {
+        return early;
+    } else {
+        return `${early} - ${late}`;
+    }
+}
+
+// Projects on the current page whose activity list has not been built yet
+const projectCache = new Map();
+
+function toggleProject(projectName) {
+    const activities = document.getElementById(`activities-${projectName}`);
+    const icon = document.getElementById(`icon-${projectName}`);
+    const header = activities.previousElementSibling;
+
+    // Build once on first expand; the nodes stay in place for re-expands
+    const project = projectCache.get(projectName);
+    if (project) {
+        activities.replaceChildren(renderProjectActivities(project));
+        projectCache.delete(projectName);
+    }
+
+    if (activities.classList.contains('expanded')) {
+        activities.classList.remove('expanded');
+        icon.classList.remove('expanded');
+        header.classList.remove('expanded');
+    } else {
+        activities.classList.add('expanded');
+        icon.classList.add('expanded');
+        header.classList.add('expanded');
+    }
+}
+
+function toggleActivityView() {
+    const toggleBtn = document.getElementById('toggleViewBtn');
+    const projectView = document.getElementById('projectGroupedView');
+    const flatView = document.getElementById('flatActivityView');
+
+    if (isProjectView) {
+        // Switch to flat view
+        projectView.style.display = 'none';
+        flatView.style.display = 'block';
+        toggleBtn.textContent = 'Switch to Project View';
+        isProjectView = false;
+        loadRecentActivity(1);
+    } else {
+        // Switch to project view
+        flatView.style.display = 'none';
+        projectView.style.display = 'block';
+        toggleBtn.textContent = 'Switch to Flat View';
+        isProjectView = true;
+        loadProjectGroupedActivity(1);
+    }
+}
+
+// Show the active view's pagination in the shared controls
+function updatePagination() {
+    if (isProjectView) {
+        updatePager(projectPagination, currentProjectPage, 10, 'projects');
+    } else {
+        updatePager(activityPagination, currentActivityPage, ACTIVITY_PAGE_SIZE, 'activities');
+    }
+}
+
+function updatePager(pagination, page, pageSize, noun) {
+    if (!pagination) return;
+    const start = ((page - 1) * pageSize) + 1;
+    const end = Math.min(page * pageSize, pagination.total_count);
+    applyPaginationState(
+        `Showing ${start}-${end} of ${pagination.total_count} ${noun}`,
+        `Page ${page} of ${pagination.total_pages}`,
+        !pagination.has_previous,
+        !pagination.has_next
+    );
+}
+
+// Both views share the pagination controls; remember what they show and
+// only touch the DOM for values that changed since the last refresh
+const lastPaginationState = { info: null, page: null, prevDisabled: null, nextDisabled: null };
+
+function applyPaginationState(info, page, prevDisabled, nextDisabled) {
+    if (info !== lastPaginationState.info) {
+        document.getElementById('paginationInfo').textContent = info;
+        lastPaginationState.info = info;
+    }
+    if (page !== lastPaginationState.page) {
+        document.getElementById('pageInfo').textContent = page;
+        lastPaginationState.page = page;
+    }
+    if (prevDisabled !== lastPaginationState.prevDisabled) {
+        document.getElementById('prevBtn').disabled = prevDisabled;
+        lastPaginationState.prevDisabled = prevDisabled;
+    }
+    if (nextDisabled !== lastPaginationState.nextDisabled) {
+        document.getElementById('nextBtn').disabled = nextDisabled;
+        lastPaginationState.nextDisabled = nextDisabled;
+    }
+}
+
+// Charts are only created once their canvas scrolls into view; until
+// then the latest data for each is parked here, keyed by canvas id
+const pendingCharts = new Map();
+const chartObserver = 'IntersectionObserver' in window
+    ? new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+            if (!entry.isIntersecting) continue;
+            chartObserver.unobserve(entry.target);
+            const pending = pendingCharts.get(entry.target.id);
+            pendingCharts.delete(entry.target.id);
+            if (pending) createChart(...pending);
+        }
+    }, { rootMargin: '200px' })
+    : null;
+
+function createChart(key, canvasId, labels, series, buildConfig) {
+    const config = buildConfig();
+    config.data.labels = labels;
+    series.forEach((values, i) => {
+        config.data.datasets[i].data = values;
+    });
+    const ctx = document.getElementById(canvasId).getContext('2d');
+    charts[key] = new Chart(ctx, config);
+}
+
+// Create a chart on first use from buildConfig(), so its options are only
+// built once; afterwards swap the labels and dataset values in place and
+// redraw without animation, or skip the redraw if nothing changed
+function renderChart(key, canvasId, labels, series, buildConfig) {
+    const chart = charts[key];
+    if (!chart) {
+        if (!chartObserver) {
+            createChart(key, canvasId, labels, series, buildConfig);
+            return;
+        }
+        if (!pendingCharts.has(canvasId)) {
+            chartObserver.observe(document.getElementById(canvasId));
+        }
+        pendingCharts.set(canvasId, [key, canvasId, labels, series, buildConfig]);
+        return;
+    }
+
+    if (sameValues(chart.data.labels, labels) &&
+            series.every((values, i) => sameValues(chart.data.datasets[i].data, values))) {
+        return;
+    }
+
+    chart.data.labels = labels;
+    series.forEach((values, i) => {
+        chart.data.datasets[i].data = values;
+    });
+    chart.update('none');
+}
+
+function sameValues(a, b) {
+    if (a.length !== b.length) return false;
+    for (let i = 0; i < a.length; i++) {
+        if (a[i] !== b[i]) return false;
+    }
+    return true;
+}
+
+function updateHandoffChart(data) {
+    renderChart('handoff', 'handoffChart', ['DeepSeek', 'Claude'],
+        [[data.deepseek_handoffs || 0, data.claude_handoffs || 0]], handoffChartConfig);
+}
+
+function handoffChartConfig() {
+    return {
+        type: 'doughnut',
+        data: {
+            datasets: [{
+                backgroundColor: ['#22c55e', '#3b82f6'],
+                borderWidth: 0
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    position: 'bottom'
+                }
+            }
+        }
+    };
+}
+
+function updateSubagentChart(data) {
+    const agents = data.usage_statistics?.slice(0, 5) || [];
+
+    renderChart('subagent', 'subagentChart',
+        agents.map(a => a.agent_name?.replace(/-/g, ' ') || 'Unknown'),
+        [agents.map(a => a.invocation_count || 0)], subagentChartConfig);
+}
+
+function subagentChartConfig() {
+    return {
+        type: 'bar',
+        data: {
+            datasets: [{
+                label: 'Invocations',
+                backgroundColor: '#667eea',
+                borderColor: '#764ba2',
+                borderWidth: 1
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            scales: {
+                y: {
+                    beginAtZero: true
+                }
+            },
+            plugins: {
+                legend: {
+                    display: false
+                }
+            }
+        }
+    };
+}
+
+function updateCostChart(data) {
+    const daily = data.daily_data || [];
+
+    renderChart('cost', 'costChart',
+        daily.map(d => formatDate(d.date)),
+        [daily.map(d => d.cost), daily.map(d => d.savings)], costChartConfig);
+}
+
+function costChartConfig() {
+    return {
+        type: 'line',
+        data: {
+            datasets: [{
+                label: 'Cost',
+                borderColor: '#ef4444',
+                backgroundColor: 'rgba(239, 68, 68, 0.1)',
+                fill: true
+            }, {
+                label: 'Savings',
+                borderColor: '#22c55e',
+                backgroundColor: 'rgba(34, 197, 94, 0.1)',
+                fill: true
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            scales: {
+                y: {
+                    beginAtZero: true
+                }
+            }
+        }
+    };
+}
+
+function toggleAutoRefresh() {
+    const toggle = document.getElementById('autoRefreshToggle');
+    const indicator = document.getElementById('liveIndicator');
+
+    isAutoRefresh = !isAutoRefresh;
+
+    if (isAutoRefresh) {
+        toggle.classList.add('active');
+        indicator.style.display = 'inline-block';
+        startAutoRefresh();
+    } else {
+        toggle.classList.remove('active');
+        indicator.style.display = 'none';
+        stopAutoRefresh();
+        if (pausedUpdates) {
+            pausedUpdates.polling = false;
+        }
+    }
+}
+
+// Restart the pulse after a refresh. It is cosmetic, so it waits for idle
+// time, and the restart spans two frames so the reset is actually painted
+async function updateLiveIndicator() {
+    if (!isAutoRefresh) return;
+    await whenIdle();
+    const indicator = document.getElementById('liveIndicator');
+    indicator.style.animation = 'none';
+    await nextFrame();
+    await nextFrame();
+    indicator.style.animation = 'pulse 2s infinite';
+}
@@ -7,6 +7,7 @@ Tracks and analyzes handoffs between Claude Code and DeepSeek local model
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass
@@ -32,10 +33,17 @@ class DeepSeekClient:
         self.api_url = f"{base_url}/v1"
         self.model_name = "deepseek-r1"
 
+        # Health probes run on every dashboard refresh, from several worker
+        # threads; a pooled session reuses keep-alive connections between them
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def is_available(self) -> bool:
         """Check if DeepSeek is running and available"""
         try:
-            response = requests.get(f"{self.api_url}/models", timeout=2)
+            response = self.session.get(f"{self.api_url}/models", timeout=2)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
@@ -44,7 +52,7 @@ class DeepSeekClient:
         """Get detailed health status of DeepSeek"""
         try:
             start_time = time.time()
-            response = requests.get(f"{self.api_url}/models", timeout=5)
+            response = self.session.get(f"{self.api_url}/models", timeout=5)
             response_time = time.time() - start_time
 
             if response.status_code == 200:
@@ -5,6 +5,7 @@ Monitors specialized agent invocations and performance patterns
 """
 
 import time
+import heapq
 import json
 import re
 from typing import Dict, List, Optional, Any, Set
@@ -319,16 +320,16 @@ class SubagentTracker:
 
         total_invocations = sum(stat['invocation_count'] for stat in usage_stats)
 
-        # Most used agents
-        most_used = sorted(usage_stats, key=lambda x: x['invocation_count'], reverse=True)[:5]
+        # Most used agents (get_subagent_usage already orders by invocation_count DESC)
+        most_used = usage_stats[:5]
 
         # Performance analysis
-        fastest_agents = sorted([s for s in usage_stats if s['avg_execution_time']],
-                               key=lambda x: x['avg_execution_time'])[:3]
+        fastest_agents = heapq.nsmallest(3, (s for s in usage_stats if s['avg_execution_time']),
+                                         key=lambda x: x['avg_execution_time'])
 
         # Success rate analysis
-        most_reliable = sorted([s for s in usage_stats if s['success_rate']],
-                              key=lambda x: x['success_rate'], reverse=True)[:3]
+        most_reliable = heapq.nlargest(3, (s for s in usage_stats if s['success_rate']),
+                                       key=lambda x: x['success_rate'])
 
         return {
             'total_invocations': total_invocations,
@@ -381,10 +382,13 @@ class SubagentTracker:
     def _assess_agent_health(self, usage_stats: List[Dict]) -> Dict[str, str]:
         """Assess health status of each agent type"""
         health = {}
+        # First row per agent name wins, matching the usage ordering
+        stats_by_name = {}
+        for stat in usage_stats:
+            stats_by_name.setdefault(stat['agent_name'], stat)
 
         for agent_name in self.available_agents.keys():
-            # Find stats for this agent
-            agent_stats = next((s for s in usage_stats if s['agent_name'] == agent_name), None)
+            agent_stats = stats_by_name.get(agent_name)
 
             if not agent_stats:
                 health[agent_name] = 'unused'